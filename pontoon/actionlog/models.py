@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 
@@ -94,6 +94,29 @@ class ActionLog(models.Model):
 
     objects = ActionLogQuerySet.as_manager()
 
+    def _has_relation(self, name):
+        """
+        Check if a foreign key is set, without fetching the related object.
+        The related object may not be saved yet, as in bulk-created actions.
+        """
+        field = self._meta.get_field(name)
+        return (
+            getattr(self, field.attname) is not None
+            or field.get_cached_value(self, default=None) is not None
+        )
+
+    @property
+    def has_translation(self):
+        return self._has_relation("translation")
+
+    @property
+    def has_entity(self):
+        return self._has_relation("entity")
+
+    @property
+    def has_locale(self):
+        return self._has_relation("locale")
+
     def validate_action_type_choice(self):
         valid_types = self.ActionType.values
         if self.action_type not in valid_types:
@@ -121,15 +144,15 @@ class ActionLog(models.Model):
             self.ActionType.TRANSLATION_DELETED,
             self.ActionType.TM_ENTRY_DELETED,
         ):
-            if self.translation or not self.entity or not self.locale:
+            if self.has_translation or not self.has_entity or not self.has_locale:
                 raise ValidationError(
                     f'For action type "{self.action_type}", only `entity` and `locale` are accepted'
                 )
 
         elif self.action_type == self.ActionType.COMMENT_ADDED:
             if not (
-                (self.translation and not self.locale and not self.entity)
-                or (not self.translation and self.locale and self.entity)
+                (self.has_translation and not self.has_locale and not self.has_entity)
+                or (not self.has_translation and self.has_locale and self.has_entity)
             ):
                 raise ValidationError(
                     f'For action type "{self.action_type}", either `translation` or `entity` and `locale` are accepted'
@@ -142,7 +165,7 @@ class ActionLog(models.Model):
             self.ActionType.TRANSLATION_REJECTED,
             self.ActionType.TRANSLATION_UNREJECTED,
         ):
-            if not self.translation or self.entity or self.locale:
+            if not self.has_translation or self.has_entity or self.has_locale:
                 raise ValidationError(
                     f'For action type "{self.action_type}", only `translation` is accepted'
                 )
@@ -151,26 +174,49 @@ class ActionLog(models.Model):
             self.ActionType.TM_ENTRIES_EDITED,
             self.ActionType.TM_ENTRIES_UPLOADED,
         ):
-            if self.translation or self.entity or self.locale:
+            if self.has_translation or self.has_entity or self.has_locale:
                 raise ValidationError(
                     f'For action type "{self.action_type}", only `tm_entries` is accepted'
                 )
 
-    def validate_many_to_many_relationships_per_action(self):
+    def validate_many_to_many_relationships_per_action(self, tm_entries=None):
+        """
+        :arg list tm_entries: The TM entries of an action that is not saved yet,
+            instead of the stored ones.
+        """
         if self.action_type in (
             self.ActionType.TM_ENTRIES_EDITED,
             self.ActionType.TM_ENTRIES_UPLOADED,
         ):
-            if not self.tm_entries or self.translation or self.entity or self.locale:
+            if tm_entries is None:
+                tm_entries = self.tm_entries
+            if (
+                not tm_entries
+                or self.has_translation
+                or self.has_entity
+                or self.has_locale
+            ):
                 raise ValidationError(
                     f'For action type "{self.action_type}", only `tm_entries` is accepted'
                 )
 
-    def save(self, *args, **kwargs):
+    def validate(self):
+        """
+        Validate the action before it is saved. Doesn't query the database.
+        """
         self.validate_action_type_choice()
         self.validate_implicit_action_type_choice()
         self.validate_foreign_keys_per_action()
 
-        super().save(*args, **kwargs)
+    def save(self, *args, **kwargs):
+        from pontoon.base.badge_utils import update_badge_counts
+
+        self.validate()
+
+        adding = self._state.adding
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            if adding:
+                update_badge_counts([self])
 
         self.validate_many_to_many_relationships_per_action()
@@ -4,6 +4,7 @@ from django.core.exceptions import ValidationError
 
 from pontoon.actionlog import utils
 from pontoon.actionlog.models import ActionLog
+from pontoon.base.badge_utils import badges_translation_count
 from pontoon.test.factories import TranslationMemoryFactory
 
 
@@ -159,3 +160,118 @@ def test_log_action_valid_with_tm_entries_edited(user_a, entity_a, locale_a):
     )
     assert len(log) == 1
     assert log[0].action_type == ActionLog.ActionType.TM_ENTRIES_EDITED
+
+
+@pytest.mark.django_db
+def test_buffered_actions(
+    user_a, translation_a, entity_a, locale_a, django_assert_num_queries
+):
+    tm_entry = TranslationMemoryFactory.create(
+        entity=entity_a,
+        source=entity_a.string,
+        target="tm_translation",
+        locale=locale_a,
+    )
+
+    # Actions, badge counters and TM entries are saved with a query each
+    # when the block exits
+    with django_assert_num_queries(3):
+        with utils.buffered_actions():
+            utils.log_action(
+                ActionLog.ActionType.TRANSLATION_CREATED,
+                user_a,
+                translation=translation_a,
+            )
+            with utils.buffered_actions():
+                utils.log_action(
+                    ActionLog.ActionType.TM_ENTRIES_EDITED,
+                    user_a,
+                    tm_entries=[tm_entry],
+                )
+            assert not ActionLog.objects.exists()
+
+    assert list(
+        ActionLog.objects.order_by("pk").values_list("action_type", "tm_entries")
+    ) == [
+        (ActionLog.ActionType.TRANSLATION_CREATED, None),
+        (ActionLog.ActionType.TM_ENTRIES_EDITED, tm_entry.pk),
+    ]
+
+
+@pytest.mark.django_db
+def test_buffered_actions_error(user_a, translation_a):
+    # Invalid actions are rejected when they are logged
+    with pytest.raises(ValidationError):
+        with utils.buffered_actions():
+            utils.log_action(
+                ActionLog.ActionType.TRANSLATION_CREATED,
+                user_a,
+                translation=translation_a,
+            )
+            utils.log_action(ActionLog.ActionType.TRANSLATION_DELETED, user_a)
+
+    assert not ActionLog.objects.exists()
+
+
+@pytest.mark.django_db
+def test_buffered_actions_tm_entries(user_a):
+    # Actions on TM entries are rejected without them, even when buffered
+    with pytest.raises(ValidationError):
+        with utils.buffered_actions():
+            utils.log_action(ActionLog.ActionType.TM_ENTRIES_EDITED, user_a)
+
+    assert not ActionLog.objects.exists()
+
+
+@pytest.mark.django_db
+def test_atomic_with_actions(user_a, translation_a, django_capture_on_commit_callbacks):
+    @utils.atomic_with_actions
+    def view(fail=False):
+        utils.log_action(
+            ActionLog.ActionType.TRANSLATION_CREATED,
+            user_a,
+            translation=translation_a,
+        )
+        # Badge counters include the actions that are not saved yet
+        assert badges_translation_count(user_a) == 1
+        if fail:
+            raise ValueError()
+
+    # Actions are not saved if the transaction is rolled back
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(ValueError):
+            view(fail=True)
+    assert callbacks == []
+
+    # Actions are saved once the transaction is committed
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        view()
+        assert not ActionLog.objects.exists()
+    assert len(callbacks) == 1
+    assert ActionLog.objects.get().action_type == (
+        ActionLog.ActionType.TRANSLATION_CREATED
+    )
+    assert badges_translation_count(user_a) == 1
+
+
+@pytest.mark.django_db
+def test_save_actions(user_a, translation_a, django_assert_num_queries):
+    actions = [
+        ActionLog(
+            action_type=ActionLog.ActionType.TRANSLATION_APPROVED,
+            performed_by=user_a,
+            translation=translation_a,
+        )
+        for _ in range(5)
+    ]
+
+    # Three batches of actions, and the badge counter of their user
+    with django_assert_num_queries(4):
+        utils.save_actions(actions, batch_size=2)
+
+    assert ActionLog.objects.count() == 5
+    user_a.profile.refresh_from_db()
+    assert user_a.profile.badges_review_count == 5
+
+    with pytest.raises(ValidationError):
+        utils.save_actions([ActionLog(action_type="test:unknown")])
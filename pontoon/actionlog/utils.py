@@ -1,6 +1,16 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import transaction
+
 from pontoon.actionlog.models import ActionLog
 
 
+# Actions logged within `buffered_actions()`, with their TM entries
+_buffer: ContextVar[list | None] = ContextVar("actionlog_buffer", default=None)
+
+
 def log_action(
     action_type,
     user,
@@ -12,6 +22,9 @@ def log_action(
 ):
     """Save a new action in the database.
 
+    Within `buffered_actions()`, the action is saved with the other actions
+    of the block.
+
     :arg string action_type:
         The type of action that was performed.
         See models.ActionLog.ActionType for choices.
@@ -35,7 +48,97 @@ def log_action(
         locale=locale,
         is_implicit_action=is_implicit_action,
     )
-    action.save()
+    action.validate()
+    action.validate_many_to_many_relationships_per_action(tm_entries)
+
+    buffer = _buffer.get()
+    if buffer is not None:
+        buffer.append((action, tm_entries))
+        return
+
+    save_actions([action], validate=False)
 
     if tm_entries:
         action.tm_entries.set(tm_entries)
+
+
+def pending_actions():
+    """The actions logged within `buffered_actions()` that are not saved yet."""
+    return [action for action, _ in _buffer.get() or ()]
+
+
+@contextmanager
+def buffered_actions(on_commit=False):
+    """
+    Collect the actions logged with `log_action()` within the block,
+    and save them with a single query if the block exits without an error.
+
+    Nested blocks share the buffer of the outermost one.
+
+    :arg bool on_commit: Save the actions once the current transaction
+        is committed rather than when the block exits.
+    """
+    if _buffer.get() is not None:
+        yield
+        return
+
+    buffer = []
+    token = _buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+
+    if on_commit:
+        transaction.on_commit(lambda: _save_buffer(buffer))
+    else:
+        _save_buffer(buffer)
+
+
+def atomic_with_actions(view):
+    """
+    Run a view in a transaction like `transaction.atomic`, and save
+    the actions logged by the request with a single query once it is committed.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with transaction.atomic(), buffered_actions(on_commit=True):
+            return view(*args, **kwargs)
+
+    return wrapper
+
+
+def _save_buffer(buffer):
+    """Save the actions of a buffer, already validated by `log_action()`."""
+    save_actions([action for action, _ in buffer], validate=False)
+
+    ActionLogTMEntry = ActionLog.tm_entries.through
+    ActionLogTMEntry.objects.bulk_create(
+        ActionLogTMEntry(actionlog=action, translationmemoryentry=entry)
+        for action, tm_entries in buffer
+        for entry in tm_entries or ()
+    )
+
+
+def save_actions(actions, batch_size=None, validate=True):
+    """
+    Validate and save many actions, with one query per `batch_size` actions,
+    and add them to the badge counters of their users.
+
+    :arg list[ActionLog] actions: Actions to save.
+    :arg int batch_size: Maximum number of actions saved with a single query.
+    :arg bool validate: Validate the actions, unless they already are.
+    """
+    from pontoon.base.badge_utils import update_badge_counts
+
+    if not actions:
+        return
+
+    if validate:
+        for action in actions:
+            action.validate()
+
+    with transaction.atomic(savepoint=False):
+        ActionLog.objects.bulk_create(actions, batch_size=batch_size)
+        update_badge_counts(actions)
@@ -1,7 +1,55 @@
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from pontoon.base.get_entities import decode_entity_cursor, get_entities_page
 
 
 class DynamicPageNumberPagination(PageNumberPagination):
     page_size = 100
     page_size_query_param = "page_size"
     max_page_size = 1000
+
+
+class EntityCursorPagination(DynamicPageNumberPagination):
+    """
+    Keyset pagination for entity lists, if a `cursor` query parameter is given.
+    An empty `cursor` requests the first page.
+
+    Unlike page number pagination, this does not include a total `count`.
+    """
+
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.next_cursor = None
+        self.use_cursor = self.cursor_query_param in request.query_params
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        cursor = request.query_params[self.cursor_query_param]
+        try:
+            after = decode_entity_cursor(cursor) if cursor else None
+            page, self.next_cursor = get_entities_page(
+                queryset, after, self.get_page_size(request)
+            )
+        except ValueError as error:
+            raise ValidationError({self.cursor_query_param: [str(error)]})
+        return list(page)
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+        return Response(
+            {"next": self.get_next_link(), "previous": None, "results": data}
+        )
@@ -1616,6 +1616,26 @@ def test_entity_search(django_assert_num_queries):
         },
     ]
 
+    # Test keyset pagination
+    url = f"/api/v2/search/translations/?text=Flibbertigibbet&locale={locale_a.code}"
+    response = APIClient().get(url, HTTP_ACCEPT="application/json")
+    all_ids = [result["id"] for result in response.data["results"]]
+    assert len(all_ids) > 2
+
+    cursor_ids = []
+    next_url = f"{url}&page_size=2&cursor="
+    while next_url:
+        response = APIClient().get(next_url, HTTP_ACCEPT="application/json")
+        assert response.status_code == 200
+        assert "count" not in response.data
+        assert len(response.data["results"]) <= 2
+        cursor_ids.extend(result["id"] for result in response.data["results"])
+        next_url = response.data["next"]
+    assert cursor_ids == all_ids
+
+    response = APIClient().get(f"{url}&cursor=invalid", HTTP_ACCEPT="application/json")
+    assert response.status_code == 400
+
 
 @pytest.mark.django_db
 def test_pretranslation_group_authentication(member):
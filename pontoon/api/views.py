@@ -8,6 +8,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import Prefetch, Q
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
@@ -19,8 +20,7 @@ from pontoon.api.authentication import (
     PersonalAccessTokenAuthentication,
 )
 from pontoon.api.filters import TermFilter, TranslationMemoryFilter
-from pontoon.base import forms
-from pontoon.base.get_entities import get_entities_for_project_locale
+from pontoon.api.pagination import EntityCursorPagination
 from pontoon.base.models import (
     Entity,
     Locale,
@@ -29,10 +29,11 @@ from pontoon.base.models import (
     ProjectLocale,
     ProjectSlugHistory,
     Resource,
-    Translation,
     TranslationMemoryEntry,
 )
+from pontoon.base.utils import parse_bool
 from pontoon.pretranslation.pretranslate import get_pretranslation
+from pontoon.search.utils import search_translations, visible_entities
 from pontoon.settings.base import PRETRANSLATION_API_MAX_CHARS
 from pontoon.terminology.models import (
     Term,
@@ -335,24 +336,11 @@ class EntityIndividualView(RequestFieldsMixin, generics.RetrieveAPIView):
     serializer_class = NestedEntitySerializer
 
     def get_queryset(self):
-        visible_projects = Project.objects.visible().visible_for(self.request.user)
-        qs = Entity.objects.filter(
-            resource__project__in=visible_projects,
-        )
-
         requested = self.request_fields()
-
-        if not requested or "translations" in requested:
-            qs = qs.prefetch_related(
-                Prefetch(
-                    "translation_set",
-                    queryset=Translation.objects.filter(approved=True)
-                    .select_related("locale")
-                    .order_by("locale__code"),
-                    to_attr="filtered_translations",
-                )
-            )
-        return qs
+        return visible_entities(
+            self.request.user,
+            with_translations=not requested or "translations" in requested,
+        )
 
     def get_object(self):
         queryset = self.get_queryset()
@@ -472,19 +460,13 @@ class TranslationMemorySearchListView(generics.ListAPIView):
 
 class TranslationSearchListView(RequestFieldsMixin, generics.ListAPIView):
     serializer_class = EntitySearchSerializer
+    pagination_class = EntityCursorPagination
 
     def get_queryset(self):
-        query_params = self.request.query_params.copy()
+        query_params = self.request.query_params
         text = query_params.get("text")
         locale = query_params.get("locale")
 
-        if query_params.get("search_identifiers", "").lower() != "true":
-            query_params.pop("search_identifiers", None)
-        if query_params.get("search_match_case", "").lower() != "true":
-            query_params.pop("search_match_case", None)
-        if query_params.get("search_match_whole_word", "").lower() != "true":
-            query_params.pop("search_match_whole_word", None)
-
         errors = {}
         if not text:
             errors["text"] = ["This field is required."]
@@ -493,59 +475,24 @@ class TranslationSearchListView(RequestFieldsMixin, generics.ListAPIView):
         if errors:
             raise ValidationError(errors)
 
-        query_params["search"] = query_params.pop("text")[0]
-        query_params["project"] = query_params.get("project", "all-projects")
-
-        form = forms.GetEntitiesForm(query_params)
-
-        if not form.is_valid():
-            raise ValidationError(form.errors)
-
-        locale_code = form.cleaned_data["locale"]
-        locale = get_object_or_404(Locale, code=locale_code)
-
-        project_slug = form.cleaned_data["project"]
-
-        if project_slug == "all-projects":
-            project = Project(slug="all-projects")
-        else:
-            project = get_object_or_404(Project, slug=project_slug)
-
-        restrict_to_keys = (
-            "search",
-            "search_identifiers",
-            "search_match_case",
-            "search_match_whole_word",
-        )
-        form_data = {
-            k: form.cleaned_data[k] for k in restrict_to_keys if k in form.cleaned_data
-        }
+        requested = self.request_fields()
 
         try:
-            qs = get_entities_for_project_locale(
-                self.request.user, project, locale, status="translated", **form_data
-            ).select_related("resource__project")
-
-            requested = self.request_fields()
-
-            # Only prefetch translation_text when requested
-            if not requested or "translation" in requested:
-                qs = qs.prefetch_related(
-                    (
-                        Prefetch(
-                            "translation_set",
-                            queryset=(
-                                Translation.objects.filter(locale=locale, approved=True)
-                            ).select_related("locale"),
-                            to_attr="active_translations",
-                        )
-                    ),
-                )
-
-        except ValueError as error:
-            raise ValueError(error)
-
-        return qs
+            return search_translations(
+                self.request.user,
+                locale,
+                query_params.get("project"),
+                text,
+                search_identifiers=parse_bool(query_params.get("search_identifiers")),
+                search_match_case=parse_bool(query_params.get("search_match_case")),
+                search_match_whole_word=parse_bool(
+                    query_params.get("search_match_whole_word")
+                ),
+                # Only prefetch translation_text when requested
+                with_translations=not requested or "translation" in requested,
+            )
+        except DjangoValidationError as error:
+            raise ValidationError(error.message_dict)
 
 
 class PretranslationView(APIView):
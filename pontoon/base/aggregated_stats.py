@@ -1,4 +1,100 @@
+from collections.abc import Callable, Iterable
 from functools import cached_property
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+STATS_VERSION_KEY = "aggregated_stats_version"
+
+
+def invalidate_stats(pairs: Iterable[tuple[int, int]] | None = None) -> None:
+    """
+    Discard the cached aggregated stats of the given `(project_id, locale_id)` pairs,
+    along with those of their projects and locales.
+    Without `pairs`, discard the cached stats of all projects and locales.
+
+    Called whenever the stats of translated resources change.
+    The versions are only bumped once the current transaction is committed,
+    so that stats read before then are not cached under the new versions.
+    """
+    if pairs is None:
+        keys = {STATS_VERSION_KEY}
+    else:
+        keys = set()
+        for project_id, locale_id in pairs:
+            keys.add(f"{STATS_VERSION_KEY}:project:{project_id}")
+            keys.add(f"{STATS_VERSION_KEY}:locale:{locale_id}")
+    if keys:
+        transaction.on_commit(
+            lambda: cache.set_many({key: uuid4().hex for key in keys}, None)
+        )
+
+
+def get_stats_versions(scopes: Iterable[str]) -> dict[str, str]:
+    """
+    Current stats versions of the given scopes, such as `"project:1"`,
+    along with the version of all stats as `""`.
+    """
+    keys = {
+        scope: f"{STATS_VERSION_KEY}:{scope}" if scope else STATS_VERSION_KEY
+        for scope in ["", *scopes]
+    }
+    versions = cache.get_many(keys.values())
+    for key in keys.values():
+        if key not in versions:
+            version = uuid4().hex
+            if not cache.add(key, version, None):
+                version = cache.get(key, version)
+            versions[key] = version
+    return {scope: versions[key] for scope, key in keys.items()}
+
+
+def cached_stats[K, T](
+    name: str,
+    scopes: dict[K, list[str]],
+    calculate: Callable[[list[K]], dict[K, T]],
+    default: T,
+) -> dict[K, T]:
+    """
+    Get the aggregated stats of each item from the cache, or calculate and cache them.
+
+    `scopes` maps each item to the projects and locales that its stats depend on,
+    such as `["project:1", "locale:2"]`. The cache keys include the current
+    stats versions of these, so the stats are recalculated after
+    `invalidate_stats()` is called for any of them.
+
+    `calculate` is called with the items that are not cached,
+    and `default` is cached for any items missing from its result.
+    """
+    versions = get_stats_versions({scope for sc in scopes.values() for scope in sc})
+    keys = {
+        item: ":".join(
+            [
+                "aggregated_stats",
+                name,
+                str(item),
+                versions[""],
+                *(versions[scope] for scope in item_scopes),
+            ]
+        )
+        for item, item_scopes in scopes.items()
+    }
+    cached = cache.get_many(keys.values())
+    stats = {item: cached[key] for item, key in keys.items() if key in cached}
+
+    missing = [item for item in keys if item not in stats]
+    if missing:
+        calculated = calculate(missing)
+        for item in missing:
+            stats[item] = calculated.get(item, default)
+        cache.set_many(
+            {keys[item]: stats[item] for item in missing},
+            settings.STATS_CACHE_TIMEOUT,
+        )
+    return stats
 
 
 class AggregatedStats:
@@ -9,11 +105,27 @@ class AggregatedStats:
     Should include any filters leaving out disabled or system projects.
     """
 
+    aggregated_stats_scopes: list[str]
+    """
+    Must be set by the child class as the scopes of `cached_stats()`,
+    such as `["project:1"]`.
+    """
+
     @cached_property
     def _stats(self) -> dict[str, int]:
-        return self.aggregated_stats_query.string_stats(
-            count_disabled=True, count_system_projects=True
-        )
+        def calculate():
+            return self.aggregated_stats_query.string_stats(
+                count_disabled=True, count_system_projects=True
+            )
+
+        if self.pk is None:
+            return calculate()
+        return cached_stats(
+            self._meta.model_name,
+            {self.pk: self.aggregated_stats_scopes},
+            lambda _: {self.pk: calculate()},
+            {},
+        )[self.pk]
 
     @property
     def total_strings(self) -> int:
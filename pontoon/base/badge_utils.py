@@ -1,30 +1,113 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.db.models import Exists, OuterRef
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from pontoon.actionlog.models import ActionLog
+from pontoon.actionlog.utils import pending_actions
 from pontoon.base.models.permission_changelog import PermissionChangelog
+from pontoon.base.models.user_profile import UserProfile
+
+
+def _translation_actions() -> Q:
+    return Q(action_type="translation:created")
+
+
+def _review_actions() -> Q:
+    return Q(
+        action_type__in={"translation:approved", "translation:rejected"},
+        is_implicit_action=False,
+    )
+
+
+def badge_count_field(action: ActionLog) -> str | None:
+    """
+    Return the name of the badge counter of `UserProfile` that an action
+    counts towards, if any. Must match `_translation_actions()` and
+    `_review_actions()`.
+    """
+    if action.performed_by_id is None or action.created_at < settings.BADGES_START_DATE:
+        return None
+    if action.action_type == "translation:created":
+        return "badges_translation_count"
+    if (
+        action.action_type in {"translation:approved", "translation:rejected"}
+        and not action.is_implicit_action
+    ):
+        return "badges_review_count"
+    return None
+
+
+def update_badge_counts(actions: Iterable[ActionLog], delta: int = 1) -> None:
+    """
+    Add newly saved actions to the badge counters of the users who
+    performed them, with one query per user.
+
+    Deleted actions are removed from the counters with `delta=-1`.
+    """
+    counts: dict[int, Counter[str]] = defaultdict(Counter)
+    for action in actions:
+        field = badge_count_field(action)
+        if field is not None:
+            counts[action.performed_by_id][field] += delta
+
+    for user_id, fields in counts.items():
+        UserProfile.objects.filter(user_id=user_id).update(
+            **{field: F(field) + count for field, count in fields.items()}
+        )
+
+
+def calculate_badge_counts() -> None:
+    """Recalculate the badge counters of all users from the action log."""
+
+    def count(actions: Q):
+        return Coalesce(
+            Subquery(
+                ActionLog.objects.filter(
+                    actions,
+                    performed_by=OuterRef("user"),
+                    created_at__gte=settings.BADGES_START_DATE,
+                )
+                .order_by()
+                .values("performed_by")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            0,
+        )
+
+    UserProfile.objects.update(
+        badges_translation_count=count(_translation_actions()),
+        badges_review_count=count(_review_actions()),
+    )
+
+
+def _badge_count(user: User, field: str) -> int:
+    """
+    The badge counter of user, including the actions logged within
+    `buffered_actions()` that are not saved yet.
+    """
+    pending = sum(
+        action.performed_by_id == user.pk and badge_count_field(action) == field
+        for action in pending_actions()
+    )
+    return (
+        UserProfile.objects.filter(user=user).values_list(field, flat=True).first() or 0
+    ) + pending
 
 
 def badges_translation_count(user: User) -> int:
     """Contributions provided by user that count towards their badges."""
-    return ActionLog.objects.filter(
-        performed_by=user,
-        action_type="translation:created",
-        created_at__gte=settings.BADGES_START_DATE,
-    ).count()
+    return _badge_count(user, "badges_translation_count")
 
 
 def badges_review_count(user: User) -> int:
     """Translation reviews provided by user that count towards their badges."""
-    return ActionLog.objects.filter(
-        performed_by=user,
-        action_type__in={"translation:approved", "translation:rejected"},
-        created_at__gte=settings.BADGES_START_DATE,
-        is_implicit_action=False,
-    ).count()
+    return _badge_count(user, "badges_review_count")
 
 
 def badges_promotion_count(user: User) -> int:
@@ -11,6 +11,7 @@ from django.core.exceptions import ValidationError
 from pontoon.api.models import PersonalAccessToken
 from pontoon.base import utils
 from pontoon.base.badge_utils import badges_promotion_count
+from pontoon.base.get_entities import decode_entity_cursor
 from pontoon.base.models import (
     Locale,
     ProjectLocale,
@@ -339,6 +340,7 @@ class GetEntitiesForm(forms.Form):
     paths = forms.MultipleChoiceField(required=False)
     limit = forms.IntegerField(required=False, initial=50)
     page = forms.IntegerField(required=False, initial=1)
+    cursor = forms.CharField(required=False)
     status = forms.CharField(required=False)
     extra = forms.CharField(required=False)
     search_identifiers = forms.BooleanField(required=False)
@@ -378,6 +380,16 @@ class GetEntitiesForm(forms.Form):
         except (TypeError, ValueError):
             return 1
 
+    def clean_cursor(self):
+        # Without a cursor, entities are paginated by page number.
+        if "cursor" not in self.data:
+            return None
+        cursor = self.cleaned_data["cursor"]
+        try:
+            return decode_entity_cursor(cursor) if cursor else []
+        except ValueError as error:
+            raise forms.ValidationError(str(error))
+
     def clean_search(self):
         # Return the search input as is, without any cleaning. This is in order to allow
         # users to search for strings with leading or trailing whitespaces.
@@ -1,14 +1,25 @@
-from collections.abc import Iterator
+import json
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime, timedelta
 from re import escape, match
-from typing import cast
+from typing import Any, cast
 
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 from django.db.models import F, Q, QuerySet
 from django.utils.timezone import make_aware
 
-from pontoon.base.models import Entity, Locale, Project, Resource, Translation, User
+from pontoon.base.models import (
+    Entity,
+    EntityLocaleStatus,
+    Locale,
+    Project,
+    Resource,
+    Translation,
+    User,
+)
 from pontoon.base.models.project import ProjectQuerySet
 from pontoon.base.utils import get_search_phrases
 
@@ -75,7 +86,7 @@ def get_entities_for_project_locale(
 
     post_filter = Q()
 
-    if status and (status_query := _status_filter(project, locale, status)):
+    if status and (status_query := _status_filter(locale, status)):
         post_filter &= status_query
 
     if extra and (extra_query := _extra_filter(locale, extra)):
@@ -102,8 +113,13 @@ def get_entities_for_project_locale(
         r = "" if search_identifiers else "=.*"
         o = "" if search_identifiers else ".*"
 
+        # Each search phrase is matched in two steps: a plain substring match,
+        # which uses the trigram indexes of translation and entity strings to
+        # find candidates, and a regex match on those candidates to check for
+        # Fluent identifiers and whole words.
         translation_filters = (
-            (
+            Q(**{f"translation__string__{i}regex": escape(s)})
+            & (
                 Q(
                     Q(resource__format=Resource.Format.FLUENT)
                     & (
@@ -124,9 +140,7 @@ def get_entities_for_project_locale(
             for s in search_list
         )
 
-        translation_matches = entities.filter(*translation_filters).values_list(
-            "id", flat=True
-        )
+        translation_matches = entities.filter(*translation_filters).values("id")
 
         # Search in source strings
         entity_filters = (
@@ -134,13 +148,16 @@ def get_entities_for_project_locale(
                 Q(pk__in=[])  # Ensures that no source strings are returned
                 if search_exclude_source_strings
                 else (
-                    Q(
-                        Q(resource__format=Resource.Format.FLUENT)
-                        & (Q(**{f"string__{i}regex": rf"{r}{y}{escape(s)}{y}{o}"}))
-                    )
-                    | Q(
-                        ~Q(resource__format=Resource.Format.FLUENT)
-                        & Q(**{f"string__{i}regex": rf"{y}{escape(s)}{y}"})
+                    Q(**{f"string__{i}regex": escape(s)})
+                    & (
+                        Q(
+                            Q(resource__format=Resource.Format.FLUENT)
+                            & (Q(**{f"string__{i}regex": rf"{r}{y}{escape(s)}{y}{o}"}))
+                        )
+                        | Q(
+                            ~Q(resource__format=Resource.Format.FLUENT)
+                            & Q(**{f"string__{i}regex": rf"{y}{escape(s)}{y}"})
+                        )
                     )
                 )
             )
@@ -152,17 +169,70 @@ def get_entities_for_project_locale(
             for s in search_list
         )
 
-        entity_matches = entities.filter(*entity_filters).values_list("id", flat=True)
+        entity_matches = entities.filter(*entity_filters).values("id")
 
+        # Combine the matches as subqueries, rather than as lists of ids
         entities = Entity.objects.filter(
-            pk__in=set(list(translation_matches) + list(entity_matches))
+            Q(pk__in=translation_matches) | Q(pk__in=entity_matches)
         )
 
-    order_fields: tuple[str, ...] = ("resource__order", "order")
+    return entities.order_by(*entity_order_fields(project))
+
+
+def entity_order_fields(project: Project) -> tuple[str, ...]:
+    """The fields by which entities are ordered, ending with a unique one."""
+    order_fields: tuple[str, ...] = ("resource__order", "order", "pk")
     if project.slug == "all-projects":
         order_fields = ("resource__project__name",) + order_fields
+    return order_fields
+
+
+def encode_entity_cursor(values: Sequence[Any]) -> str:
+    return urlsafe_b64encode(json.dumps(list(values)).encode()).decode()
+
+
+def decode_entity_cursor(cursor: str) -> list[Any]:
+    """Raises `ValueError` if `cursor` is not a valid entity cursor."""
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError) as error:
+        raise ValueError("Invalid cursor") from error
+    if not isinstance(values, list) or not all(
+        isinstance(value, str | int) for value in values
+    ):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def get_entities_page(
+    entities: QuerySet[Entity],
+    after: list[Any] | None,
+    limit: int,
+) -> tuple[QuerySet[Entity], str | None]:
+    """
+    Keyset pagination for entities from `get_entities_for_project_locale()`,
+    using their ordering as the key.
 
-    return entities.order_by(*order_fields)
+    Unlike offset pagination, this does not need to count the entities,
+    and later pages are as fast to get as the first one.
+
+    :arg after: The decoded cursor of the previous page, or `None` for the first page.
+    :returns: The entities of the page, and the cursor of the next page, if any.
+    """
+    order_fields = tuple(str(field) for field in entities.query.order_by)
+    if after:
+        if len(after) != len(order_fields):
+            raise ValueError("Invalid cursor")
+        # (a, b, c) > (x, y, z) as a > x OR (a = x AND (b > y OR (b = y AND c > z)))
+        after_q = Q(**{f"{order_fields[-1]}__gt": after[-1]})
+        for field, value in zip(reversed(order_fields[:-1]), reversed(after[:-1])):
+            after_q = Q(**{f"{field}__gt": value}) | Q(**{field: value}) & after_q
+        entities = entities.filter(after_q)
+
+    rows = list(entities.values_list(*order_fields)[: limit + 1])
+    next_cursor = encode_entity_cursor(rows[limit - 1]) if len(rows) > limit else None
+    page = entities.filter(pk__in=[row[-1] for row in rows[:limit]])
+    return page, next_cursor
 
 
 def _time_and_user_filters(
@@ -238,32 +308,28 @@ def _is_email(email: str) -> bool:
         return False
 
 
-def _status_filter(project: Project, locale: Locale, status: str) -> Q:
+def _status_filter(locale: Locale, status: str) -> Q:
     """Apply a combination of filters based on the list of statuses the user sent."""
     query = Q()
     for s in status.split(","):
         match s:
             case "warnings":
-                q = (Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True)) & Q(
-                    warnings__isnull=False
-                )
+                q = Q(has_warnings=True)
             case "errors":
-                q = (Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True)) & Q(
-                    errors__isnull=False
-                )
+                q = Q(has_errors=True)
             case "pretranslated":
-                q = Q(pretranslated=True, warnings__isnull=True, errors__isnull=True)
+                q = Q(pretranslated=True)
             case "translated":
-                q = Q(approved=True, warnings__isnull=True, errors__isnull=True)
+                q = Q(approved=True)
             case "unreviewed":
-                q = Q(approved=False, rejected=False, pretranslated=False, fuzzy=False)
+                q = Q(has_unreviewed=True)
             case "missing":
-                q = Q(approved=True) | Q(pretranslated=True)
-                query |= ~_query(project, locale, q)
+                # Entities without translations have no status
+                query |= ~_status_query(locale, Q(missing=False))
                 continue
             case _:
                 continue
-        query |= _query(project, locale, q)
+        query |= _status_query(locale, q)
     return query
 
 
@@ -273,45 +339,55 @@ def _extra_filter(locale: Locale, extra: str) -> Q:
     for e in extra.split(","):
         match e:
             case "rejected":
-                q = Q(rejected=True)
+                query |= _status_query(locale, Q(has_rejected=True))
             case "unchanged":
-                q = Q(active=True, string=F("entity__string"))
+                query |= _query(locale, Q(active=True, string=F("entity__string")))
             case "empty":
-                q = Q(string="")
+                query |= _query(locale, Q(string=""))
             case "fuzzy":
-                q = Q(fuzzy=True, warnings__isnull=True, errors__isnull=True)
+                query |= _status_query(locale, Q(fuzzy=True))
             case "missing-without-unreviewed":
-                q = Q(approved=True) | Q(pretranslated=True) | Q(rejected=False)
-                query |= ~_query(None, locale, q)
-                continue
-            case _:
-                continue
-        query |= _query(None, locale, q)
+                q = (
+                    Q(missing=False)
+                    | Q(has_unreviewed=True)
+                    | Q(fuzzy=True)
+                    | Q(has_errors=True)
+                    | Q(has_warnings=True)
+                )
+                query |= ~_status_query(locale, q)
     return query
 
 
-def _query(project: Project | None, locale: Locale, query: Q) -> Q:
+def _status_query(locale: Locale, query: Q) -> Q:
+    statuses = EntityLocaleStatus.objects.filter(query, locale=locale)
+    return Q(pk__in=statuses.values("entity"))
+
+
+def _query(locale: Locale, query: Q) -> Q:
     translations = Translation.objects.filter(locale=locale).filter(query)
-    if project and project.slug != "all-projects":
-        translations = translations.filter(entity__resource__project=project)
     return Q(pk__in=translations.values("entity"))
 
 
 def get_mismatched_filters(
     entity_pk: int,
     locale: Locale,
-    project: Project,
     status: str | None,
     extra: str | None,
 ) -> list[str]:
     """Return active status/extra filter slugs a single entity does not match."""
+    entity_status = EntityLocaleStatus.objects.filter(
+        entity_id=entity_pk, locale=locale
+    ).first() or EntityLocaleStatus(entity_id=entity_pk, locale=locale)
+
     mismatched = []
     for slug in filter(None, (status or "").split(",")):
-        query = _status_filter(project, locale, slug)
-        if query and not Entity.objects.filter(query, pk=entity_pk).exists():
+        if entity_status.matches_status(slug) is False:
             mismatched.append(slug)
     for slug in filter(None, (extra or "").split(",")):
-        query = _extra_filter(locale, slug)
-        if query and not Entity.objects.filter(query, pk=entity_pk).exists():
+        matches = entity_status.matches_extra(slug)
+        if matches is None:
+            query = _extra_filter(locale, slug)
+            matches = not query or Entity.objects.filter(query, pk=entity_pk).exists()
+        if not matches:
             mismatched.append(slug)
     return mismatched
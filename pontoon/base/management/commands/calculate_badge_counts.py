@@ -0,0 +1,23 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from pontoon.base.badge_utils import calculate_badge_counts
+
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = """
+        Re-calculate the badge counters of all users from the action log.
+
+        The counters are updated whenever actions are logged, so this is only
+        needed after changing BADGES_START_DATE, or after deleting actions,
+        e.g. with the translations they were performed on.
+        """
+
+    def handle(self, *args, **options):
+        log.info("Calculating badge counts...")
+        calculate_badge_counts()
+        log.info("Calculating badge counts complete.")
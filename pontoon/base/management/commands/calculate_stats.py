@@ -4,6 +4,8 @@ from django.core.management.base import BaseCommand
 from django.db.models import Count
 
 from pontoon.base.models import Project
+from pontoon.base.models.contribution_count import calculate_contribution_counts
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.sync.core.stats import update_stats
 
 
@@ -13,7 +15,8 @@ log = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = """
         Re-calculate statistics for all translated resources and corresponding
-        objects.
+        objects, the translation statuses of all entities, and the contribution
+        counts of all users.
 
         Note: while unlikely, it's possible that running this command may
         result in IntegrityErrors. That happens if at the same time when
@@ -48,4 +51,10 @@ class Command(BaseCommand):
         for project in projects:
             update_stats(project)
 
+        log.info("Calculating entity statuses...")
+        update_entity_statuses()
+
+        log.info("Calculating contribution counts...")
+        calculate_contribution_counts()
+
         log.info("Calculating stats complete.")
@@ -0,0 +1,23 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("base", "0127_add_missing_sections"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="translationmemoryentry",
+            index=GinIndex(
+                fields=["source"],
+                name="source_trigram_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0128_translationmemoryentry_source_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="translatedresource",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("base", "0129_resource_content_hash"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="translation",
+            index=GinIndex(
+                fields=["string"],
+                name="translation_string_trigram_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="entity",
+            index=GinIndex(
+                fields=["string"],
+                name="entity_string_trigram_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
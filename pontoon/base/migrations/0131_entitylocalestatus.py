@@ -0,0 +1,95 @@
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+POPULATE_SQL = """
+INSERT INTO base_entitylocalestatus (
+    entity_id,
+    locale_id,
+    approved,
+    pretranslated,
+    fuzzy,
+    has_errors,
+    has_warnings,
+    has_unreviewed,
+    has_rejected,
+    missing
+)
+SELECT
+    trans.entity_id,
+    trans.locale_id,
+    bool_or(trans.approved AND NOT chk.errors AND NOT chk.warnings),
+    bool_or(trans.pretranslated AND NOT chk.errors AND NOT chk.warnings),
+    bool_or(trans.fuzzy AND NOT chk.errors AND NOT chk.warnings),
+    bool_or((trans.approved OR trans.pretranslated OR trans.fuzzy) AND chk.errors),
+    bool_or((trans.approved OR trans.pretranslated OR trans.fuzzy) AND chk.warnings),
+    bool_or(NOT trans.approved AND NOT trans.rejected AND NOT trans.pretranslated AND NOT trans.fuzzy),
+    bool_or(trans.rejected),
+    NOT bool_or(trans.approved OR trans.pretranslated)
+FROM "base_translation" trans
+CROSS JOIN LATERAL (
+    SELECT
+        EXISTS (SELECT FROM "checks_error" err WHERE err.translation_id = trans.id) AS "errors",
+        EXISTS (SELECT FROM "checks_warning" warn WHERE warn.translation_id = trans.id) AS "warnings"
+) AS chk
+GROUP BY trans.entity_id, trans.locale_id
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0130_translation_entity_string_trigram_index"),
+        ("checks", "0001_squashed_0004_auto_20200206_0932"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntityLocaleStatus",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("approved", models.BooleanField(default=False)),
+                ("pretranslated", models.BooleanField(default=False)),
+                ("fuzzy", models.BooleanField(default=False)),
+                ("has_errors", models.BooleanField(default=False)),
+                ("has_warnings", models.BooleanField(default=False)),
+                ("has_unreviewed", models.BooleanField(default=False)),
+                ("has_rejected", models.BooleanField(default=False)),
+                ("missing", models.BooleanField(default=True)),
+                (
+                    "entity",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="locale_statuses",
+                        to="base.entity",
+                    ),
+                ),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entity_statuses",
+                        to="base.locale",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["locale", "entity"],
+                        name="base_entity_locale__26efa5_idx",
+                    )
+                ],
+                "unique_together": {("entity", "locale")},
+            },
+        ),
+        migrations.RunSQL(POPULATE_SQL, migrations.RunSQL.noop),
+    ]
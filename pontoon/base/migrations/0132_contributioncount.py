@@ -0,0 +1,99 @@
+import django.db.models.deletion
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+POPULATE_SQL = """
+INSERT INTO base_contributioncount (
+    user_id,
+    locale_id,
+    project_id,
+    month,
+    total,
+    approved,
+    rejected,
+    unreviewed
+)
+SELECT
+    trans.user_id,
+    trans.locale_id,
+    res.project_id,
+    date_trunc('month', trans.date)::date,
+    count(*),
+    count(*) FILTER (WHERE trans.approved),
+    count(*) FILTER (WHERE NOT trans.approved AND trans.rejected),
+    count(*) FILTER (WHERE NOT trans.approved AND NOT trans.rejected)
+FROM "base_translation" trans
+JOIN "base_entity" ent ON ent.id = trans.entity_id
+JOIN "base_resource" res ON res.id = ent.resource_id
+WHERE trans.user_id IS NOT NULL
+GROUP BY 1, 2, 3, 4
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("base", "0131_entitylocalestatus"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContributionCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField()),
+                ("total", models.IntegerField(default=0)),
+                ("approved", models.IntegerField(default=0)),
+                ("rejected", models.IntegerField(default=0)),
+                ("unreviewed", models.IntegerField(default=0)),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contribution_counts",
+                        to="base.locale",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contribution_counts",
+                        to="base.project",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="contribution_counts",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["locale", "user"],
+                        name="base_contri_locale__e132a9_idx",
+                    ),
+                    models.Index(
+                        fields=["project", "user"],
+                        name="base_contri_project_5d41fa_idx",
+                    ),
+                ],
+                "unique_together": {("user", "locale", "project", "month")},
+            },
+        ),
+        migrations.RunSQL(POPULATE_SQL, migrations.RunSQL.noop),
+    ]
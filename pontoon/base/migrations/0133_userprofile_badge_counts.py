@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_badge_actions(apps, schema_editor):
+    ActionLog = apps.get_model("actionlog", "ActionLog")
+    UserProfile = apps.get_model("base", "UserProfile")
+
+    def count(actions):
+        return Coalesce(
+            Subquery(
+                ActionLog.objects.filter(
+                    actions,
+                    performed_by=OuterRef("user"),
+                    created_at__gte=settings.BADGES_START_DATE,
+                )
+                .order_by()
+                .values("performed_by")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            0,
+        )
+
+    UserProfile.objects.update(
+        badges_translation_count=count(Q(action_type="translation:created")),
+        badges_review_count=count(
+            Q(
+                action_type__in={"translation:approved", "translation:rejected"},
+                is_implicit_action=False,
+            )
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("actionlog", "0007_actionlog_is_implicit_action"),
+        ("base", "0132_contributioncount"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userprofile",
+            name="badges_translation_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="userprofile",
+            name="badges_review_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_badge_actions, migrations.RunPython.noop),
+    ]
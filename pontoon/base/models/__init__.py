@@ -1,6 +1,8 @@
 from pontoon.base.models.changed_entity_locale import ChangedEntityLocale
 from pontoon.base.models.comment import Comment
+from pontoon.base.models.contribution_count import ContributionCount
 from pontoon.base.models.entity import Entity
+from pontoon.base.models.entity_status import EntityLocaleStatus
 from pontoon.base.models.external_resource import ExternalResource
 from pontoon.base.models.locale import Locale, LocaleCodeHistory, validate_cldr
 from pontoon.base.models.permission_changelog import PermissionChangelog
@@ -21,7 +23,9 @@ from pontoon.db import IContainsCollate  # noqa
 __all__ = [
     "ChangedEntityLocale",
     "Comment",
+    "ContributionCount",
     "Entity",
+    "EntityLocaleStatus",
     "ExternalResource",
     "Locale",
     "LocaleCodeHistory",
@@ -0,0 +1,182 @@
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+from django.db import connection, models
+
+from pontoon.base.models.user import User
+
+
+if TYPE_CHECKING:
+    from pontoon.base.models import Locale, Project
+
+
+ContributionKey = tuple[int, int, int, date]
+""" (user.id, locale.id, project.id, month) """
+
+ContributionCounts = tuple[int, int, int, int]
+""" (total, approved, rejected, unreviewed) """
+
+COUNT_FIELDS = ("total", "approved", "rejected", "unreviewed")
+
+CONTRIBUTIONS_SQL = """
+    SELECT
+        trans.user_id,
+        trans.locale_id,
+        res.project_id,
+        date_trunc('month', trans.date)::date,
+        count(*),
+        count(*) FILTER (WHERE trans.approved),
+        count(*) FILTER (WHERE NOT trans.approved AND trans.rejected),
+        count(*) FILTER (WHERE NOT trans.approved AND NOT trans.rejected)
+    FROM "base_translation" trans
+    {scope}
+    JOIN "base_entity" ent ON ent.id = trans.entity_id
+    JOIN "base_resource" res ON res.id = ent.resource_id
+    WHERE trans.user_id IS NOT NULL
+    GROUP BY 1, 2, 3, 4
+    """
+
+
+class ContributionCount(models.Model):
+    """
+    Denormalized counts of the translations submitted by a user
+    in a locale and project in a month, by their current review status,
+    used to rank contributors without scanning all translations.
+
+    Translations without a user are not counted.
+    Updated with `adjust_contribution_counts()` whenever translations are
+    created, reviewed or deleted.
+    """
+
+    user: models.ForeignKey[User] = models.ForeignKey(
+        User, models.CASCADE, related_name="contribution_counts"
+    )
+    locale: models.ForeignKey["Locale"] = models.ForeignKey(
+        "Locale", models.CASCADE, related_name="contribution_counts"
+    )
+    project: models.ForeignKey["Project"] = models.ForeignKey(
+        "Project", models.CASCADE, related_name="contribution_counts"
+    )
+
+    month = models.DateField()
+    """First day of the month in which the translations were submitted."""
+
+    total = models.IntegerField(default=0)
+    approved = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    unreviewed = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("user", "locale", "project", "month")
+        indexes = [
+            models.Index(fields=["locale", "user"]),
+            models.Index(fields=["project", "user"]),
+        ]
+
+
+def count_contributions(
+    pairs: Iterable[tuple[int, int]],
+) -> dict[ContributionKey, ContributionCounts]:
+    """
+    Count the translations of entities in locales by contribution.
+
+    Called before and after changing translations,
+    to get the arguments of `adjust_contribution_counts()`.
+
+    :arg pairs: `(entity_id, locale_id)` pairs of the translations to count.
+    """
+    pairs = set(pairs)
+    if not pairs:
+        return {}
+
+    scope = """
+        JOIN unnest(%s::integer[], %s::integer[]) AS pairs(entity_id, locale_id)
+        ON (trans.entity_id = pairs.entity_id AND trans.locale_id = pairs.locale_id)
+        """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            dedent(CONTRIBUTIONS_SQL.format(scope=scope)),
+            [[e for e, _ in pairs], [loc for _, loc in pairs]],
+        )
+        return {tuple(row[:4]): tuple(row[4:]) for row in cursor.fetchall()}
+
+
+def sum_contributions(
+    translations: Iterable[tuple[int | None, int, int, datetime, bool, bool]],
+) -> dict[ContributionKey, ContributionCounts]:
+    """
+    Count translations by contribution like `count_contributions()`,
+    from their values rather than from the database.
+
+    :arg translations: `(user_id, locale_id, project_id, date, approved, rejected)`
+        values of the translations to count.
+    """
+    counts: dict[ContributionKey, ContributionCounts] = {}
+    for user_id, locale_id, project_id, trans_date, approved, rejected in translations:
+        if user_id is None:
+            continue
+        # Months are truncated in UTC, the timezone of database connections
+        month = trans_date.astimezone(UTC).date().replace(day=1)
+        key = (user_id, locale_id, project_id, month)
+        counts[key] = tuple(
+            a + b
+            for a, b in zip(
+                counts.get(key, (0, 0, 0, 0)),
+                (1, approved, not approved and rejected, not approved and not rejected),
+            )
+        )
+    return counts
+
+
+def adjust_contribution_counts(
+    before: dict[ContributionKey, ContributionCounts],
+    after: dict[ContributionKey, ContributionCounts],
+) -> None:
+    """
+    Add the difference between two results of `count_contributions()`
+    to the stored counts, with a single query.
+    """
+    deltas = []
+    for key in before.keys() | after.keys():
+        delta = [
+            a - b
+            for a, b in zip(after.get(key, (0, 0, 0, 0)), before.get(key, (0, 0, 0, 0)))
+        ]
+        if any(delta):
+            deltas.append((*key, *delta))
+    if not deltas:
+        return
+
+    fields = ", ".join(COUNT_FIELDS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            dedent(
+                f"""
+                INSERT INTO base_contributioncount (user_id, locale_id, project_id, month, {fields})
+                SELECT * FROM unnest(
+                    %s::integer[], %s::integer[], %s::integer[], %s::date[],
+                    %s::integer[], %s::integer[], %s::integer[], %s::integer[]
+                )
+                ON CONFLICT (user_id, locale_id, project_id, month) DO UPDATE SET
+                    {", ".join(f"{field} = base_contributioncount.{field} + EXCLUDED.{field}" for field in COUNT_FIELDS)}
+                """
+            ),
+            [list(column) for column in zip(*deltas)],
+        )
+
+
+def calculate_contribution_counts() -> None:
+    """Recalculate the stored counts of all contributions."""
+    fields = ", ".join(COUNT_FIELDS)
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM base_contributioncount")
+        cursor.execute(
+            dedent(
+                f"""
+                INSERT INTO base_contributioncount (user_id, locale_id, project_id, month, {fields})
+                {CONTRIBUTIONS_SQL.format(scope="")}
+                """
+            )
+        )
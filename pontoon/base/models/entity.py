@@ -1,8 +1,11 @@
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from dirtyfields import DirtyFieldsMixin  # type: ignore[import-untyped]
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils import timezone
 
@@ -52,7 +55,14 @@ class Entity(DirtyFieldsMixin, models.Model):
     """Actually a RelatedManager"""
 
     class Meta:
-        indexes = [models.Index(fields=["resource", "obsolete"])]
+        indexes = [
+            models.Index(fields=["resource", "obsolete"]),
+            GinIndex(
+                fields=["string"],
+                name="entity_string_trigram_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self):
         return self.string
@@ -114,3 +124,32 @@ class Entity(DirtyFieldsMixin, models.Model):
             term_translation.save(update_fields=["text"])
         except Translation.DoesNotExist:
             term.translations.filter(locale=locale).delete()
+
+
+@lru_cache(maxsize=10000)
+def _parsed_source(parse, args, entity_pk, string_hash, string):
+    try:
+        return parse(*args, string), None
+    except Exception as error:
+        return None, error
+
+
+def parse_source[T](entity: Entity, parse: Callable[..., T], *args) -> T:
+    """
+    Return `parse(*args, entity.string)`, reusing the result of previous calls
+    for the same entity and source string, e.g. when checking translations of
+    the entity in many locales.
+
+    Results are kept in a process-wide LRU cache keyed by
+    `(entity.pk, hash(entity.string))`, and shared between callers,
+    so they must not be modified. Exceptions raised by `parse` are re-raised.
+    """
+    if entity.pk is None:
+        return parse(*args, entity.string)
+
+    result, error = _parsed_source(
+        parse, args, entity.pk, hash(entity.string), entity.string
+    )
+    if error is not None:
+        raise error.with_traceback(None)
+    return result
@@ -0,0 +1,176 @@
+from collections.abc import Iterable
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+from django.db import connection, models
+
+
+if TYPE_CHECKING:
+    from pontoon.base.models import Entity, Locale
+
+
+STATUS_FLAGS = (
+    "approved",
+    "pretranslated",
+    "fuzzy",
+    "has_errors",
+    "has_warnings",
+    "has_unreviewed",
+    "has_rejected",
+    "missing",
+)
+
+
+class EntityLocaleStatus(models.Model):
+    """
+    Denormalized status of the translations of an entity in a locale,
+    used to filter entities by status.
+
+    Only stored for entities with translations in the locale;
+    entities with no status are missing a translation.
+    Updated with `update_entity_statuses()` whenever translations or
+    their failed checks change.
+    """
+
+    entity: models.ForeignKey["Entity"] = models.ForeignKey(
+        "Entity", models.CASCADE, related_name="locale_statuses"
+    )
+    locale: models.ForeignKey["Locale"] = models.ForeignKey(
+        "Locale", models.CASCADE, related_name="entity_statuses"
+    )
+
+    approved = models.BooleanField(default=False)
+    """Has an approved translation without errors or warnings."""
+
+    pretranslated = models.BooleanField(default=False)
+    """Has a pretranslated translation without errors or warnings."""
+
+    fuzzy = models.BooleanField(default=False)
+    """Has a fuzzy translation without errors or warnings."""
+
+    has_errors = models.BooleanField(default=False)
+    """Has an approved, pretranslated or fuzzy translation with errors."""
+
+    has_warnings = models.BooleanField(default=False)
+    """Has an approved, pretranslated or fuzzy translation with warnings."""
+
+    has_unreviewed = models.BooleanField(default=False)
+    has_rejected = models.BooleanField(default=False)
+
+    missing = models.BooleanField(default=True)
+    """Has no approved or pretranslated translation."""
+
+    class Meta:
+        unique_together = ("entity", "locale")
+        indexes = [models.Index(fields=["locale", "entity"])]
+
+    def matches_status(self, status: str) -> bool | None:
+        """
+        Check if the entity matches a status filter,
+        or `None` for an unknown status.
+        """
+        match status:
+            case "warnings":
+                return self.has_warnings
+            case "errors":
+                return self.has_errors
+            case "pretranslated":
+                return self.pretranslated
+            case "translated":
+                return self.approved
+            case "unreviewed":
+                return self.has_unreviewed
+            case "missing":
+                return self.missing
+        return None
+
+    def matches_extra(self, extra: str) -> bool | None:
+        """
+        Check if the entity matches an extra filter,
+        or `None` for an extra that is not based on the status.
+        """
+        match extra:
+            case "rejected":
+                return self.has_rejected
+            case "fuzzy":
+                return self.fuzzy
+            case "missing-without-unreviewed":
+                return self.missing and not (
+                    self.has_unreviewed
+                    or self.fuzzy
+                    or self.has_errors
+                    or self.has_warnings
+                )
+        return None
+
+
+def update_entity_statuses(
+    pairs: Iterable[tuple[int, int]] | None = None, translations_removed: bool = True
+) -> None:
+    """
+    Uses raw SQL queries for performance.
+
+    :arg pairs: `(entity_id, locale_id)` pairs with changed translations.
+        If not set, all statuses are recalculated.
+    :arg translations_removed: If false, the pairs are known to still have
+        translations, and their statuses are updated with a single query.
+    """
+    if pairs is None:
+        scope = ""
+        params = []
+    else:
+        pairs = set(pairs)
+        if not pairs:
+            return
+        scope = """
+            JOIN unnest(%s::integer[], %s::integer[]) AS pairs(entity_id, locale_id)
+            ON (trans.entity_id = pairs.entity_id AND trans.locale_id = pairs.locale_id)
+            """
+        params = [[e for e, _ in pairs], [loc for _, loc in pairs]]
+
+    with connection.cursor() as cursor:
+        # Statuses of entities with no more translations
+        if pairs is None:
+            cursor.execute("DELETE FROM base_entitylocalestatus")
+        elif translations_removed:
+            cursor.execute(
+                dedent(
+                    """
+                    DELETE FROM base_entitylocalestatus st
+                    USING unnest(%s::integer[], %s::integer[]) AS pairs(entity_id, locale_id)
+                    WHERE st.entity_id = pairs.entity_id AND st.locale_id = pairs.locale_id
+                    """
+                ),
+                params,
+            )
+
+        flags = ", ".join(STATUS_FLAGS)
+        cursor.execute(
+            dedent(
+                f"""
+                INSERT INTO base_entitylocalestatus (entity_id, locale_id, {flags})
+                SELECT
+                    trans.entity_id,
+                    trans.locale_id,
+                    bool_or(trans.approved AND NOT chk.errors AND NOT chk.warnings),
+                    bool_or(trans.pretranslated AND NOT chk.errors AND NOT chk.warnings),
+                    bool_or(trans.fuzzy AND NOT chk.errors AND NOT chk.warnings),
+                    bool_or((trans.approved OR trans.pretranslated OR trans.fuzzy) AND chk.errors),
+                    bool_or((trans.approved OR trans.pretranslated OR trans.fuzzy) AND chk.warnings),
+                    bool_or(NOT trans.approved AND NOT trans.rejected AND NOT trans.pretranslated AND NOT trans.fuzzy),
+                    bool_or(trans.rejected),
+                    NOT bool_or(trans.approved OR trans.pretranslated)
+                FROM "base_translation" trans
+                {scope}
+                CROSS JOIN LATERAL (
+                    SELECT
+                        EXISTS (SELECT FROM "checks_error" err WHERE err.translation_id = trans.id) AS "errors",
+                        EXISTS (SELECT FROM "checks_warning" warn WHERE warn.translation_id = trans.id) AS "warnings"
+                ) AS chk
+                GROUP BY trans.entity_id, trans.locale_id
+                ON CONFLICT (entity_id, locale_id) DO UPDATE SET
+                    {", ".join(f"{flag} = EXCLUDED.{flag}" for flag in STATUS_FLAGS)}
+                """
+            ),
+            params,
+        )
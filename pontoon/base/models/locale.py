@@ -7,7 +7,7 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import BooleanField, Case, F, QuerySet, Sum, Value, When
 
-from pontoon.base.aggregated_stats import AggregatedStats
+from pontoon.base.aggregated_stats import AggregatedStats, cached_stats
 
 
 if TYPE_CHECKING:
@@ -105,19 +105,42 @@ class LocaleQuerySet(models.QuerySet["Locale"]):
         )
 
     def stats_data_as_dict(self, project=None) -> dict[int, dict[str, int]]:
-        """Mapping of locale `id` to dict with counts."""
-        query = self.stats_data(project)
-        data = query.values(
-            "id",
-            "total",
-            "approved",
-            "pretranslated",
-            "errors",
-            "warnings",
-            "unreviewed",
-            # TODO: Add "missing" string field and prevent recalculation of field in JavaScript
+        """
+        Mapping of locale `id` to dict with counts.
+
+        The counts of each locale are cached until the stats of the locale
+        (or of the given project) change.
+        """
+
+        def scopes(pk):
+            if project is None:
+                return [f"locale:{pk}"]
+            return [f"locale:{pk}", f"project:{project.pk}"]
+
+        def calculate(pks):
+            data = (
+                Locale.objects.filter(pk__in=pks)
+                .stats_data(project)
+                .values(
+                    "id",
+                    "total",
+                    "approved",
+                    "pretranslated",
+                    "errors",
+                    "warnings",
+                    "unreviewed",
+                    # TODO: Add "missing" string field and prevent recalculation of field in JavaScript
+                )
+            )
+            return {row["id"]: row for row in data}
+
+        stats = cached_stats(
+            f"locales:{project.pk if project else 'all'}",
+            {pk: scopes(pk) for pk in self.values_list("pk", flat=True)},
+            calculate,
+            None,
         )
-        return {row["id"]: row for row in data if row["total"]}
+        return {pk: row for pk, row in stats.items() if row and row["total"]}
 
 
 class Locale(models.Model, AggregatedStats):
@@ -132,6 +155,10 @@ class Locale(models.Model, AggregatedStats):
             resource__project__visibility="public",
         )
 
+    @property
+    def aggregated_stats_scopes(self):
+        return [f"locale:{self.pk}"]
+
     code = models.CharField(max_length=20, unique=True)
 
     google_translate_code = models.CharField(
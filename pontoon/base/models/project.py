@@ -6,7 +6,7 @@ from django.db import models
 from django.db.models import BooleanField, Case, F, QuerySet, Sum, Value, When
 from django.utils import timezone
 
-from pontoon.base.aggregated_stats import AggregatedStats
+from pontoon.base.aggregated_stats import AggregatedStats, cached_stats
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.user import User
 from pontoon.base.user_utils import user_serialize
@@ -105,19 +105,42 @@ class ProjectQuerySet(models.QuerySet["Project"]):
         )
 
     def stats_data_as_dict(self, locale=None) -> dict[int, dict[str, int]]:
-        """Mapping of project `id` to dict with counts."""
-        query = self.stats_data(locale)
-        data = query.values(
-            "id",
-            "total",
-            "approved",
-            "pretranslated",
-            "errors",
-            "warnings",
-            "unreviewed",
-            # TODO: Add "missing" string field and prevent recalculation of field in JavaScript
+        """
+        Mapping of project `id` to dict with counts.
+
+        The counts of each project are cached until the stats of the project
+        (or of the given locale) change.
+        """
+
+        def scopes(pk):
+            if locale is None:
+                return [f"project:{pk}"]
+            return [f"project:{pk}", f"locale:{locale.pk}"]
+
+        def calculate(pks):
+            data = (
+                Project.objects.filter(pk__in=pks)
+                .stats_data(locale)
+                .values(
+                    "id",
+                    "total",
+                    "approved",
+                    "pretranslated",
+                    "errors",
+                    "warnings",
+                    "unreviewed",
+                    # TODO: Add "missing" string field and prevent recalculation of field in JavaScript
+                )
+            )
+            return {row["id"]: row for row in data}
+
+        stats = cached_stats(
+            f"projects:{locale.pk if locale else 'all'}",
+            {pk: scopes(pk) for pk in self.values_list("pk", flat=True)},
+            calculate,
+            None,
         )
-        return {row["id"]: row for row in data if row["total"]}
+        return {pk: row for pk, row in stats.items() if row and row["total"]}
 
 
 class Project(models.Model, AggregatedStats):
@@ -127,6 +150,10 @@ class Project(models.Model, AggregatedStats):
 
         return TranslatedResource.objects.filter(resource__project=self)
 
+    @property
+    def aggregated_stats_scopes(self):
+        return [f"project:{self.pk}"]
+
     name = models.CharField(max_length=128, unique=True)
     slug = models.SlugField(unique=True)
     locales: "models.ManyToManyField[Locale, Any]" = models.ManyToManyField(
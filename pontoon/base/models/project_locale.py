@@ -89,6 +89,10 @@ class ProjectLocale(models.Model, AggregatedStats):
             locale=self.locale, resource__project=self.project
         )
 
+    @property
+    def aggregated_stats_scopes(self):
+        return [f"project:{self.project_id}", f"locale:{self.locale_id}"]
+
     project: models.ForeignKey[Project] = models.ForeignKey(
         Project, models.CASCADE, related_name="project_locale"
     )
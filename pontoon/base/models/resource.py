@@ -4,6 +4,7 @@ from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.utils import timezone
 
+from pontoon.base.aggregated_stats import invalidate_stats
 from pontoon.base.models.project import Project
 
 
@@ -29,7 +30,11 @@ class ResourceQuerySet(models.QuerySet["Resource"]):
 
         from pontoon.base.models.translated_resource import TranslatedResource
 
-        TranslatedResource.objects.filter(resource__in=self).delete()
+        translated_resources = TranslatedResource.objects.filter(resource__in=self)
+        invalidate_stats(
+            translated_resources.values_list("resource__project_id", "locale_id")
+        )
+        translated_resources.delete()
 
     def current(self):
         return self.filter(obsolete=False)
@@ -76,6 +81,13 @@ class Resource(models.Model):
 
     deadline = models.DateField(blank=True, null=True)
 
+    content_hash = models.CharField(max_length=64, blank=True)
+    """
+    Hash of the source file contents as of the last sync that parsed it.
+
+    Used by sync to skip parsing unchanged files.
+    """
+
     objects = ResourceQuerySet.as_manager()
 
     entities: models.QuerySet["Entity"]
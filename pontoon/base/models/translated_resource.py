@@ -1,8 +1,11 @@
 import logging
 
-from django.db import models
-from django.db.models import F, Sum
+from textwrap import dedent
 
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Sum
+
+from pontoon.base.aggregated_stats import invalidate_stats
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.project import Project
 from pontoon.base.models.resource import Resource
@@ -12,6 +15,15 @@ from pontoon.base.models.user import User
 
 log = logging.getLogger(__name__)
 
+STATS_FIELDS = {
+    "approved": "approved_strings",
+    "pretranslated": "pretranslated_strings",
+    "errors": "strings_with_errors",
+    "warnings": "strings_with_warnings",
+    "unreviewed": "unreviewed_strings",
+}
+""" Keys of `TranslationQuerySet.aggregate_stats()` by translated resource field """
+
 
 class TranslatedResourceQuerySet(models.QuerySet["TranslatedResource"]):
     def string_stats(
@@ -50,6 +62,47 @@ class TranslatedResourceQuerySet(models.QuerySet["TranslatedResource"]):
                 query = query.filter(resource__path__in=paths)
             return query.string_stats(count_system_projects=True)
 
+    def adjust_stats(
+        self,
+        resource: Resource,
+        locale: Locale,
+        before: dict[str, int],
+        after: dict[str, int],
+    ) -> None:
+        """
+        Add the difference between two results of
+        `TranslationQuerySet.aggregate_stats()` to the stats of a translated
+        resource, creating it if necessary, with a single query.
+
+        Falls back to a full recount if the stats would become negative.
+        """
+        fields = ", ".join(STATS_FIELDS.values())
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    dedent(
+                        f"""
+                        INSERT INTO base_translatedresource AS tr (resource_id, locale_id, content_hash, total_strings, {fields})
+                        VALUES (%s, %s, '', %s, {", ".join(["%s"] * len(STATS_FIELDS))})
+                        ON CONFLICT (locale_id, resource_id) DO UPDATE SET
+                            {", ".join(f"{field} = tr.{field} + EXCLUDED.{field}" for field in STATS_FIELDS.values())}
+                        """
+                    ),
+                    [
+                        resource.pk,
+                        locale.pk,
+                        resource.total_strings,
+                        *(after[key] - before[key] for key in STATS_FIELDS),
+                    ],
+                )
+        except IntegrityError:
+            translated_resource, _ = self.get_or_create(
+                resource=resource, locale=locale
+            )
+            translated_resource.calculate_stats()
+        else:
+            invalidate_stats([(resource.project_id, locale.pk)])
+
     def calculate_stats(self):
         self = self.prefetch_related("resource__project", "locale")
         for translated_resource in self:
@@ -66,6 +119,8 @@ class TranslatedResourceQuerySet(models.QuerySet["TranslatedResource"]):
             ],
         )
 
+        invalidate_stats((tr.resource.project_id, tr.locale_id) for tr in self)
+
         n = len(self)
         log.debug(f"update_stats: {n} translated resource{'' if n == 1 else 's'}")
 
@@ -99,6 +154,13 @@ class TranslatedResource(models.Model):
         related_name="resource_latest",
     )
 
+    content_hash = models.CharField(max_length=64, blank=True)
+    """
+    Hash of the target file contents as of the last sync that parsed it.
+
+    Used by sync to skip parsing unchanged files.
+    """
+
     objects = TranslatedResourceQuerySet.as_manager()
 
     class Meta:
@@ -114,39 +176,6 @@ class TranslatedResource(models.Model):
             "unreviewed": self.unreviewed_strings,
         }
 
-    def adjust_stats(
-        self, before: dict[str, int], after: dict[str, int], tr_created: bool
-    ):
-        if tr_created:
-            self.total_strings = self.resource.total_strings
-        self.approved_strings = (
-            F("approved_strings") + after["approved"] - before["approved"]
-        )
-        self.pretranslated_strings = (
-            F("pretranslated_strings")
-            + after["pretranslated"]
-            - before["pretranslated"]
-        )
-        self.strings_with_errors = (
-            F("strings_with_errors") + after["errors"] - before["errors"]
-        )
-        self.strings_with_warnings = (
-            F("strings_with_warnings") + after["warnings"] - before["warnings"]
-        )
-        self.unreviewed_strings = (
-            F("unreviewed_strings") + after["unreviewed"] - before["unreviewed"]
-        )
-        self.save(
-            update_fields=[
-                "total_strings",
-                "approved_strings",
-                "pretranslated_strings",
-                "strings_with_errors",
-                "strings_with_warnings",
-                "unreviewed_strings",
-            ]
-        )
-
     def calculate_stats(self, save=True):
         """Update stats, including denormalized ones."""
 
@@ -1,19 +1,28 @@
-from typing import TYPE_CHECKING, Literal
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
 from dirtyfields import DirtyFieldsMixin
 
 from django.contrib.postgres.fields import ArrayField
-from django.db import IntegrityError, models, transaction
-from django.db.models import Count, Q, QuerySet
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connection, models
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, QuerySet
 from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog
-from pontoon.actionlog.utils import log_action
+from pontoon.actionlog.utils import buffered_actions, log_action
 from pontoon.base.models.changed_entity_locale import ChangedEntityLocale
-from pontoon.base.models.entity import Entity
+from pontoon.base.models.contribution_count import (
+    adjust_contribution_counts,
+    sum_contributions,
+)
+from pontoon.base.models.entity import Entity, parse_source
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.project import Project
-from pontoon.base.models.project_locale import ProjectLocale
+from pontoon.base.models.resource import Resource
 from pontoon.base.models.user import User
 from pontoon.base.simple_preview import get_simple_preview
 from pontoon.checks import DB_FORMATS
@@ -26,6 +35,45 @@ if TYPE_CHECKING:
     from pontoon.checks.models import Error, Warning
 
 
+STATUS_FIELDS = ("approved", "pretranslated", "fuzzy", "rejected")
+
+
+class TranslationState(NamedTuple):
+    """The values of a translation which its stats and contributions depend on."""
+
+    user_id: int | None
+    date: datetime
+    approved: bool
+    pretranslated: bool
+    fuzzy: bool
+    rejected: bool
+    errors: bool
+    warnings: bool
+
+    def stats(self) -> dict[str, int]:
+        """Must match `TranslationQuerySet.aggregate_stats()`."""
+        passing = not self.errors and not self.warnings
+        reviewed = self.approved or self.pretranslated or self.fuzzy
+        return {
+            "approved": int(self.approved and passing),
+            "pretranslated": int(self.pretranslated and passing),
+            "errors": int(reviewed and self.errors),
+            "warnings": int(reviewed and self.warnings),
+            "unreviewed": int(not reviewed and not self.rejected),
+        }
+
+
+def sum_stats(states: Iterable[TranslationState]) -> dict[str, int]:
+    """Aggregate translation stats like `TranslationQuerySet.aggregate_stats()`."""
+    stats: Counter[str] = Counter()
+    for state in states:
+        stats.update(state.stats())
+    return {
+        key: stats[key]
+        for key in ("approved", "pretranslated", "errors", "warnings", "unreviewed")
+    }
+
+
 class TranslationQuerySet(models.QuerySet["Translation"]):
     def aggregate_stats(self) -> dict[str, int]:
         """
@@ -86,10 +134,22 @@ class TranslationQuerySet(models.QuerySet["Translation"]):
     def for_checks(self, only_db_formats=True):
         """
         Return an optimized queryset for `checks`-related functions.
+
+        Entities and resources are loaded with only the fields used by checks,
+        and translations of the same resource share its instance, on which
+        references to the other entities of the resource are cached on demand
+        (see `pontoon.checks.libraries.compare_locales.get_references()`).
+
         :arg bool only_db_formats: filter translations by formats supported by checks.
         """
         translations = self.prefetch_related(
-            "entity__resource__entities",
+            Prefetch(
+                "entity",
+                queryset=Entity.objects.only("resource", "string", "key", "comment"),
+            ),
+            Prefetch(
+                "entity__resource", queryset=Resource.objects.only("path", "format")
+            ),
             "locale",
         )
 
@@ -101,22 +161,26 @@ class TranslationQuerySet(models.QuerySet["Translation"]):
         return translations
 
     def bulk_mark_changed(self):
-        changed_entities = {}
-        existing = ChangedEntityLocale.objects.values_list(
-            "entity", "locale"
-        ).distinct()
-
-        for translation in self.exclude(
-            entity__resource__project__data_source=Project.DataSource.DATABASE
-        ):
-            key = (translation.entity.pk, translation.locale.pk)
-
-            if key not in existing:
-                changed_entities[key] = ChangedEntityLocale(
-                    entity=translation.entity, locale=translation.locale
-                )
+        """
+        Mark the entities of translations as changed in their locales,
+        keeping existing marks as they are.
+        """
+        changed = (
+            self.exclude(
+                entity__resource__project__data_source=Project.DataSource.DATABASE
+            )
+            .order_by()
+            .values_list("entity_id", "locale_id")
+            .distinct()
+        )
 
-        ChangedEntityLocale.objects.bulk_create(changed_entities.values())
+        ChangedEntityLocale.objects.bulk_create(
+            [
+                ChangedEntityLocale(entity_id=entity_id, locale_id=locale_id)
+                for entity_id, locale_id in changed
+            ],
+            ignore_conflicts=True,
+        )
 
 
 class Translation(DirtyFieldsMixin, models.Model):
@@ -212,6 +276,11 @@ class Translation(DirtyFieldsMixin, models.Model):
             models.Index(fields=["locale", "user", "entity"]),
             models.Index(fields=["date", "locale"]),
             models.Index(fields=["approved_date", "locale"]),
+            GinIndex(
+                fields=["string"],
+                name="translation_string_trigram_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -254,7 +323,9 @@ class Translation(DirtyFieldsMixin, models.Model):
 
     @property
     def tm_source(self):
-        return get_simple_preview(self.entity.resource.format, self.entity.string)
+        return parse_source(
+            self.entity, get_simple_preview, self.entity.resource.format
+        )
 
     @property
     def tm_target(self):
@@ -279,11 +350,34 @@ class Translation(DirtyFieldsMixin, models.Model):
 
     def save(self, failed_checks=None, *args, **kwargs):
         from pontoon.base.models.translated_resource import TranslatedResource
-        from pontoon.base.models.translation_memory import TranslationMemoryEntry
 
-        stats_before = self.entity.translation_set.filter(
-            locale=self.locale
-        ).aggregate_stats()
+        adding = self._state.adding
+
+        # Stats and contribution counts are adjusted by the difference between
+        # the states of the translations changed by saving, before and after.
+        changed = adding
+        previous: TranslationState | None = None
+        if not adding:
+            dirty = self.get_dirty_fields(check_relationship=True)
+            changed = failed_checks is not None or bool(
+                dirty.keys() & {"user", "date", *STATUS_FIELDS}
+            )
+            if changed:
+                errors, warnings = (
+                    Translation.objects.filter(pk=self.pk)
+                    .values_list(Exists(self.errors.all()), Exists(self.warnings.all()))
+                    .get()
+                )
+                previous = TranslationState(
+                    dirty.get("user", self.user_id),
+                    dirty.get("date", self.date),
+                    *(
+                        dirty.get(field, getattr(self, field))
+                        for field in STATUS_FIELDS
+                    ),
+                    errors,
+                    warnings,
+                )
 
         super().save(*args, **kwargs)
 
@@ -291,119 +385,204 @@ class Translation(DirtyFieldsMixin, models.Model):
 
         # Only one translation can be approved at a time for any
         # Entity/Locale.
+        rejected: list[TranslationState] = []
         if self.approved:
-            approved_translations = Translation.objects.filter(
-                entity=self.entity,
-                locale=self.locale,
+            rejected = self.reject_other_translations()
+            self.add_memory_entry(check_existing=not adding)
+
+            # Whenever a translation changes, mark the entity as having
+            # changed in the appropriate locale. We could be smarter about
+            # this but for now this is fine.
+            self.mark_changed()
+
+        if project.slug == "terminology":
+            self.entity.reset_term_translation(self.locale)
+
+        # Failed checks must be saved before stats are updated (bug 1521606)
+        if failed_checks is not None:
+            warnings, errors = save_failed_checks(self, failed_checks)
+            errors, warnings = bool(errors), bool(warnings)
+        elif previous is not None:
+            errors, warnings = previous.errors, previous.warnings
+        else:
+            errors, warnings = False, False
+
+        before = rejected + ([previous] if previous is not None else [])
+        after = [
+            state._replace(
+                approved=False, pretranslated=False, fuzzy=False, rejected=True
+            )
+            for state in rejected
+        ]
+        if changed:
+            after.append(
+                TranslationState(
+                    self.user_id,
+                    self.date,
+                    *(getattr(self, field) for field in STATUS_FIELDS),
+                    errors,
+                    warnings,
+                )
+            )
+
+        # The entity still has this translation in the locale
+        update_entity_statuses(
+            [(self.entity_id, self.locale_id)], translations_removed=False
+        )
+
+        def contributions(states: list[TranslationState]):
+            return sum_contributions(
+                (state.user_id, self.locale_id, project.pk, state.date)
+                + (state.approved, state.rejected)
+                for state in states
+            )
+
+        adjust_contribution_counts(contributions(before), contributions(after))
+
+        # Update stats AFTER changing approval status.
+        if before or after:
+            TranslatedResource.objects.adjust_stats(
+                self.entity.resource, self.locale, sum_stats(before), sum_stats(after)
+            )
+
+        # Update latest translation where necessary
+        self.update_latest_translation()
+
+    def reject_other_translations(self) -> list[TranslationState]:
+        """
+        Reject the other unrejected translations of the entity in the locale,
+        log the implicit rejections and remove their TM entries.
+
+        :returns: The states of the rejected translations before rejection.
+        """
+        from pontoon.base.models.translation_memory import TranslationMemoryEntry
+        from pontoon.checks.models import Error, Warning
+
+        rejected = list(
+            Translation.objects.filter(
+                entity_id=self.entity_id,
+                locale_id=self.locale_id,
                 rejected=False,
-            ).exclude(pk=self.pk)
+            )
+            .exclude(pk=self.pk)
+            .only("pk", "user", "date", *STATUS_FIELDS)
+            .annotate(
+                has_errors=Exists(Error.objects.filter(translation=OuterRef("pk"))),
+                has_warnings=Exists(Warning.objects.filter(translation=OuterRef("pk"))),
+            )
+        )
+        if not rejected:
+            return []
 
-            # Log that all those translations are rejected.
-            for t in approved_translations:
+        with buffered_actions():
+            for translation in rejected:
                 log_action(
                     ActionLog.ActionType.TRANSLATION_REJECTED,
                     self.approved_user or self.user,
-                    translation=t,
+                    translation=translation,
                     is_implicit_action=True,
                 )
 
-            # Remove any TM entries of old translations that will get rejected.
-            # Must be executed before translations set changes.
-            TranslationMemoryEntry.objects.filter(
-                translation__in=approved_translations
-            ).delete()
-
-            approved_translations.update(
-                approved=False,
-                approved_user=None,
-                approved_date=None,
-                rejected=True,
-                rejected_user=self.approved_user,
-                rejected_date=self.approved_date,
-                pretranslated=False,
-                fuzzy=False,
+        rejected_pks = [translation.pk for translation in rejected]
+        TranslationMemoryEntry.objects.filter(translation_id__in=rejected_pks).delete()
+
+        Translation.objects.filter(pk__in=rejected_pks).update(
+            approved=False,
+            approved_user=None,
+            approved_date=None,
+            rejected=True,
+            rejected_user=self.approved_user,
+            rejected_date=self.approved_date,
+            pretranslated=False,
+            fuzzy=False,
+        )
+
+        return [
+            TranslationState(
+                translation.user_id,
+                translation.date,
+                *(getattr(translation, field) for field in STATUS_FIELDS),
+                translation.has_errors,
+                translation.has_warnings,
             )
+            for translation in rejected
+        ]
 
-            if not self.memory_entries.exists():
-                TranslationMemoryEntry.objects.create(
-                    source=self.tm_source,
-                    target=self.tm_target,
-                    entity=self.entity,
-                    translation=self,
-                    locale=self.locale,
-                    project=project,
-                )
+    def add_memory_entry(self, check_existing=True):
+        """
+        Add this translation to the Translation Memory.
 
-        # Whenever a translation changes, mark the entity as having
-        # changed in the appropriate locale. We could be smarter about
-        # this but for now this is fine.
-        if self.approved:
-            self.mark_changed()
+        :arg bool check_existing:
+            Skip the translation if it already has a TM entry.
+            Translations that were just created have none.
+        """
+        from pontoon.base.models.translation_memory import TranslationMemoryEntry
 
-        if project.slug == "terminology":
-            self.entity.reset_term_translation(self.locale)
+        if check_existing and self.memory_entries.exists():
+            return
 
-        # We use get_or_create() instead of just get() to make it easier to test.
-        translatedresource, created = TranslatedResource.objects.get_or_create(
-            resource=self.entity.resource, locale=self.locale
+        TranslationMemoryEntry.objects.create(
+            source=self.tm_source,
+            target=self.tm_target,
+            entity=self.entity,
+            translation=self,
+            locale=self.locale,
+            project=self.entity.resource.project,
         )
 
-        # Update latest translation where necessary
-        self.update_latest_translation()
-
-        # Failed checks must be saved before stats are updated (bug 1521606)
-        if failed_checks is not None:
-            save_failed_checks(self, failed_checks)
-
-        # Update stats AFTER changing approval status.
-        # Use entity-scoped aggregate delta for performance. Fall back to a
-        # full resource recount on IntegrityError.
-        stats_after = self.entity.translation_set.filter(
-            locale=self.locale
-        ).aggregate_stats()
-        try:
-            with transaction.atomic():
-                translatedresource.adjust_stats(stats_before, stats_after, created)
-        except IntegrityError:
-            translatedresource.calculate_stats()
-
     def update_latest_translation(self):
         """
         Set `latest_translation` to this translation if its more recent than
-        the currently stored translation. Do this for all affected models.
+        the currently stored translation. Do this for all affected models,
+        with a single query.
         """
-        from pontoon.base.models.translated_resource import TranslatedResource
-
-        resource = self.entity.resource
-        project = resource.project
-        locale = self.locale
+        project = self.entity.resource.project
 
-        to_update = [
-            (TranslatedResource, Q(Q(resource=resource) & Q(locale=locale))),
-            (ProjectLocale, Q(Q(project=project) & Q(locale=locale))),
-            (Project, Q(pk=project.pk)),
+        targets = [
+            (
+                "base_translatedresource",
+                "resource_id = %(resource)s AND locale_id = %(locale)s",
+            ),
+            (
+                "base_projectlocale",
+                "project_id = %(project)s AND locale_id = %(locale)s",
+            ),
+            ("base_project", "id = %(project)s"),
         ]
-
         if not project.system_project:
-            to_update.append((Locale, Q(pk=locale.pk)))
-
-        for model, query in to_update:
-            model.objects.filter(
-                Q(
-                    query
-                    & Q(
-                        Q(latest_translation=None)
-                        | Q(latest_translation__date__lt=self.latest_activity["date"])
-                    )
+            targets.append(("base_locale", "id = %(locale)s"))
+
+        *ctes, last = (
+            f"""
+            UPDATE {table} obj SET latest_translation_id = %(translation)s
+            WHERE {condition} AND (
+                obj.latest_translation_id IS NULL
+                OR EXISTS (
+                    SELECT FROM base_translation latest
+                    WHERE latest.id = obj.latest_translation_id AND latest.date < %(date)s
                 )
-            ).update(latest_translation=self)
+            )
+            """
+            for table, condition in targets
+        )
+        ctes = ", ".join(f"update_{i} AS ({update})" for i, update in enumerate(ctes))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH {ctes} {last}",
+                {
+                    "translation": self.pk,
+                    "resource": self.entity.resource_id,
+                    "project": project.pk,
+                    "locale": self.locale_id,
+                    "date": self.latest_activity["date"],
+                },
+            )
 
     def approve(self, user):
         """
         Approve translation.
         """
-        from pontoon.base.models.translation_memory import TranslationMemoryEntry
-
         self.approved = True
         self.approved_user = user
         self.approved_date = timezone.now()
@@ -418,20 +597,9 @@ class Translation(DirtyFieldsMixin, models.Model):
         self.rejected_user = None
         self.rejected_date = None
 
+        # Also adds the translation to TM and marks the entity as changed
         self.save()
 
-        if not self.memory_entries.exists():
-            TranslationMemoryEntry.objects.create(
-                source=self.tm_source,
-                target=self.tm_target,
-                entity=self.entity,
-                translation=self,
-                locale=self.locale,
-                project=self.entity.resource.project,
-            )
-
-        self.mark_changed()
-
     def unapprove(self, user):
         """
         Unapprove translation.
@@ -501,6 +669,7 @@ class Translation(DirtyFieldsMixin, models.Model):
         if self.entity.resource.project.data_source == Project.DataSource.DATABASE:
             return
 
-        ChangedEntityLocale.objects.get_or_create(
-            entity=self.entity, locale=self.locale
+        ChangedEntityLocale.objects.bulk_create(
+            [ChangedEntityLocale(entity=self.entity, locale=self.locale)],
+            ignore_conflicts=True,
         )
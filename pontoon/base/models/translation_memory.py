@@ -2,6 +2,9 @@ from math import ceil, floor
 
 from rapidfuzz.distance.Indel import normalized_distance
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db import models
 from django.db.models import Case, ExpressionWrapper, F, Value, When
 from django.db.models.functions import Cast, Length, Substr
@@ -121,6 +124,38 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
         )
         return entries
 
+    def trigram_candidates(self, text, min_dist, max_dist, limit):
+        """
+        Narrow down TranslationMemory entries to the ones most similar to a text
+        string, so that the expensive Levenshtein ratio only needs to be calculated
+        for a limited number of candidates. `similarity` function and the `%`
+        operator are provided by `pg_trgm` module, and backed by a GIN index on
+        the `source` column.
+
+        Entries with a high Levenshtein ratio but a low trigram similarity are
+        left out, so the results may differ from ranking all entries.
+
+        :arg str text: reference string to search in Translation Memory
+        :arg int min_dist: minimum length distance from a text string
+        :arg int max_dist: maximum length distance from a text string
+        :arg int limit: maximum number of candidates to return
+        :return: TranslationMemory Entries limited to the candidates.
+        """
+        candidates = (
+            self.annotate(
+                source_length=Length(F("source")),
+                similarity=TrigramSimilarity("source", Value(text)),
+            )
+            .filter(
+                source__trigram_similar=text,
+                source_length__gte=min_dist,
+                source_length__lte=max_dist,
+            )
+            .order_by("-similarity", "pk")
+            .values("pk")[:limit]
+        )
+        return self.filter(pk__in=candidates)
+
     def minimum_levenshtein_ratio(self, text, min_quality=0.7):
         """
         Returns entries that match minimal levenshtein_ratio
@@ -130,10 +165,16 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
         min_dist = int(ceil(max(length * min_quality, 2)))
         max_dist = int(floor(min(length / min_quality, 1000)))
 
-        get_matches = self.postgres_levenshtein_ratio
+        entries = self
+        limit = settings.TRANSLATION_MEMORY_TRIGRAM_CANDIDATES
+
+        if limit:
+            entries = self.trigram_candidates(text, min_dist, max_dist, limit)
+
+        get_matches = entries.postgres_levenshtein_ratio
 
         if min_dist > 255 or max_dist > 255:
-            get_matches = self.python_levenshtein_ratio
+            get_matches = entries.python_levenshtein_ratio
 
         return get_matches(
             text,
@@ -159,3 +200,12 @@ class TranslationMemoryEntry(models.Model):
     )
 
     objects = TranslationMemoryEntryQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=["source"],
+                name="source_trigram_idx",
+                opclasses=["gin_trgm_ops"],
+            )
+        ]
@@ -166,6 +166,11 @@ class UserProfile(models.Model):
     # Used to keep track of the latest inactive reminder email sent.
     last_inactive_reminder_sent = models.DateTimeField(null=True, blank=True)
 
+    # Actions that count towards the Translation Champion and Review Master
+    # badges, updated when actions are logged (see `pontoon.base.badge_utils`).
+    badges_translation_count = models.PositiveIntegerField(default=0)
+    badges_review_count = models.PositiveIntegerField(default=0)
+
     # Used to mark users as system users.
     system_user = models.BooleanField(default=False)
 
@@ -9,11 +9,13 @@ from django.urls import reverse
 from pontoon.actionlog.models import ActionLog
 from pontoon.api.models import PersonalAccessToken
 from pontoon.base.models.comment import Comment
+from pontoon.base.models.contribution_count import ContributionCount
 from pontoon.base.models.locale import Locale, LocaleCodeHistory
 from pontoon.base.models.permission_changelog import PermissionChangelog
 from pontoon.base.models.project import Project, ProjectSlugHistory
 from pontoon.base.models.project_locale import ProjectLocale
 from pontoon.base.models.translation import Translation
+from pontoon.base.models.user_profile import UserProfile
 from pontoon.terminology.models import Term
 
 
@@ -94,10 +96,21 @@ def anonymize_user(user: User):
     )
 
     ActionLog.objects.filter(performed_by=user).update(performed_by=new_user)
+    badge_counts = (
+        UserProfile.objects.filter(user=user)
+        .values("badges_translation_count", "badges_review_count")
+        .first()
+    )
+    if badge_counts:
+        UserProfile.objects.filter(user=new_user).update(**badge_counts)
+        UserProfile.objects.filter(user=user).update(
+            badges_translation_count=0, badges_review_count=0
+        )
     PermissionChangelog.objects.filter(performed_by=user).update(performed_by=new_user)
     PermissionChangelog.objects.filter(performed_on=user).update(performed_on=new_user)
     Project.objects.filter(contact=user).update(contact=new_user)
     Translation.objects.filter(user=user).update(user=new_user)
+    ContributionCount.objects.filter(user=user).update(user=new_user)
     Translation.objects.filter(approved_user=user).update(approved_user=new_user)
     Translation.objects.filter(unapproved_user=user).update(unapproved_user=new_user)
     Translation.objects.filter(rejected_user=user).update(rejected_user=new_user)
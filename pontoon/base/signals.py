@@ -9,6 +9,9 @@ from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from pontoon.actionlog.models import ActionLog
+from pontoon.base.aggregated_stats import invalidate_stats
+from pontoon.base.badge_utils import update_badge_counts
 from pontoon.base.models import (
     Locale,
     LocaleCodeHistory,
@@ -19,6 +22,7 @@ from pontoon.base.models import (
     UserProfile,
 )
 from pontoon.messaging.emails import send_onboarding_email_1
+from pontoon.terminology.models import Term, TermTranslation, invalidate_term_matcher
 
 
 log = logging.getLogger(__name__)
@@ -31,6 +35,30 @@ def project_locale_removed(sender, **kwargs):
         TranslatedResource.objects.filter(
             resource__project=project_locale.project, locale=project_locale.locale
         ).delete()
+        invalidate_stats([(project_locale.project_id, project_locale.locale_id)])
+
+
+@receiver([post_save, post_delete], sender=Project)
+def project_changed(sender, **kwargs):
+    # Project flags filter the stats of all locales
+    invalidate_stats()
+
+
+@receiver(post_save, sender=TranslatedResource)
+def translated_resource_changed(sender, instance, **kwargs):
+    invalidate_stats([(instance.resource.project_id, instance.locale_id)])
+
+
+@receiver(post_delete, sender=ActionLog)
+def action_log_deleted(sender, instance, **kwargs):
+    # Also called for actions deleted with their translation or entity
+    update_badge_counts([instance], delta=-1)
+
+
+@receiver([post_save, post_delete], sender=Term)
+@receiver([post_save, post_delete], sender=TermTranslation)
+def terminology_changed(sender, **kwargs):
+    invalidate_term_matcher()
 
 
 def create_group(instance, group_name, perms, name_prefix):
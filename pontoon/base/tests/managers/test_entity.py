@@ -8,6 +8,7 @@ from pontoon.base.models import (
     TranslatedResource,
     Translation,
 )
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.test.factories import (
     EntityFactory,
     ErrorFactory,
@@ -147,6 +148,7 @@ def test_mgr_entity_filter_errors(admin, resource_a, locale_a):
 
     ErrorFactory.create(translation=translations[0])
     ErrorFactory.create(translation=translations[2])
+    update_entity_statuses()
 
     assert set(
         get_entities_for_project_locale(
@@ -179,6 +181,7 @@ def test_mgr_entity_filter_warnings(admin, resource_a, locale_a):
 
     WarningFactory.create(translation=translations[1])
     WarningFactory.create(translation=translations[2])
+    update_entity_statuses()
     TranslatedResource.objects.get(
         resource=translations[2].entity.resource,
         locale=translations[2].locale,
@@ -924,6 +927,17 @@ def test_mgr_entity_search_translation(entity_test_search):
     assert search("third translation") == [entities[2]]
 
 
+@pytest.mark.django_db
+def test_mgr_entity_search_single_query(entity_test_search, django_assert_num_queries):
+    """
+    Translation and source string matches are combined in a single query.
+    """
+    entities, search = entity_test_search
+
+    with django_assert_num_queries(1):
+        assert search("first") == [entities[i] for i in [0, 3, 4, 5]]
+
+
 @pytest.mark.django_db
 def test_lookup_collation(resource_a, locale_a):
     """
@@ -140,3 +140,52 @@ def test_levenshtein_ratio_python_with_too_long_string(tm_entry_long):
         (tm_entry_long.pk, tm_entry_long.source, tm_entry_long.target, 100),
     ]
     assert python_results == expected_results
+
+
+@pytest.mark.django_db
+@patch(
+    "pontoon.base.models.translation_memory.TranslationMemoryEntryQuerySet.trigram_candidates"
+)
+def test_levenshtein_ratio_without_trigram_candidates(
+    trigram_mock, settings, tm_entry_short
+):
+    settings.TRANSLATION_MEMORY_TRIGRAM_CANDIDATES = 0
+
+    TranslationMemoryEntry.objects.minimum_levenshtein_ratio(
+        tm_entry_short.source,
+    )
+
+    assert not trigram_mock.called
+
+
+@pytest.mark.django_db
+def test_levenshtein_ratio_trigram_candidates(settings):
+    """
+    Check if ranking trigram candidates returns the same results as ranking all entries.
+    """
+    sources = [
+        "Open a new window",
+        "Open a new private window",
+        "Open new window",
+        "Close window",
+        "Save page as",
+        "Open",
+    ]
+    for source in sources:
+        TranslationMemoryFactory.create(source=source)
+
+    def matches(text):
+        return sorted(
+            TranslationMemoryEntry.objects.minimum_levenshtein_ratio(text).values_list(
+                "source", "quality"
+            )
+        )
+
+    for text in ["Open a new window", "Open window", "Save the page as"]:
+        settings.TRANSLATION_MEMORY_TRIGRAM_CANDIDATES = 0
+        scan_results = matches(text)
+        settings.TRANSLATION_MEMORY_TRIGRAM_CANDIDATES = 500
+        trigram_results = matches(text)
+
+        assert scan_results
+        assert trigram_results == scan_results
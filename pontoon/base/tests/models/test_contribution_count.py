@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+
+from pontoon.base.models import ContributionCount, Translation
+from pontoon.base.models.contribution_count import (
+    adjust_contribution_counts,
+    calculate_contribution_counts,
+    count_contributions,
+)
+from pontoon.base.services import anonymize_user
+from pontoon.base.utils import aware_datetime
+from pontoon.test.factories import TranslationFactory
+
+
+def get_counts(user):
+    return sorted(
+        ContributionCount.objects.filter(user=user).values_list(
+            "month", "total", "approved", "rejected", "unreviewed"
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_contribution_counts_on_save(user_a, locale_a, entity_a):
+    """Saving a translation updates the contribution counts of its user."""
+    translation = TranslationFactory.create(
+        user=user_a, locale=locale_a, entity=entity_a, date=aware_datetime(2024, 3, 5)
+    )
+    (count,) = ContributionCount.objects.filter(user=user_a)
+    assert count.locale == locale_a
+    assert count.project == entity_a.resource.project
+    assert get_counts(user_a) == [(date(2024, 3, 1), 1, 0, 0, 1)]
+
+    TranslationFactory.create(
+        user=user_a, locale=locale_a, entity=entity_a, date=aware_datetime(2024, 4, 10)
+    )
+    translation.approved = True
+    translation.save()
+    assert get_counts(user_a) == [
+        (date(2024, 3, 1), 1, 1, 0, 0),
+        (date(2024, 4, 1), 1, 0, 1, 0),
+    ]
+
+
+@pytest.mark.django_db
+def test_adjust_contribution_counts(user_a, user_b, locale_a, entity_a):
+    TranslationFactory.create(user=user_a, locale=locale_a, entity=entity_a)
+    TranslationFactory.create(user=user_b, locale=locale_a, entity=entity_a)
+    pairs = [(entity_a.pk, locale_a.pk)]
+
+    before = count_contributions(pairs)
+    Translation.objects.filter(user=user_b).delete()
+    adjust_contribution_counts(before, count_contributions(pairs))
+
+    assert get_counts(user_a)[0][1:] == (1, 0, 0, 1)
+    assert get_counts(user_b)[0][1:] == (0, 0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_calculate_contribution_counts(user_a, user_b, locale_a, entity_a):
+    TranslationFactory.create(user=user_a, locale=locale_a, entity=entity_a)
+    TranslationFactory.create(
+        user=user_b, locale=locale_a, entity=entity_a, approved=True
+    )
+    counts = {user: get_counts(user) for user in (user_a, user_b)}
+    Translation.objects.filter(user=user_a).update(rejected=True)
+
+    calculate_contribution_counts()
+
+    assert get_counts(user_a) == [(*counts[user_a][0][:2], 0, 1, 0)]
+    assert get_counts(user_b) == counts[user_b]
+
+
+@pytest.mark.django_db
+def test_contribution_counts_anonymize_user(user_a, locale_a, entity_a):
+    TranslationFactory.create(
+        user=user_a, locale=locale_a, entity=entity_a, date=aware_datetime(2024, 3, 5)
+    )
+
+    anonymize_user(user_a)
+
+    assert get_counts(user_a) == []
+    new_user = Translation.objects.get(entity=entity_a).user
+    assert get_counts(new_user) == [(date(2024, 3, 1), 1, 0, 0, 1)]
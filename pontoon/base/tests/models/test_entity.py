@@ -3,6 +3,7 @@ import pytest
 from pontoon.base.get_entities import get_entities_for_project_locale
 from pontoon.base.map_entities import map_entities_to_json
 from pontoon.base.models import ChangedEntityLocale, Entity, Project
+from pontoon.base.models.entity import parse_source
 from pontoon.test.factories import (
     EntityFactory,
     ProjectLocaleFactory,
@@ -457,3 +458,25 @@ def test_entity_marked_changed_when_project_data_source_is_database(translation_
     assert ChangedEntityLocale.objects.count() == 0
     translation_a.mark_changed()
     assert ChangedEntityLocale.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_parse_source(entity_a):
+    calls = []
+
+    def parse(string):
+        calls.append(string)
+        if string.startswith("!"):
+            raise ValueError(string)
+        return string.upper()
+
+    assert parse_source(entity_a, parse) == "ENTITY A"
+    assert parse_source(Entity.objects.get(pk=entity_a.pk), parse) == "ENTITY A"
+    assert calls == ["entity a"]
+
+    # Changed source strings are parsed again
+    entity_a.string = "!changed"
+    for _ in range(2):
+        with pytest.raises(ValueError, match="!changed"):
+            parse_source(entity_a, parse)
+    assert calls == ["entity a", "!changed"]
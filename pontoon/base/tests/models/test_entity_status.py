@@ -0,0 +1,76 @@
+import pytest
+
+from pontoon.base.get_entities import get_mismatched_filters
+from pontoon.base.models import EntityLocaleStatus, Translation
+from pontoon.base.models.entity_status import update_entity_statuses
+from pontoon.test.factories import EntityFactory, ErrorFactory, TranslationFactory
+
+
+def get_status(entity, locale):
+    return EntityLocaleStatus.objects.get(entity=entity, locale=locale)
+
+
+@pytest.mark.django_db
+def test_entity_status_on_save(locale_a, entity_a):
+    """Saving a translation updates the status of its entity."""
+    assert not EntityLocaleStatus.objects.filter(entity=entity_a).exists()
+
+    translation = TranslationFactory.create(locale=locale_a, entity=entity_a)
+    status = get_status(entity_a, locale_a)
+    assert status.has_unreviewed
+    assert status.missing
+    assert not status.approved
+
+    translation.approved = True
+    translation.save()
+    status = get_status(entity_a, locale_a)
+    assert not status.has_unreviewed
+    assert not status.missing
+    assert status.approved
+
+
+@pytest.mark.django_db
+def test_update_entity_statuses(locale_a, locale_b, resource_a):
+    entities = [EntityFactory.create(resource=resource_a) for _ in range(3)]
+    translations = [
+        TranslationFactory.create(locale=locale, entity=entity, approved=True)
+        for entity in entities
+        for locale in (locale_a, locale_b)
+    ]
+    for translation in translations:
+        ErrorFactory.create(translation=translation)
+    Translation.objects.filter(entity=entities[2]).delete()
+
+    update_entity_statuses(
+        [(entities[0].pk, locale_a.pk), (entities[2].pk, locale_a.pk)]
+    )
+
+    assert get_status(entities[0], locale_a).has_errors
+    assert not get_status(entities[0], locale_a).approved
+    assert not get_status(entities[0], locale_b).has_errors
+    assert get_status(entities[0], locale_b).approved
+    assert not EntityLocaleStatus.objects.filter(
+        entity=entities[2], locale=locale_a
+    ).exists()
+    assert EntityLocaleStatus.objects.filter(
+        entity=entities[2], locale=locale_b
+    ).exists()
+
+    update_entity_statuses()
+
+    assert get_status(entities[0], locale_b).has_errors
+    assert not EntityLocaleStatus.objects.filter(entity=entities[2]).exists()
+
+
+@pytest.mark.django_db
+def test_get_mismatched_filters(locale_a, entity_a, django_assert_num_queries):
+    """Status filters of an entity are checked with a single query."""
+    TranslationFactory.create(locale=locale_a, entity=entity_a, fuzzy=True)
+
+    with django_assert_num_queries(1):
+        assert get_mismatched_filters(
+            entity_a.pk,
+            locale_a,
+            "missing,translated,unreviewed",
+            "fuzzy,rejected,missing-without-unreviewed",
+        ) == ["translated", "unreviewed", "rejected", "missing-without-unreviewed"]
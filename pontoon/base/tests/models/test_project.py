@@ -5,7 +5,13 @@ import pytest
 from django.contrib.auth.models import AnonymousUser
 
 from pontoon.base.models import Project
-from pontoon.test.factories import LocaleFactory, ProjectFactory, ProjectLocaleFactory
+from pontoon.test.factories import (
+    LocaleFactory,
+    ProjectFactory,
+    ProjectLocaleFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
 
 
 @pytest.mark.django_db
@@ -88,3 +94,78 @@ def test_project_visible_for_anonymous(public_project, private_project):
             pk__in=[public_project.pk, private_project.pk]
         )
     ) == [public_project]
+
+
+@pytest.mark.django_db
+def test_project_stats_cached(
+    project_a,
+    locale_a,
+    resource_a,
+    entity_a,
+    settings,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """
+    Aggregated stats are cached until the stats of a translated resource change.
+    """
+    settings.STATS_CACHE_TIMEOUT = 60
+    translated_resource = TranslatedResourceFactory.create(
+        resource=resource_a, locale=locale_a, total_strings=2, approved_strings=1
+    )
+    projects = Project.objects.filter(pk=project_a.pk)
+    assert projects.stats_data_as_dict()[project_a.pk]["approved"] == 1
+    assert Project.objects.get(pk=project_a.pk).approved_strings == 1
+
+    # Only the projects of the queryset are queried
+    with django_assert_num_queries(1):
+        assert projects.stats_data_as_dict()[project_a.pk]["approved"] == 1
+    with django_assert_num_queries(1):
+        assert Project.objects.get(pk=project_a.pk).approved_strings == 1
+
+    # The cache is invalidated once the transaction is committed
+    with django_capture_on_commit_callbacks(execute=True):
+        translated_resource.approved_strings = 2
+        translated_resource.save()
+        assert projects.stats_data_as_dict()[project_a.pk]["approved"] == 1
+    assert projects.stats_data_as_dict()[project_a.pk]["approved"] == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TranslationFactory.create(entity=entity_a, locale=locale_a, approved=True)
+    assert projects.stats_data_as_dict()[project_a.pk]["approved"] == 3
+    assert Project.objects.get(pk=project_a.pk).approved_strings == 3
+
+
+@pytest.mark.django_db
+def test_project_stats_cached_per_project(
+    project_a,
+    project_b,
+    locale_a,
+    resource_a,
+    resource_b,
+    settings,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """
+    Changing the stats of a project only discards its own cached stats.
+    """
+    settings.STATS_CACHE_TIMEOUT = 60
+    translated_resource = TranslatedResourceFactory.create(
+        resource=resource_a, locale=locale_a, total_strings=2, approved_strings=1
+    )
+    TranslatedResourceFactory.create(
+        resource=resource_b, locale=locale_a, total_strings=3, approved_strings=1
+    )
+    projects = Project.objects.filter(pk__in=[project_a.pk, project_b.pk])
+    assert projects.stats_data_as_dict()[project_a.pk]["approved"] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        translated_resource.approved_strings = 2
+        translated_resource.save()
+
+    # Only project_a is recalculated
+    with django_assert_num_queries(2):
+        stats = projects.stats_data_as_dict()
+    assert stats[project_a.pk]["approved"] == 2
+    assert stats[project_b.pk]["total"] == 3
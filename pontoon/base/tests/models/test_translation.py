@@ -2,7 +2,15 @@ from unittest.mock import call, patch
 
 import pytest
 
-from pontoon.base.models import Project, Translation, TranslationMemoryEntry
+from django.utils import timezone
+
+from pontoon.base.models import (
+    ChangedEntityLocale,
+    Project,
+    TranslatedResource,
+    Translation,
+    TranslationMemoryEntry,
+)
 from pontoon.base.utils import aware_datetime
 from pontoon.test.factories import (
     EntityFactory,
@@ -321,3 +329,130 @@ def test_machinery_sources_values(locale_a, entity_a):
     assert (
         translation.machinery_sources_values == "Translation Memory, Google Translate"
     )
+
+
+@pytest.mark.django_db
+def test_translation_bulk_mark_changed(
+    locale_a, locale_b, entity_a, entity_b, django_assert_num_queries
+):
+    """
+    Entities of translations are marked as changed, without changing the
+    existing marks or marking entities of database projects.
+    """
+    translations = [
+        TranslationFactory.create(locale=locale, entity=entity)
+        for entity in (entity_a, entity_b)
+        for locale in (locale_a, locale_a, locale_b)
+    ]
+    project_b = entity_b.resource.project
+    project_b.data_source = Project.DataSource.DATABASE
+    project_b.save()
+
+    ChangedEntityLocale.objects.all().delete()
+    ChangedEntityLocale.objects.create(
+        entity=entity_a, locale=locale_a, when=aware_datetime(1970, 1, 1)
+    )
+
+    with django_assert_num_queries(2):
+        Translation.objects.filter(
+            pk__in=[t.pk for t in translations]
+        ).bulk_mark_changed()
+
+    assert {
+        (changed.entity, changed.locale, changed.when.year)
+        for changed in ChangedEntityLocale.objects.all()
+    } == {
+        (entity_a, locale_a, 1970),
+        (entity_a, locale_b, timezone.now().year),
+    }
+
+
+@pytest.mark.django_db
+def test_translation_save_queries(
+    locale_a, entity_a, user_a, django_assert_num_queries
+):
+    """
+    Submitting a translation updates all denormalized data with a fixed
+    number of queries.
+    """
+    translation = TranslationFactory.build(
+        locale=locale_a, entity=entity_a, user=user_a
+    )
+
+    with django_assert_num_queries(7):
+        translation.save()
+
+    assert TranslatedResource.objects.get(
+        resource=entity_a.resource, locale=locale_a
+    ).stats_data() == {
+        "total": entity_a.resource.total_strings,
+        "approved": 0,
+        "pretranslated": 0,
+        "errors": 0,
+        "warnings": 0,
+        "unreviewed": 1,
+    }
+
+
+@pytest.mark.django_db
+def test_translation_save_stats(locale_a, entity_a, user_a, user_b):
+    """
+    The stats adjusted when saving translations match a full recount.
+    """
+    approved = TranslationFactory.create(
+        locale=locale_a, entity=entity_a, user=user_b, approved=True
+    )
+    suggestion = TranslationFactory.create(
+        locale=locale_a, entity=entity_a, user=user_a
+    )
+    suggestion.approved = True
+    suggestion.approved_user = user_b
+    suggestion.approved_date = timezone.now()
+    suggestion.save(failed_checks={"pWarnings": ["Warning"]})
+
+    approved.refresh_from_db()
+    assert approved.rejected
+    translated_resource = TranslatedResource.objects.get(
+        resource=entity_a.resource, locale=locale_a
+    )
+    stats = translated_resource.stats_data()
+    assert stats["warnings"] == 1
+    translated_resource.calculate_stats()
+    assert translated_resource.stats_data() == stats
+
+    suggestion.save(failed_checks={})
+    translated_resource.refresh_from_db()
+    stats = translated_resource.stats_data()
+    assert stats["approved"] == 1
+    translated_resource.calculate_stats()
+    assert translated_resource.stats_data() == stats
+
+
+@pytest.mark.django_db
+def test_translation_save_approved_queries(
+    locale_a, entity_a, user_a, user_b, django_assert_num_queries
+):
+    """
+    Submitting an approved translation rejects the other translations of
+    the entity with a fixed number of queries.
+    """
+    other = TranslationFactory.create(locale=locale_a, entity=entity_a, user=user_b)
+    translation = TranslationFactory.build(
+        locale=locale_a,
+        entity=entity_a,
+        user=user_a,
+        approved=True,
+        approved_user=user_a,
+        approved_date=timezone.now(),
+    )
+
+    with django_assert_num_queries(13):
+        translation.save()
+
+    other.refresh_from_db()
+    assert other.rejected
+    assert other.rejected_user == user_a
+    assert list(translation.memory_entries.values_list("target", flat=True)) == [
+        translation.string
+    ]
+    assert ChangedEntityLocale.objects.filter(entity=entity_a, locale=locale_a).exists()
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from pontoon.actionlog.models import ActionLog
+from pontoon.actionlog.utils import log_action
+from pontoon.base.badge_utils import (
+    badges_review_count,
+    badges_translation_count,
+    calculate_badge_counts,
+)
+from pontoon.base.models import Translation, UserProfile
+from pontoon.base.services import anonymize_user
+from pontoon.test.factories import TranslationFactory
+
+
+@pytest.mark.django_db
+def test_badge_counts_on_log_action(user_a, translation_a):
+    """Logged actions are added to the badge counters of their user."""
+    log_action(
+        ActionLog.ActionType.TRANSLATION_CREATED, user_a, translation=translation_a
+    )
+    log_action(
+        ActionLog.ActionType.TRANSLATION_APPROVED, user_a, translation=translation_a
+    )
+    log_action(
+        ActionLog.ActionType.TRANSLATION_REJECTED,
+        user_a,
+        translation=translation_a,
+        is_implicit_action=True,
+    )
+    log_action(
+        ActionLog.ActionType.TRANSLATION_UNAPPROVED, user_a, translation=translation_a
+    )
+
+    assert badges_translation_count(user_a) == 1
+    assert badges_review_count(user_a) == 1
+
+
+@pytest.mark.django_db
+def test_badge_counts_start_date(settings, user_a, translation_a):
+    settings.BADGES_START_DATE = datetime.now().astimezone() + timedelta(days=1)
+
+    log_action(
+        ActionLog.ActionType.TRANSLATION_CREATED, user_a, translation=translation_a
+    )
+
+    assert badges_translation_count(user_a) == 0
+
+
+@pytest.mark.django_db
+def test_calculate_badge_counts(user_a, user_b, translation_a):
+    log_action(
+        ActionLog.ActionType.TRANSLATION_CREATED, user_a, translation=translation_a
+    )
+    log_action(
+        ActionLog.ActionType.TRANSLATION_REJECTED, user_b, translation=translation_a
+    )
+    UserProfile.objects.update(badges_translation_count=7, badges_review_count=7)
+
+    calculate_badge_counts()
+
+    assert badges_translation_count(user_a) == 1
+    assert badges_review_count(user_a) == 0
+    assert badges_translation_count(user_b) == 0
+    assert badges_review_count(user_b) == 1
+
+
+@pytest.mark.django_db
+def test_badge_counts_on_delete(user_a, translation_a):
+    """Actions deleted with their translation are removed from the badge counters."""
+    translation = TranslationFactory.create(
+        entity=translation_a.entity, locale=translation_a.locale, user=user_a
+    )
+    for t in (translation_a, translation):
+        log_action(ActionLog.ActionType.TRANSLATION_CREATED, user_a, translation=t)
+    log_action(
+        ActionLog.ActionType.TRANSLATION_APPROVED, user_a, translation=translation
+    )
+    assert badges_translation_count(user_a) == 2
+    assert badges_review_count(user_a) == 1
+
+    Translation.objects.filter(pk=translation.pk).delete()
+
+    assert badges_translation_count(user_a) == 1
+    assert badges_review_count(user_a) == 0
+
+
+@pytest.mark.django_db
+def test_badge_counts_anonymize_user(user_a, translation_a):
+    log_action(
+        ActionLog.ActionType.TRANSLATION_CREATED, user_a, translation=translation_a
+    )
+    log_action(
+        ActionLog.ActionType.TRANSLATION_APPROVED, user_a, translation=translation_a
+    )
+
+    anonymize_user(user_a)
+
+    assert badges_translation_count(user_a) == 0
+    assert badges_review_count(user_a) == 0
+    new_user = ActionLog.objects.filter(translation=translation_a).first().performed_by
+    assert badges_translation_count(new_user) == 1
+    assert badges_review_count(new_user) == 1
@@ -54,6 +54,50 @@ def test_view_get_entities_paging(
     assert json.loads(response.content)["entities"][0]["pk"] == entities[-1].pk
 
 
+@pytest.mark.django_db
+def test_view_get_entities_cursor_paging(member, resource_a, locale_a):
+    """
+    With a cursor, pages are requested by the cursor returned for the previous page.
+    """
+    TranslatedResource.objects.create(resource=resource_a, locale=locale_a)
+    ProjectLocaleFactory.create(project=resource_a.project, locale=locale_a)
+    entities = EntityFactory.create_batch(size=3, resource=resource_a)
+
+    pks = []
+    cursor = ""
+    for _ in entities:
+        response = member.client.post(
+            "/get-entities/",
+            {
+                "project": resource_a.project.slug,
+                "locale": locale_a.code,
+                "paths[]": [resource_a.path],
+                "cursor": cursor,
+                "limit": 1,
+            },
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        assert response.status_code == 200
+        content = json.loads(response.content)
+        pks.extend(entity["pk"] for entity in content["entities"])
+        assert content["has_next"] is (content["next_cursor"] is not None)
+        cursor = content["next_cursor"]
+
+    assert pks == [entity.pk for entity in entities]
+    assert cursor is None
+
+    response = member.client.post(
+        "/get-entities/",
+        {
+            "project": resource_a.project.slug,
+            "locale": locale_a.code,
+            "cursor": "not a cursor",
+        },
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert response.status_code == 400
+
+
 @pytest.mark.django_db
 def test_entities_string_not_shown_if_not_matching_filters(member, entity_a, locale_a):
     """
@@ -14,7 +14,17 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import EmptyPage, Paginator
 from django.db import transaction
-from django.db.models import Count, F, Prefetch, Q, QuerySet
+from django.db.models import (
+    Count,
+    F,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce
 from django.http import (
     Http404,
     HttpRequest,
@@ -37,11 +47,13 @@ from pontoon.actionlog.utils import log_action
 from pontoon.base import forms, utils
 from pontoon.base.get_entities import (
     get_entities_for_project_locale,
+    get_entities_page,
     get_mismatched_filters,
 )
 from pontoon.base.map_entities import map_entities_to_json
 from pontoon.base.models import (
     Comment,
+    ContributionCount,
     Entity,
     Locale,
     Project,
@@ -71,7 +83,10 @@ from pontoon.base.user_utils import (
 )
 from pontoon.checks.libraries import run_checks
 from pontoon.checks.utils import are_blocking_checks
-from pontoon.contributors.utils import users_with_translations_counts
+from pontoon.contributors.utils import (
+    translation_stats,
+    users_with_translations_counts,
+)
 from pontoon.messaging.notifications import send_notification
 
 
@@ -202,7 +217,9 @@ def authors_and_time_range(request, locale, slug, part):
             "translation_count": user.translations_count,
             "role": user.user_role,
         }
-        for user in users_with_translations_counts(None, Q(id__in=translations))
+        for user in users_with_translations_counts(
+            user_stats=translation_stats(translations)
+        )
     ]
 
     counts_per_minute = [
@@ -259,16 +276,37 @@ def _get_paginated_entities(
     """Return a paginated list of entities.
 
     This is used by the regular mode of the Translate page.
+
+    If a `cursor` is given, keyset pagination is used,
+    and the response includes the `next_cursor` for the following page.
+    Otherwise, entities are paginated by `page` number.
     """
-    paginator = Paginator(entities, cleaned_data["limit"])
-    page_idx = cleaned_data["page"]
+    cursor = cleaned_data["cursor"]
+    next_cursor: str | None = None
+    if cursor is None:
+        paginator = Paginator(entities, cleaned_data["limit"])
+        page_idx = cleaned_data["page"]
 
-    try:
-        entities_page = paginator.page(page_idx)
-    except EmptyPage:
-        return JsonResponse({"has_next": False, "stats": {}})
+        try:
+            entities_page = paginator.page(page_idx)
+        except EmptyPage:
+            return JsonResponse({"has_next": False, "stats": {}})
+
+        is_first_page = page_idx == 1
+        page_entities = cast(QuerySet[Entity], entities_page.object_list)
+        has_next = entities_page.has_next()
+    else:
+        try:
+            page_entities, next_cursor = get_entities_page(
+                entities, cursor, cleaned_data["limit"]
+            )
+        except ValueError as error:
+            return JsonResponse({"status": False, "message": f"{error}"}, status=400)
 
-    requested_entity = cleaned_data["entity"] if page_idx == 1 else None
+        is_first_page = not cursor
+        has_next = next_cursor is not None
+
+    requested_entity = cleaned_data["entity"] if is_first_page else None
     requested_entity_location = None
     if requested_entity and not entities.filter(pk=requested_entity).exists():
         viewable = Q(
@@ -302,7 +340,6 @@ def _get_paginated_entities(
                 "filters": get_mismatched_filters(
                     requested_entity,
                     locale,
-                    project,
                     cleaned_data.get("status"),
                     cleaned_data.get("extra"),
                 ),
@@ -313,14 +350,16 @@ def _get_paginated_entities(
         "entities": map_entities_to_json(
             locale,
             preferred_source_locale,
-            cast(QuerySet[Entity], entities_page.object_list),
+            page_entities,
             requested_entity=requested_entity,
         ),
-        "has_next": entities_page.has_next(),
+        "has_next": has_next,
         "stats": TranslatedResource.objects.query_stats(
             project, cleaned_data["paths"], locale
         ),
     }
+    if cursor is not None:
+        response["next_cursor"] = next_cursor
     if requested_entity_location is not None:
         response["requested_entity"] = requested_entity_location
     return JsonResponse(response, safe=False)
@@ -922,6 +961,18 @@ def delete_comment(request):
     return JsonResponse({"status": True})
 
 
+def _user_contributions(**filters):
+    """Count the translations of each user matching `filters`, for annotating users."""
+    contributions = (
+        ContributionCount.objects.filter(user=OuterRef("pk"), **filters)
+        .order_by()
+        .values("user")
+        .annotate(total=Sum("total"))
+        .values("total")
+    )
+    return Coalesce(Subquery(contributions), 0)
+
+
 @utils.require_AJAX
 @login_required(redirect_field_name="", login_url="/403")
 def get_users(request):
@@ -946,13 +997,8 @@ def get_users(request):
             )
         )
         .annotate(
-            in_locale=Count(
-                "translation", filter=Q(translation__locale__code=locale_code)
-            ),
-            in_project=Count(
-                "translation",
-                filter=Q(translation__entity__resource__project__id=project_id),
-            ),
+            in_locale=_user_contributions(locale__code=locale_code),
+            in_project=_user_contributions(project_id=project_id),
         )
         .order_by("-in_locale", "-in_project", "first_name", "last_name")
     )
@@ -1,7 +1,9 @@
+from django.conf import settings
 from django.db.models import QuerySet
 from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog
+from pontoon.actionlog.utils import save_actions
 from pontoon.base.badge_utils import badges_review_level, badges_translation_level
 from pontoon.base.models import (
     Entity,
@@ -87,7 +89,7 @@ def approve_translations(user, locale: Locale, translations: TranslationQuerySet
         )
         for t in translations
     ]
-    ActionLog.objects.bulk_create(actions_to_log)
+    save_actions(actions_to_log, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
     # Send Review Master Badge notification information
     after_level = badges_review_level(user)
@@ -153,7 +155,7 @@ def reject_translations(user, locale: Locale, entities: QuerySet[Entity]):
         )
         for t in suggestions
     ]
-    ActionLog.objects.bulk_create(actions_to_log)
+    save_actions(actions_to_log, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
     # Send Review Master Badge notification information
     after_level = badges_review_level(user)
@@ -220,7 +222,7 @@ def replace_translations(
         )
         for t in old_translations
     ]
-    ActionLog.objects.bulk_create(actions_to_log)
+    save_actions(actions_to_log, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
     # Remove any TM entries of old translations that will get rejected.
     # Must be executed before translations set changes.
@@ -255,7 +257,7 @@ def replace_translations(
         )
         for t in changed_translations
     ]
-    ActionLog.objects.bulk_create(actions_to_log)
+    save_actions(actions_to_log, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
     # Send Translation Champion Badge notification information
     after_level = badges_translation_level(user)
@@ -376,7 +378,7 @@ def copy_translation_from_locale(
         )
         for t in changed_translations
     ]
-    ActionLog.objects.bulk_create(actions_to_log)
+    save_actions(actions_to_log, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
     # Send Translation Champion Badge notification information
     after_level = badges_translation_level(user)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 
 from fluent.syntax import (
     FluentParser,
@@ -98,8 +98,10 @@ def find_and_replace(
     translations = translations.for_checks(only_db_formats=False)
 
     for translation in translations:
-        # Cache the old value to identify changed translations
-        new_translation = deepcopy(translation)
+        # Cache the old value to identify changed translations.
+        # The copy shares related objects with the translation,
+        # including the references cached on its resource.
+        new_translation = copy(translation)
 
         res_format = translation.entity.resource.format
         if res_format == Resource.Format.FLUENT:
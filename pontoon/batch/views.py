@@ -15,6 +15,11 @@ from pontoon.base.models import (
     TranslatedResource,
     TranslationMemoryEntry,
 )
+from pontoon.base.models.contribution_count import (
+    adjust_contribution_counts,
+    count_contributions,
+)
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.base.models.translation import Translation, TranslationQuerySet
 from pontoon.base.services import readonly_exists
 from pontoon.base.user_utils import can_translate
@@ -102,6 +107,11 @@ def batch_edit_translations(request):
         Translation.objects.filter(active=True, locale=locale, entity__in=entities),
     )
 
+    pairs = [
+        (entity_pk, locale.pk) for entity_pk in entities.values_list("pk", flat=True)
+    ]
+    contributions_before = count_contributions(pairs)
+
     # Execute the actual action.
     match form.cleaned_data["action"]:
         case "approve":
@@ -139,6 +149,10 @@ def batch_edit_translations(request):
             }
         )
 
+    update_entity_statuses(
+        (entity.pk, locale.pk) for entity in action_status["changed_entities"]
+    )
+    adjust_contribution_counts(contributions_before, count_contributions(pairs))
     tr_pks = [tr.pk for tr in action_status["translated_resources"]]
     TranslatedResource.objects.filter(pk__in=tr_pks).calculate_stats()
 
@@ -3,6 +3,7 @@ from moz.l10n.formats.webext import webext_serialize_message
 from moz.l10n.model import CatchallKey, Pattern, PatternMessage, SelectMessage
 
 from pontoon.base.models import Entity, Resource
+from pontoon.base.models.entity import parse_source
 from pontoon.base.simple_preview import get_simple_preview
 
 from . import compare_locales, translate_toolkit
@@ -75,7 +76,7 @@ def run_checks(
             case (
                 Resource.Format.ANDROID | Resource.Format.XCODE | Resource.Format.XLIFF
             ):
-                src_msg = mf2_parse_message(entity.string)
+                src_msg = parse_source(entity, mf2_parse_message)
                 tgt_msg = mf2_parse_message(string)
                 src0 = get_simple_preview(res_format, src_msg)
                 if isinstance(src_msg, SelectMessage) and isinstance(
@@ -94,7 +95,7 @@ def run_checks(
                     tt_patterns.append((src0, get_simple_preview(res_format, tgt_msg)))
 
             case Resource.Format.GETTEXT:
-                src_msg = mf2_parse_message(entity.string)
+                src_msg = parse_source(entity, mf2_parse_message)
                 tgt_msg = mf2_parse_message(string)
                 if isinstance(src_msg, SelectMessage):
                     src0 = as_gettext(src_msg.variants[(CatchallKey(),)])
@@ -113,7 +114,7 @@ def run_checks(
                     )
 
             case Resource.Format.WEBEXT:
-                src_msg = mf2_parse_message(entity.string)
+                src_msg = parse_source(entity, mf2_parse_message)
                 tgt_msg = mf2_parse_message(string)
                 src_str, _ = webext_serialize_message(src_msg)
                 tgt_str, _ = webext_serialize_message(tgt_msg)
@@ -1,4 +1,5 @@
 from collections import namedtuple
+from collections.abc import Iterable
 
 from compare_locales.checks import getChecker
 from compare_locales.keyedtuple import KeyedTuple
@@ -8,7 +9,8 @@ from compare_locales.parser.fluent import FluentParser
 from compare_locales.parser.properties import PropertiesEntityMixin
 from compare_locales.paths import File
 
-from pontoon.base.models.entity import Entity
+from pontoon.base.models.entity import Entity, parse_source
+from pontoon.base.models.resource import Resource
 
 
 CommentEntity = namedtuple("Comment", ("all",))
@@ -65,6 +67,59 @@ class UnsupportedStringError(Exception):
     pass
 
 
+def parse_fluent_entity(string: str):
+    parser = FluentParser()
+    parser.readUnicode(string)
+    (entity,) = list(parser)
+    return entity
+
+
+def _as_reference(key: list[str], string: str, comment: str) -> CompareDTDEntity:
+    return CompareDTDEntity(key[0] if key else "", string, comment)
+
+
+def get_references(resource: Resource) -> KeyedTuple:
+    """
+    Return the entities of a resource, to be used as checker references.
+
+    Only the fields needed by checks are loaded. The result is stored on the
+    resource instance, which is shared by the translations of a batch loaded
+    with `TranslationQuerySet.for_checks()`.
+    """
+    references = resource.__dict__.get("_cl_references")
+    if references is None:
+        references = resource.__dict__["_cl_references"] = KeyedTuple(
+            _as_reference(*row)
+            for row in resource.entities.values_list("key", "string", "comment")
+        )
+    return references
+
+
+def prefetch_references(resources: Iterable[Resource]) -> None:
+    """
+    Load the references of many resources with a single query,
+    so that checks can be run on their entities without database access.
+
+    Only DTD checks need references.
+    """
+    pending = {
+        resource.pk: resource
+        for resource in resources
+        if resource.format == Resource.Format.DTD
+        and "_cl_references" not in resource.__dict__
+    }
+    if not pending:
+        return
+
+    references: dict[int, list[CompareDTDEntity]] = {pk: [] for pk in pending}
+    for resource_id, *row in Entity.objects.filter(resource__in=pending).values_list(
+        "resource", "key", "string", "comment"
+    ):
+        references[resource_id].append(_as_reference(*row))
+    for pk, resource in pending.items():
+        resource.__dict__["_cl_references"] = KeyedTuple(references[pk])
+
+
 def cast_to_compare_locales(format: str, entity: Entity, string: str):
     """
     Cast a Pontoon's translation object into Entities supported by `compare-locales`.
@@ -91,11 +146,9 @@ def cast_to_compare_locales(format: str, entity: Entity, string: str):
         )
 
     elif format == "fluent":
-        parser = FluentParser()
-
-        parser.readUnicode(entity.string)
-        (refEntity,) = list(parser)
+        refEntity = parse_source(entity, parse_fluent_entity)
 
+        parser = FluentParser()
         parser.readUnicode(string)
         trEntity = list(parser)[0] if list(parser) else None
 
@@ -143,15 +196,7 @@ def run_checks(entity, locale_code, string):
 
     # Currently, references are required only by DTD files but that may change in the future.
     if checker.needs_reference:
-        references = KeyedTuple(
-            CompareDTDEntity(
-                e.key[0] if e.key else "",
-                e.string,
-                e.comment,
-            )
-            for e in entity.resource.entities.all()
-        )
-        checker.set_reference(references)
+        checker.set_reference(get_references(entity.resource))
 
     errors = {}
 
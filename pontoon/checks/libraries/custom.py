@@ -16,6 +16,7 @@ from moz.l10n.model import (
 )
 
 from pontoon.base.models import Entity, Resource
+from pontoon.base.models.entity import parse_source
 from pontoon.base.simple_preview import get_simple_preview, preview_placeholder
 
 
@@ -69,7 +70,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
                 msg = None
                 errors.append(f"Parse error: {e}")
             try:
-                orig_msg = mf2_parse_message(entity.string)
+                orig_msg = parse_source(entity, mf2_parse_message)
             except ValueError as e:
                 orig_msg = None
                 warnings.append(f"Source parse error: {e}")
@@ -97,7 +98,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
 
             if isinstance(msg, SelectMessage):
                 try:
-                    orig_msg = mf2_parse_message(entity.string)
+                    orig_msg = parse_source(entity, mf2_parse_message)
                 except ValueError:
                     orig_msg = None
                 if not isinstance(orig_msg, SelectMessage):
@@ -110,7 +111,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
 
         case Resource.Format.FLUENT:
             translation_ast = parser.parse_entry(string)
-            entity_ast = parser.parse_entry(entity.string)
+            entity_ast = parse_source(entity, parser.parse_entry)
 
             # Parse error
             if isinstance(translation_ast, ast.Junk):
@@ -140,7 +141,7 @@ def run_custom_checks(entity: Entity, string: str) -> dict[str, list[str]]:
                 errors.append(f"Parse error: {e}")
             if isinstance(msg, PatternMessage):
                 try:
-                    orig_msg = mf2_parse_message(entity.string)
+                    orig_msg = parse_source(entity, mf2_parse_message)
                     _, placeholders = webext_serialize_message(orig_msg)
                 except ValueError:
                     placeholders = None
@@ -0,0 +1,87 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from pontoon.base.models import Entity, Project, Resource
+from pontoon.checks.libraries import run_checks
+
+
+STRINGS = {
+    Resource.Format.ANDROID: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.DTD: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.FLUENT: ("key = Hello, world!", "key = Bonjour, le monde !"),
+    Resource.Format.GETTEXT: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.INI: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.PLAIN_JSON: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.PROPERTIES: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.WEBEXT: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.XCODE: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.XLIFF: ("Hello, world!", "Bonjour, le monde !"),
+}
+
+EXTENSIONS = {
+    Resource.Format.ANDROID: "xml",
+    Resource.Format.FLUENT: "ftl",
+    Resource.Format.GETTEXT: "po",
+    Resource.Format.PLAIN_JSON: "json",
+    Resource.Format.WEBEXT: "json",
+    Resource.Format.XCODE: "xliff",
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = """
+        Measure the number of quality checks per second for each resource format,
+        with Translate Toolkit checks enabled.
+
+        A project with an entity of each format is stored in a transaction,
+        which is rolled back once the benchmark completes.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Number of checks per resource format (default: 200)",
+        )
+        parser.add_argument(
+            "--locale",
+            default="fr",
+            help="Code of the locale to run checks for (default: fr)",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        locale_code = options["locale"]
+
+        try:
+            with transaction.atomic():
+                project = Project.objects.create(
+                    name="Checks benchmark", slug="checks-benchmark"
+                )
+                for format, (source, translation) in STRINGS.items():
+                    resource = Resource.objects.create(
+                        project=project,
+                        path=f"file.{EXTENSIONS.get(format, format.value)}",
+                        format=format,
+                    )
+                    entity = Entity.objects.create(
+                        resource=resource, key=["key"], string=source
+                    )
+
+                    start = time.monotonic()
+                    for _ in range(iterations):
+                        run_checks(entity, locale_code, translation, use_tt_checks=True)
+                    elapsed = time.monotonic() - start
+
+                    self.stdout.write(f"{format}: {iterations / elapsed:.0f} checks/s")
+
+                raise Rollback()
+        except Rollback:
+            pass
@@ -22,6 +22,15 @@ class Command(BaseCommand):
             help="Number of translations to check in a single batch/Celery task",
         )
 
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            type=int,
+            default=None,
+            help="Run checks in this process, with a pool of worker processes, instead of in Celery tasks",
+        )
+
         parser.add_argument(
             "--with-disabled-projects",
             action="store_true",
@@ -53,8 +62,19 @@ class Command(BaseCommand):
             entity__resource__format__in=DB_FORMATS, **filter_qs
         ).values_list("pk", flat=True)
 
-        # Split translations into even batches and send them to Celery workers
+        # Split translations into even batches
         batch_size = int(options["batch_size"])
+        workers = options["workers"]
+        if workers:
+            # Celery workers can't start child processes, so the pool runs here
+            for i in range(0, len(translations_pks), batch_size):
+                check_translations.apply(
+                    args=(translations_pks[i : i + batch_size],),
+                    kwargs={"workers": workers},
+                )
+            return
+
+        # Send batches to Celery workers
         group(
             signature(check_translations, args=(translations_pks[i : i + batch_size],))
             for i in range(0, len(translations_pks), batch_size)
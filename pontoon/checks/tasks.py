@@ -5,6 +5,7 @@ from celery import shared_task
 from django.db import transaction
 
 from pontoon.base.models import Translation
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.checks.utils import bulk_run_checks
 
 
@@ -12,15 +13,19 @@ log = logging.getLogger(__name__)
 
 
 @shared_task(bind=True)
-def check_translations(self, translations_pks):
+def check_translations(self, translations_pks, workers=1):
     """
     Run checks on translations
     :arg list[int] translations_pks: list of primary keys for translations that should be processed
+    :arg int workers: number of processes to run the checks in
     """
     with transaction.atomic():
         translations = Translation.objects.for_checks().filter(pk__in=translations_pks)
 
-        warnings, errors = bulk_run_checks(translations)
+        warnings, errors = bulk_run_checks(translations, workers=workers)
+        update_entity_statuses(
+            translations.values_list("entity_id", "locale_id").iterator()
+        )
 
         log.info(
             f"Task: {self.request.id}, Processed items: {len(translations)}, Warnings: {len(warnings)}, Errors: {len(errors)}"
@@ -0,0 +1,153 @@
+"""
+Micro-benchmarks of the quality checks, run as part of the test suite.
+
+Run with `pytest -s pontoon/checks/tests/test_benchmark.py` to see the number
+of times a source string is parsed when checking its translations in many locales,
+and the cost of loading translations of a large resource for checks.
+
+The number of checks per second for each resource format is reported by the
+`benchmark_checks` management command.
+"""
+
+import time
+import tracemalloc
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from moz.l10n.formats.mf2 import mf2_parse_message
+
+from pontoon.base.models import Entity, Resource, Translation
+from pontoon.checks.libraries import run_checks
+from pontoon.checks.libraries.translate_toolkit import get_checker
+from pontoon.checks.utils import bulk_run_checks
+from pontoon.test.factories import EntityFactory, LocaleFactory, TranslationFactory
+
+
+ITERATIONS = 10
+
+LOCALES = 20
+
+RESOURCE_ENTITIES = 2000
+
+CHECKED_TRANSLATIONS = 200
+
+STRINGS = {
+    Resource.Format.ANDROID: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.DTD: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.FLUENT: ("key = Hello, world!", "key = Bonjour, le monde !"),
+    Resource.Format.GETTEXT: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.INI: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.PLAIN_JSON: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.PROPERTIES: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.WEBEXT: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.XCODE: ("Hello, world!", "Bonjour, le monde !"),
+    Resource.Format.XLIFF: ("Hello, world!", "Bonjour, le monde !"),
+}
+
+EXTENSIONS = {
+    Resource.Format.ANDROID: "xml",
+    Resource.Format.FLUENT: "ftl",
+    Resource.Format.GETTEXT: "po",
+    Resource.Format.PLAIN_JSON: "json",
+    Resource.Format.WEBEXT: "json",
+    Resource.Format.XCODE: "xliff",
+}
+
+
+@pytest.mark.parametrize("format", Resource.Format)
+def test_checker_reuse(format):
+    source, translation = STRINGS[format]
+
+    entity = MagicMock()
+    entity.resource.path = f"file.{EXTENSIONS.get(format, format.value)}"
+    entity.resource.format = format
+    entity.resource.allows_empty_translations = False
+    entity.resource.entities.values_list.return_value = []
+    entity.key = ["key"]
+    entity.string = source
+    entity.comment = ""
+
+    get_checker.cache_clear()
+    expected = run_checks(entity, "fr", translation, use_tt_checks=True)
+    for _ in range(ITERATIONS):
+        assert run_checks(entity, "fr", translation, use_tt_checks=True) == expected
+
+    # Translate Toolkit checks are not run on Fluent strings
+    misses = 0 if format == Resource.Format.FLUENT else 1
+    assert get_checker.cache_info().misses == misses
+
+
+@pytest.mark.django_db
+def test_source_parse_calls(resource_a):
+    resource_a.path = "strings.xml"
+    resource_a.format = Resource.Format.ANDROID
+    resource_a.save()
+    entity = EntityFactory.create(resource=resource_a, string="Hello, world!")
+    for i in range(LOCALES):
+        TranslationFactory.create(
+            entity=entity,
+            locale=LocaleFactory.create(code=f"bench-{i}"),
+            string="Bonjour, le monde !",
+        )
+    translations = Translation.objects.for_checks().filter(entity=entity)
+
+    with patch(
+        "pontoon.checks.libraries.custom.mf2_parse_message", wraps=mf2_parse_message
+    ) as parse:
+        bulk_run_checks(translations)
+
+    source_parses = sum(call.args == (entity.string,) for call in parse.call_args_list)
+    print(f"{LOCALES} locales: {source_parses} source parses, previously {LOCALES}")
+    assert source_parses == 1
+
+
+def load_for_checks(translations):
+    """
+    Run checks on translations, returning the peak memory in MB
+    and the time spent in milliseconds.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    bulk_run_checks(translations)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6, elapsed * 1000
+
+
+@pytest.mark.django_db
+def test_for_checks_memory(resource_a, locale_a):
+    resource_a.path = "strings.dtd"
+    resource_a.format = Resource.Format.DTD
+    resource_a.save()
+    entities = Entity.objects.bulk_create(
+        Entity(
+            resource=resource_a,
+            key=[f"key{i}"],
+            string=f"Hello, world! {i}",
+            value=[f"Hello, world! {i}"],
+            comment="A comment describing the string " * 4,
+        )
+        for i in range(RESOURCE_ENTITIES)
+    )
+    translations = Translation.objects.bulk_create(
+        Translation(entity=entity, locale=locale_a, string="Bonjour, le monde !")
+        for entity in entities[:CHECKED_TRANSLATIONS]
+    )
+    pks = [t.pk for t in translations]
+
+    before = load_for_checks(
+        Translation.objects.prefetch_related(
+            "entity__resource__entities", "locale"
+        ).filter(pk__in=pks)
+    )
+    after = load_for_checks(Translation.objects.for_checks().filter(pk__in=pks))
+
+    print(
+        f"{CHECKED_TRANSLATIONS} of {RESOURCE_ENTITIES} strings: "
+        f"{after[0]:.1f}MB peak memory, {after[1]:.0f}ms, "
+        f"previously {before[0]:.1f}MB, {before[1]:.0f}ms"
+    )
+    assert after[0] < before[0]
@@ -33,18 +33,10 @@ def mock_entity(
             ext = format
     entity.resource.path = f"resource1.{ext}"
     entity.comment = ""
-    res_entities = []
-
-    for res_entity in resource_entities or []:
-        res_mock_entity = MagicMock()
-        res_mock_entity.comment = ""
-
-        for k, v in res_entity.items():
-            setattr(res_mock_entity, k, v)
-
-        res_entities.append(res_mock_entity)
-
-    entity.resource.entities.all.return_value = res_entities
+    entity.resource.entities.values_list.return_value = [
+        (res_entity["key"], res_entity["string"], res_entity.get("comment", ""))
+        for res_entity in resource_entities or []
+    ]
 
     for k, v in entity_data.items():
         setattr(entity, k, v)
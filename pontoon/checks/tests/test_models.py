@@ -1,5 +1,8 @@
 import pytest
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from pontoon.base.models import Resource, Translation
 from pontoon.checks.models import (
     Error,
@@ -11,6 +14,7 @@ from pontoon.checks.utils import (
     get_failed_checks_db_objects,
     save_failed_checks,
 )
+from pontoon.test.factories import EntityFactory, TranslationFactory
 
 
 @pytest.fixture()
@@ -146,6 +150,102 @@ def test_bulk_run_checks(
     assert p_error.translation == translation_pontoon_error
 
 
+@pytest.mark.django_db
+def test_bulk_run_checks_unchanged(
+    translation_compare_locales_warning,
+    translation_pontoon_error,
+):
+    """
+    Failed checks that still apply are kept, the others are removed.
+    """
+    translations = [translation_compare_locales_warning, translation_pontoon_error]
+    bulk_run_checks(translations)
+    (cl_warning,) = Warning.objects.filter(
+        translation=translation_compare_locales_warning
+    )
+    (p_error,) = Error.objects.filter(translation=translation_pontoon_error)
+
+    Error.objects.create(
+        translation=translation_compare_locales_warning,
+        library=FailedCheck.Library.PONTOON,
+        message="Stale error",
+    )
+    warnings, errors = bulk_run_checks(translations)
+
+    assert [w.pk for w in warnings] == [cl_warning.pk]
+    assert [e.pk for e in errors] == [p_error.pk]
+    assert list(Warning.objects.filter(translation__in=translations)) == [cl_warning]
+    assert list(Error.objects.filter(translation__in=translations)) == [p_error]
+
+
+@pytest.mark.django_db
+def test_bulk_run_checks_workers(
+    translation_compare_locales_warning,
+    translation_compare_locales_error,
+    translation_pontoon_error,
+):
+    translations = [
+        translation_compare_locales_warning,
+        translation_compare_locales_error,
+        translation_pontoon_error,
+    ]
+    # Worker processes don't access the database
+    for translation in translations:
+        translation.entity.resource, translation.locale
+
+    warnings, errors = bulk_run_checks(translations, workers=2)
+
+    assert sorted((w.translation_id, w.message) for w in warnings) == [
+        (translation_compare_locales_warning.pk, "unknown escape sequence, \\q"),
+    ]
+    assert sorted((e.translation_id, e.message) for e in errors) == [
+        (translation_compare_locales_error.pk, "Found single %"),
+        (translation_pontoon_error.pk, "Empty translations are not allowed"),
+    ]
+    assert Warning.objects.filter(translation__in=translations).count() == 1
+    assert Error.objects.filter(translation__in=translations).count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_run_checks_references(resource_a, locale_a):
+    """
+    Other entities of a DTD resource are loaded once per batch,
+    with only the fields used by checks.
+    """
+    resource_a.path = "test.dtd"
+    resource_a.format = Resource.Format.DTD
+    resource_a.save()
+    EntityFactory.create(resource=resource_a, key=["brandName"], string="Firefox")
+    translations = [
+        TranslationFactory.create(
+            entity=EntityFactory.create(
+                resource=resource_a, key=[f"key{i}"], string="&brandName; test"
+            ),
+            locale=locale_a,
+            string=string,
+        )
+        for i, string in enumerate(
+            ["&brandName; essai", "&unknownName; essai", "&brandName; essai"]
+        )
+    ]
+    pks = [t.pk for t in translations]
+
+    warnings, errors = bulk_run_checks(
+        Translation.objects.for_checks().filter(pk__in=pks)
+    )
+
+    (warning,) = warnings
+    assert warning.translation_id == translations[1].pk
+    assert warning.message.startswith("Referencing unknown entity `unknownName`")
+    assert errors == []
+
+    with CaptureQueriesContext(connection) as single:
+        bulk_run_checks(Translation.objects.for_checks().filter(pk=pks[0]))
+    with CaptureQueriesContext(connection) as batch:
+        bulk_run_checks(Translation.objects.for_checks().filter(pk__in=pks))
+    assert len(batch) == len(single)
+
+
 @pytest.mark.django_db
 def test_get_failed_checks_db_objects(translation_a):
     """
@@ -1,6 +1,6 @@
 import pytest
 
-from pontoon.checks.libraries.translate_toolkit import run_checks
+from pontoon.checks.libraries.translate_toolkit import get_checker, run_checks
 
 
 @pytest.fixture()
@@ -40,3 +40,17 @@ def test_tt_correct_translation(mock_locale):
     Quality check should return empty dictionary if everything is okay (no warnings).
     """
     assert run_checks("Original string", "Translation string", mock_locale) == {}
+
+
+def test_tt_checker_reused(mock_locale):
+    """
+    Checkers are reused for the same locale and disabled checks.
+    """
+    get_checker.cache_clear()
+
+    run_checks("Original string", "Translation \\q", mock_locale, ["escapes"])
+    run_checks("Original string", "Translation", mock_locale, {"escapes"})
+    run_checks("Original string", "Translation", mock_locale)
+
+    assert get_checker.cache_info().currsize == 2
+    assert get_checker.cache_info().hits == 1
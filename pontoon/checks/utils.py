@@ -1,44 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from multiprocessing import get_context
+
+from django.db import connections
+
 from pontoon.checks import DB_LIBRARIES
 
 
-def bulk_run_checks(translations):
+# Database connections inherited by worker processes
+_inherited_connections = []
+
+
+def _init_worker():
+    """
+    Keep the database connections inherited from the parent process open,
+    as closing them would also close them in the parent, but never use them.
+    """
+    for conn in connections.all(initialized_only=True):
+        _inherited_connections.append(conn.connection)
+        conn.connection = None
+
+
+def _run_checks_chunk(translations):
+    """
+    Run checks on a chunk of translations, without accessing the database.
+
+    :return: dict of failed checks by translation primary key
+    """
+    from pontoon.checks.libraries import run_checks
+
+    return {
+        translation.pk: run_checks(
+            translation.entity,
+            translation.locale.code,
+            translation.string,
+            use_tt_checks=False,
+        )
+        for translation in translations
+    }
+
+
+def _chunks(translations, count):
+    """
+    Split translations into at most `count` chunks, keeping translations
+    of the same entity together so that its parsed source is reused.
+    """
+    by_entity = {}
+    for translation in translations:
+        by_entity.setdefault(translation.entity_id, []).append(translation)
+
+    chunk_size = ceil(len(translations) / count)
+    chunks = [[]]
+    for entity_translations in by_entity.values():
+        if len(chunks[-1]) >= chunk_size:
+            chunks.append([])
+        chunks[-1].extend(entity_translations)
+    return chunks
+
+
+def bulk_run_checks(translations, workers=1):
     """
     Run checks on a list of translations
 
+    Only the failed checks that changed are removed or inserted,
+    warnings and errors that still apply are kept as they are.
+
     *Important*
-    To avoid performance problems, translations have to prefetch entities and locales objects.
+    To avoid performance problems, translations have to prefetch entities and locales objects,
+    see `TranslationQuerySet.for_checks()`.
+
+    :arg int workers: number of processes to run the checks in.
+        Checks are run in the current process by default. Worker processes
+        do not access the database, so all related objects must be prefetched.
     """
-    from pontoon.checks.libraries import run_checks
+    from pontoon.checks.libraries.compare_locales import prefetch_references
     from pontoon.checks.models import Error, Warning
 
-    warnings, errors = [], []
+    translations = list(translations)
     if not translations:
         return
 
+    prefetch_references({t.entity.resource for t in translations})
+
+    if workers > 1 and len(translations) > 1:
+        chunks = _chunks(translations, workers)
+        with ProcessPoolExecutor(
+            len(chunks), mp_context=get_context("fork"), initializer=_init_worker
+        ) as pool:
+            failed_checks = {}
+            for result in pool.map(_run_checks_chunk, chunks):
+                failed_checks.update(result)
+    else:
+        failed_checks = _run_checks_chunk(translations)
+
+    warnings, errors = [], []
     for translation in translations:
         warnings_, errors_ = get_failed_checks_db_objects(
-            translation,
-            run_checks(
-                translation.entity,
-                translation.locale.code,
-                translation.string,
-                use_tt_checks=False,
-            ),
+            translation, failed_checks[translation.pk]
         )
         warnings.extend(warnings_)
         errors.extend(errors_)
 
-    # Remove old warnings and errors
-    Warning.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
-    Error.objects.filter(translation__pk__in=[t.pk for t in translations]).delete()
-
-    # Insert new warnings and errors
-    Warning.objects.bulk_create(warnings)
-    Error.objects.bulk_create(errors)
+    translation_pks = [t.pk for t in translations]
+    _update_failed_checks(Warning, warnings, translation_pks)
+    _update_failed_checks(Error, errors, translation_pks)
 
     return warnings, errors
 
 
+def _update_failed_checks(model, failed_checks, translation_pks):
+    """
+    Replace the stored failed checks of translations with `failed_checks`,
+    only deleting and inserting the rows that differ.
+    """
+    existing = {
+        (translation_id, library, message): pk
+        for pk, translation_id, library, message in model.objects.filter(
+            translation__pk__in=translation_pks
+        ).values_list("pk", "translation_id", "library", "message")
+    }
+
+    new = []
+    for failed_check in failed_checks:
+        key = (failed_check.translation_id, failed_check.library, failed_check.message)
+        pk = existing.pop(key, None)
+        if pk is None:
+            new.append(failed_check)
+        else:
+            failed_check.pk = pk
+
+    # Remaining rows are no longer failing
+    if existing:
+        model.objects.filter(pk__in=existing.values()).delete()
+
+    model.objects.bulk_create(new)
+
+
 def get_failed_checks_db_objects(translation, failed_checks):
     """
     Return model instances of Warnings and Errors
@@ -79,6 +176,7 @@ def save_failed_checks(translation, failed_checks):
     Save all failed checks to Database
     :arg Translation translation: instance of translation
     :arg dict failed_checks: dictionary with failed checks
+    :returns: tuple of the saved warnings and errors
     """
     warnings, errors = get_failed_checks_db_objects(translation, failed_checks)
 
@@ -88,6 +186,8 @@ def save_failed_checks(translation, failed_checks):
     translation.warnings.bulk_create(warnings)
     translation.errors.bulk_create(errors)
 
+    return warnings, errors
+
 
 def are_blocking_checks(checks, ignore_warnings):
     """
@@ -15,6 +15,7 @@ from django.db.models import (
     F,
     Prefetch,
     Q,
+    Sum,
 )
 from django.db.models.functions import TruncDay, TruncMonth
 from django.template.defaultfilters import pluralize
@@ -23,6 +24,7 @@ from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog, ActionLogQuerySet
 from pontoon.base.models import (
+    ContributionCount,
     Locale,
     Translation,
     User,
@@ -33,33 +35,66 @@ from pontoon.base.user_utils import user_locale_role, user_role
 from pontoon.base.utils import convert_to_unix_time
 
 
-def users_with_translations_counts(
-    start_date=None, query_filters=None, locale=None, limit=None
-):
+def _empty_stats():
+    return {
+        "total": 0,
+        "approved": 0,
+        "unreviewed": 0,
+        "rejected": 0,
+    }
+
+
+def contribution_stats(start_date=None, query_filters=None):
     """
-    Returns contributors list, sorted by count of their translations. Every user instance has
-    the following properties:
-    * translations_count
-    * translations_approved_count
-    * translations_rejected_count
-    * translations_unapproved_count
-    * user_role
+    Return translation counts by user and review status, read from the
+    contribution counts. Translations submitted in the month of `start_date`
+    are counted from the Translation table, to only include those submitted
+    after it.
 
-    All counts will be returned from start_date to now().
-    :param date start_date: start date for translations.
-    :param django.db.models.Q query_filters: filters contributors by given query_filters.
-    :param pontoon.base.models.Locale locale: used to determine user locale role.
-    :param int limit: limit results to this number.
+    :param datetime start_date: start date for translations.
+    :param django.db.models.Q query_filters: filters on the fields of ContributionCount.
     """
-    # Collect data for faster user stats calculation.
-    user_stats = {}
-    translations = Translation.objects.all()
+    counts = ContributionCount.objects.all()
+    translations = None
 
     if start_date:
-        translations = translations.filter(date__gte=start_date)
+        month = start_date.astimezone(datetime.UTC).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        next_month = month + relativedelta(months=1)
+        counts = counts.filter(month__gte=next_month.date())
+        # Translations have no `project` field to filter by
+        translations = Translation.objects.alias(
+            project=F("entity__resource__project")
+        ).filter(user__isnull=False, date__gte=start_date, date__lt=next_month)
 
     if query_filters:
-        translations = translations.filter(query_filters)
+        counts = counts.filter(query_filters)
+        if translations is not None:
+            translations = translations.filter(query_filters)
+
+    user_stats = translation_stats(translations) if translations is not None else {}
+    counts = counts.values("user").annotate(
+        total=Sum("total"),
+        approved=Sum("approved"),
+        rejected=Sum("rejected"),
+        unreviewed=Sum("unreviewed"),
+    )
+    for count in counts:
+        stats = user_stats.setdefault(count["user"], _empty_stats())
+        for key in stats:
+            stats[key] += count[key]
+
+    return user_stats
+
+
+def translation_stats(translations):
+    """
+    Return translation counts by user and review status.
+
+    :param QuerySet translations: the translations to count.
+    """
+    user_stats = {}
 
     # Count('user') returns 0 if the user is None.
     # See https://docs.djangoproject.com/en/1.11/topics/db/aggregation/#values.
@@ -78,16 +113,36 @@ def users_with_translations_counts(
         else:
             status = "unreviewed"
 
-        if user not in user_stats:
-            user_stats[user] = {
-                "total": 0,
-                "approved": 0,
-                "unreviewed": 0,
-                "rejected": 0,
-            }
+        stats = user_stats.setdefault(user, _empty_stats())
+        stats["total"] += count
+        stats[status] += count
+
+    return user_stats
 
-        user_stats[user]["total"] += count
-        user_stats[user][status] += count
+
+def users_with_translations_counts(
+    start_date=None, query_filters=None, locale=None, limit=None, user_stats=None
+):
+    """
+    Returns contributors list, sorted by count of their translations. Every user instance has
+    the following properties:
+    * translations_count
+    * translations_approved_count
+    * translations_rejected_count
+    * translations_unapproved_count
+    * user_role
+
+    All counts will be returned from start_date to now().
+    :param date start_date: start date for translations.
+    :param django.db.models.Q query_filters: filters contributors by given query_filters,
+        on the fields of ContributionCount.
+    :param pontoon.base.models.Locale locale: used to determine user locale role.
+    :param int limit: limit results to this number.
+    :param dict user_stats: counts to use instead of the contribution counts,
+        as returned by `translation_stats()`.
+    """
+    if user_stats is None:
+        user_stats = contribution_stats(start_date, query_filters)
 
     # Collect data for faster user role detection.
     managers = defaultdict(set)
@@ -1,3 +1,4 @@
+from django.contrib.postgres.lookups import TrigramSimilar
 from django.db.models import Func
 from django.db.models.lookups import (
     Field,
@@ -60,3 +61,7 @@ class IContainsCollate(IContains):
 
 
 Field.register_lookup(IContainsCollate, lookup_name="icontains_collate")
+
+# The `django.contrib.postgres` app isn't installed, so the lookup backed by the
+# `pg_trgm` module needs to be registered explicitly.
+Field.register_lookup(TrigramSimilar)
@@ -1,11 +1,33 @@
-from django.core.management.base import BaseCommand
+from datetime import UTC, date, datetime, time
 
-from pontoon.insights.tasks import collect_insights
+from django.core.management.base import BaseCommand, CommandError
+
+from pontoon.insights.tasks import backfill_insights, collect_insights
 
 
 class Command(BaseCommand):
     help = "Collect data needed for the Insights tab"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            type=date.fromisoformat,
+            help="Backfill snapshots from this date (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--to",
+            dest="date_to",
+            type=date.fromisoformat,
+            help="Backfill snapshots up to this date (YYYY-MM-DD), defaults to today",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes used to calculate chrF++ scores when backfilling",
+        )
+
     def handle(self, *args, **options):
         """
         The Insights tab in the dashboard presents data that cannot be retrieved from
@@ -17,5 +39,22 @@ class Command(BaseCommand):
         a (previous) day, whereas completion data (stats) is collected as the current
         snapshot. Hence, it's important that the time of taking the snapshot is as close
         to the activity period as possible.
+
+        With `--from`, snapshots of a range of days are backfilled in this process.
         """
-        collect_insights.delay()
+        date_from = options["date_from"]
+        if date_from is None:
+            if options["date_to"] is not None:
+                raise CommandError("--to requires --from")
+            collect_insights.delay()
+            return
+
+        date_to = options["date_to"] or date.today()
+        if date_to < date_from:
+            raise CommandError("--to must not be before --from")
+
+        backfill_insights(
+            datetime.combine(date_from, time(), tzinfo=UTC),
+            datetime.combine(date_to, time(), tzinfo=UTC),
+            workers=options["workers"],
+        )
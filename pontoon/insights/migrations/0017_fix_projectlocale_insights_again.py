@@ -3,7 +3,7 @@ from statistics import mean
 
 from django.db import migrations
 
-from pontoon.insights.tasks import count_activities
+from pontoon.insights.migrations._frozen_insights import count_activities
 
 
 def fix_sync_user(apps, schema_editor):
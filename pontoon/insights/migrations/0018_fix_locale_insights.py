@@ -2,7 +2,7 @@ from datetime import UTC, date, datetime, time, timedelta
 
 from django.db import migrations
 
-from pontoon.insights.tasks import (
+from pontoon.insights.migrations._frozen_insights import (
     count_activities,
     count_created_entities,
     count_projectlocale_stats,
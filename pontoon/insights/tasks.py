@@ -1,9 +1,12 @@
 import logging
 
+from bisect import bisect_left
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from itertools import groupby
+from multiprocessing import get_context
 from statistics import mean
 from typing import Any
 
@@ -11,8 +14,8 @@ from celery import shared_task
 from dateutil.relativedelta import relativedelta
 from sacrebleu.metrics import CHRF
 
-from django.db.models import Avg, Count, F, Sum
-from django.db.models.functions import Extract, Now
+from django.db.models import Avg, Count, DateTimeField, F, Q, Sum, Value
+from django.db.models.functions import Ceil, Extract, Now
 from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog
@@ -39,22 +42,61 @@ from pontoon.insights.models import (
 chrfpp = CHRF(word_order=2)
 log = logging.getLogger(__name__)
 
+DAY_SECONDS = 24 * 60 * 60
+
+# Number of chrF++ scores calculated by a worker process at a time
+CHRF_CHUNK_SIZE = 1000
+
 
 @dataclass
 class Activity:
+    """
+    Translation and review activity in a projectlocale on a day.
+
+    Counts are of distinct translations, except for the review times,
+    which are summed over review actions.
+    """
+
     locale: int
-    human_translations: set[int] = field(default_factory=set)
-    machinery_translations: set[int] = field(default_factory=set)
-    new_suggestions: set[int] = field(default_factory=set)
-    peer_approved: set[int] = field(default_factory=set)
-    self_approved: set[int] = field(default_factory=set)
-    rejected: set[int] = field(default_factory=set)
+    human_translations: int = 0
+    machinery_translations: int = 0
+    new_suggestions: int = 0
+    peer_approved: int = 0
+    self_approved: int = 0
+    rejected: int = 0
     pretranslations_chrf_scores: list[float] = field(default_factory=list)
-    pretranslations_approved: set[int] = field(default_factory=set)
-    pretranslations_rejected: set[int] = field(default_factory=set)
-    pretranslations_new: set[int] = field(default_factory=set)
-    times_to_review_suggestions: list[timedelta] = field(default_factory=list)
-    times_to_review_pretranslations: list[timedelta] = field(default_factory=list)
+    pretranslations_approved: int = 0
+    pretranslations_rejected: int = 0
+    pretranslations_new: int = 0
+    suggestion_reviews: int = 0
+    suggestion_review_time: timedelta = timedelta()
+    pretranslation_reviews: int = 0
+    pretranslation_review_time: timedelta = timedelta()
+
+
+@dataclass
+class LocaleData:
+    """
+    Data of each locale needed for the locale insights of any day up to `dt_max`.
+    """
+
+    privileged_users: dict[int, tuple[dict[int, datetime], set[int]]]
+    contributors: dict[int, set[int]]
+    active_users_actions: dict[int, list[dict[str, Any]]]
+    suggestion_ages: dict[int, timedelta]
+
+    @classmethod
+    def collect(cls, dt_max: datetime, dt_min: datetime | None = None):
+        """
+        Gather the data for the day ending at `dt_max`,
+        or for each day from `dt_min` to `dt_max`.
+        """
+        return cls(
+            privileged_users=get_privileged_users(),
+            contributors=get_contributors(),
+            active_users_actions=get_active_users_actions(dt_max, dt_min),
+            suggestion_ages=get_average_suggestion_ages(),
+        )
 
 
 @shared_task(bind=True)
@@ -69,10 +111,55 @@ def collect_insights(self, dt_max: datetime | None = None):
     log.info(f"Collect insights for {date}: Begin.")
 
     activities = count_activities(dt_max)
-    new_entities = count_created_entities(dt_max)
-    pl_stats = count_projectlocale_stats()
+    pl_stats = list(count_projectlocale_stats())
     log.info(f"Collect insights for {date}: Common data gathered.")
 
+    store_insights(dt_max, activities, pl_stats)
+
+
+def backfill_insights(dt_min: datetime, dt_max: datetime, workers: int = 1):
+    """
+    Gather data needed for the Insights tab for each day from `dt_min`
+    to `dt_max`, and store it in the DB.
+
+    The activity of all days is collected in a single pass over the actions,
+    and the actions needed for the active users of all days in another one.
+    Stats, privileged users, contributors and suggestion ages are those of
+    the current state, as in daily snapshots.
+    Days that already have snapshots are skipped.
+
+    :arg int workers: number of processes used to calculate chrF++ scores.
+    """
+    log.info(f"Backfill insights from {dt_min.date()} to {dt_max.date()}: Begin.")
+
+    days = (dt_max - dt_min).days
+    activities = count_activities_range(dt_max, days + 1, workers)
+    pl_stats = list(count_projectlocale_stats())
+    locale_data = LocaleData.collect(dt_max, dt_min)
+    log.info(f"Backfill insights: Activity of {days + 1} days gathered.")
+
+    existing = set(
+        LocaleInsightsSnapshot.objects.filter(
+            created_at__gte=dt_min.date(), created_at__lte=dt_max.date()
+        ).values_list("created_at", flat=True)
+    )
+    for days_ago in range(days, -1, -1):
+        dt = dt_max - relativedelta(days=days_ago)
+        if dt.date() in existing:
+            log.info(f"Backfill insights: Skipping {dt.date()}, already collected.")
+        else:
+            store_insights(dt, activities.get(days_ago, {}), pl_stats, locale_data)
+
+
+def store_insights(
+    dt_max: datetime,
+    activities: dict[int, Activity],
+    pl_stats: list[dict[str, int]],
+    locale_data: LocaleData | None = None,
+):
+    date = dt_max.date()
+    new_entities = count_created_entities(dt_max)
+
     created = ProjectLocaleInsightsSnapshot.objects.bulk_create(
         projectlocale_insights(dt_max, activities, new_entities, pl_stats),
         batch_size=1000,
@@ -82,101 +169,168 @@ def collect_insights(self, dt_max: datetime | None = None):
     )
 
     created = LocaleInsightsSnapshot.objects.bulk_create(
-        locale_insights(dt_max, activities, new_entities, pl_stats),
+        locale_insights(dt_max, activities, new_entities, pl_stats, locale_data),
         batch_size=1000,
     )
     log.info(f"Collect insights for {date}: {len(created)} Locale insights created.")
 
 
-def count_activities(dt_max: datetime):
+def count_activities(dt_max: datetime) -> dict[int, Activity]:
     """
     `projectlocale_id -> Activity`
 
-    Fetch and prepare activity data.
+    Fetch and prepare activity data of the previous day.
+    """
+    return count_activities_range(dt_max, 1).get(0, {})
+
+
+def count_activities_range(
+    dt_max: datetime, days: int, workers: int = 1
+) -> dict[int, dict[int, Activity]]:
+    """
+    `days_ago -> projectlocale_id -> Activity`
+
+    Fetch and prepare activity data of each of the `days` days before `dt_max`,
+    counted in the database for each projectlocale and day.
+    Day 0 ends at `dt_max`, day 1 a day earlier, and so on.
 
-    Note that this function is also called from
-    pontoon.insights.migrations.0017_fix_projectlocale_insights_again and
-    pontoon.insights.migrations.0018_fix_locale_insights,
-    which may need a local copy if the behaviour here is modified.
+    :arg int workers: number of processes used to calculate chrF++ scores.
     """
-    res: dict[int, Activity] = dict()
+    res: dict[int, dict[int, Activity]] = {}
 
     sync_user = get_system_user(UserProfile.SystemUserRole.SYNC).pk
     pretranslation_users: set[int] = {
         user.pk for user in get_pretranslation_authors().values()
     }
 
-    actions = query_actions(dt_max)
-    approved_translations = get_approved_translations(actions, pretranslation_users)
+    actions = query_actions(dt_max, days)
+
+    # Review actions performed by the sync process are ignored, because they
+    # aren't explicit user review actions.
+    not_sync = ~Q(performed_by=sync_user)
+    created = Q(action_type="translation:created")
+    approved = Q(action_type="translation:approved") & not_sync
+    rejected = Q(action_type="translation:rejected") & not_sync
+    pretranslation = Q(translation__user__in=pretranslation_users)
+    self_approved = approved & Q(performed_by=F("translation__user"))
+    peer_approved = approved & ~Q(performed_by=F("translation__user"))
+    peer_approval_time = F("translation__approved_date") - F("translation__date")
+    rejection_time = F("translation__rejected_date") - F("translation__date")
+    peer_approval_reviewed = peer_approved & Q(translation__approved_date__isnull=False)
+    rejection_reviewed = rejected & Q(translation__rejected_date__isnull=False)
+
+    def translations(condition: Q):
+        return Count("translation", distinct=True, filter=condition)
+
+    def review_time(time, condition: Q):
+        return Sum(time, filter=condition, default=timedelta())
+
+    counters = actions.values(
+        "days_ago", "projectlocale", "translation__locale"
+    ).annotate(
+        human_translations=translations(created & Q(translation__machinery_sources=[])),
+        machinery_translations=translations(
+            created & ~Q(translation__machinery_sources=[])
+        ),
+        new_suggestions=translations(
+            created
+            & (
+                Q(translation__approved_date__isnull=True)
+                | Q(translation__approved_date__gt=F("translation__date"))
+            )
+        ),
+        pretranslations_new=translations(created & pretranslation),
+        # Self-approval can also happen on translation submission
+        self_approved=translations(
+            self_approved
+            | (created & not_sync & Q(performed_by=F("translation__approved_user")))
+        ),
+        peer_approved=translations(peer_approved),
+        pretranslations_approved=translations(approved & pretranslation),
+        # Counted for each action rather than each translation
+        pretranslations_approved_actions=Count("pk", filter=approved & pretranslation),
+        rejected=translations(rejected),
+        pretranslations_rejected=translations(rejected & pretranslation),
+        peer_approval_reviews=Count("pk", filter=peer_approval_reviewed),
+        peer_approval_time=review_time(peer_approval_time, peer_approval_reviewed),
+        rejection_reviews=Count("pk", filter=rejection_reviewed),
+        rejection_time=review_time(rejection_time, rejection_reviewed),
+        pt_peer_approval_reviews=Count(
+            "pk", filter=peer_approval_reviewed & pretranslation
+        ),
+        pt_peer_approval_time=review_time(
+            peer_approval_time, peer_approval_reviewed & pretranslation
+        ),
+        pt_rejection_reviews=Count("pk", filter=rejection_reviewed & pretranslation),
+        pt_rejection_time=review_time(
+            rejection_time, rejection_reviewed & pretranslation
+        ),
+    )
 
-    for action in actions:
-        key = action["projectlocale"]
-        if key not in res:
-            res[key] = Activity(locale=action["translation__locale"])
-        data = res[key]
-
-        approved_date: datetime | None = action["approved_date"]
-        date: datetime = action["date"]
-        performed_by: int = action["performed_by"]
-        translation: int = action["translation"]
-        user: int = action["user"]
-
-        # Review actions performed by the sync process are ignored, because they
-        # aren't explicit user review actions.
-        performed_by_sync = performed_by == sync_user
-
-        match action["action_type"]:
-            case "translation:created":
-                if not action["machinery_sources"]:
-                    data.human_translations.add(translation)
-                else:
-                    data.machinery_translations.add(translation)
-                if not approved_date or approved_date > date:
-                    data.new_suggestions.add(translation)
-                if user in pretranslation_users:
-                    data.pretranslations_new.add(translation)
-                # Self-approval can also happen on translation submission
-                if performed_by == action["approved_user"] and not performed_by_sync:
-                    data.self_approved.add(translation)
-
-            case "translation:approved" if not performed_by_sync:
-                if performed_by == user:
-                    data.self_approved.add(translation)
-                else:
-                    data.peer_approved.add(translation)
-                    if approved_date:
-                        review_time = approved_date - date
-                        data.times_to_review_suggestions.append(review_time)
-                        if user in pretranslation_users:
-                            data.times_to_review_pretranslations.append(review_time)
-                if user in pretranslation_users:
-                    data.pretranslations_approved.add(translation)
-                    # Translation has been approved, no need to claculate the chrF++ score.
-                    # Note that the score is assigned to the pretranslation review date
-                    # rather than its creation date, which would be preferable.
-                    data.pretranslations_chrf_scores.append(100)
-
-            case "translation:rejected" if not performed_by_sync:
-                data.rejected.add(translation)
-                if action["rejected_date"]:
-                    review_time = action["rejected_date"] - date
-                    data.times_to_review_suggestions.append(review_time)
-                    if user in pretranslation_users:
-                        data.times_to_review_pretranslations.append(review_time)
-                if user in pretranslation_users:
-                    data.pretranslations_rejected.add(translation)
-                    score = calculate_chrf_score(action, approved_translations)
-                    if score is not None:
-                        data.pretranslations_chrf_scores.append(score)
+    for row in counters:
+        res.setdefault(int(row["days_ago"]), {})[row["projectlocale"]] = Activity(
+            locale=row["translation__locale"],
+            human_translations=row["human_translations"],
+            machinery_translations=row["machinery_translations"],
+            new_suggestions=row["new_suggestions"],
+            peer_approved=row["peer_approved"],
+            self_approved=row["self_approved"],
+            rejected=row["rejected"],
+            # Approved pretranslations don't need a chrF++ score calculation.
+            # Note that the score is assigned to the pretranslation review date
+            # rather than its creation date, which would be preferable.
+            pretranslations_chrf_scores=[100] * row["pretranslations_approved_actions"],
+            pretranslations_approved=row["pretranslations_approved"],
+            pretranslations_rejected=row["pretranslations_rejected"],
+            pretranslations_new=row["pretranslations_new"],
+            suggestion_reviews=row["peer_approval_reviews"] + row["rejection_reviews"],
+            suggestion_review_time=row["peer_approval_time"] + row["rejection_time"],
+            pretranslation_reviews=(
+                row["pt_peer_approval_reviews"] + row["pt_rejection_reviews"]
+            ),
+            pretranslation_review_time=(
+                row["pt_peer_approval_time"] + row["pt_rejection_time"]
+            ),
+        )
+
+    rejected_pretranslations = list(
+        actions.filter(rejected & pretranslation).values(
+            "days_ago",
+            "projectlocale",
+            "translation__entity",
+            "translation__locale",
+            "translation__string",
+        )
+    )
+    approved_translations = get_approved_translations(rejected_pretranslations)
+    scored = [
+        (action, approved_translation)
+        for action in rejected_pretranslations
+        if (
+            approved_translation := approved_translations.get(
+                (action["translation__entity"], action["translation__locale"])
+            )
+        )
+        is not None
+    ]
+    scores = calculate_chrf_scores(
+        [(action["translation__string"], ref) for action, ref in scored], workers
+    )
+    for (action, _), score in zip(scored, scores):
+        activity = res[int(action["days_ago"])][action["projectlocale"]]
+        activity.pretranslations_chrf_scores.append(score)
 
     return res
 
 
-def query_actions(dt_max: datetime):
-    """Get actions of the previous day, needed to render charts."""
+def query_actions(dt_max: datetime, days: int):
+    """
+    Get actions of the `days` days before `dt_max`, needed to render charts,
+    annotated with their `days_ago` and `projectlocale`.
+    """
     return (
         ActionLog.objects.filter(
-            created_at__gte=dt_max - relativedelta(days=1),
+            created_at__gte=dt_max - relativedelta(days=days),
             created_at__lt=dt_max,
             translation__entity__resource__project__system_project=False,
             translation__entity__resource__project__visibility="public",
@@ -187,38 +341,26 @@ def query_actions(dt_max: datetime):
         # Exclude implicit actions (e.g. self-approvals on submission), which
         # are already covered by the corresponding `translation:created` action.
         .exclude(is_implicit_action=True)
-        .values(
-            "action_type",
-            "performed_by",
-            "translation",
-            "translation__entity",
-            "translation__locale",
-            "translation__string",
-            machinery_sources=F("translation__machinery_sources"),
-            user=F("translation__user"),
-            approved_user=F("translation__approved_user"),
-            date=F("translation__date"),
-            approved_date=F("translation__approved_date"),
-            rejected_date=F("translation__rejected_date"),
-            project=F("translation__entity__resource__project"),
+        .annotate(
+            days_ago=Ceil(
+                (
+                    Extract(Value(dt_max, output_field=DateTimeField()), "epoch")
+                    - Extract("created_at", "epoch")
+                )
+                / DAY_SECONDS
+            )
+            - 1,
             projectlocale=F("translation__entity__resource__project__project_locale"),
         )
-        .order_by("translation__locale")
+        .order_by("days_ago")
     )
 
 
 def get_approved_translations(
-    actions: Iterable[dict[str, Any]], pretranslation_users: set[int]
+    rejected_pretranslation_actions: list[dict[str, Any]],
 ) -> dict[tuple[int, int], str]:
     """Fetch approved translations of entities with rejected pretranslations, needed for
     faster chrf++ score calculation."""
-    rejected_pretranslation_actions = [
-        action
-        for action in actions
-        if action["action_type"] == "translation:rejected"
-        and action["user"] in pretranslation_users
-    ]
-
     # This will catch a superset of required approved translations, which is much more
     # convenient to capture than the exact set, but doesn't seem to impact performance.
     approved_translations = Translation.objects.filter(
@@ -229,16 +371,30 @@ def get_approved_translations(
     return {(t["entity"], t["locale"]): t["string"] for t in approved_translations}
 
 
-def calculate_chrf_score(
-    action: dict[str, Any], approved_translations: dict[tuple[int, int], str]
-):
-    approved_translation = approved_translations.get(
-        (action["translation__entity"], action["translation__locale"]), None
-    )
-    if approved_translation is None:
-        return None
-    score = chrfpp.sentence_score(action["translation__string"], [approved_translation])
-    return float(score.format(score_only=True))
+def calculate_chrf_scores(
+    pairs: list[tuple[str, str]], workers: int = 1
+) -> list[float]:
+    """
+    Calculate the chrF++ scores of `(translation, reference)` pairs,
+    in chunks run by a pool of `workers` processes.
+    """
+    if workers > 1 and len(pairs) > CHRF_CHUNK_SIZE:
+        chunks = [
+            pairs[i : i + CHRF_CHUNK_SIZE]
+            for i in range(0, len(pairs), CHRF_CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(workers, mp_context=get_context("fork")) as pool:
+            return [
+                score for scores in pool.map(_chrf_scores, chunks) for score in scores
+            ]
+    return _chrf_scores(pairs)
+
+
+def _chrf_scores(pairs: list[tuple[str, str]]) -> list[float]:
+    return [
+        float(chrfpp.sentence_score(string, [reference]).format(score_only=True))
+        for string, reference in pairs
+    ]
 
 
 def count_created_entities(dt_max: datetime) -> dict[int, tuple[int, int]]:
@@ -246,10 +402,6 @@ def count_created_entities(dt_max: datetime) -> dict[int, tuple[int, int]]:
     `projectlocale_id -> (locale_id, count)`
 
     Count entities created on the previous day for each projectlocale.
-
-    Note that this function is also called from
-    pontoon.insights.migrations.0018_fix_locale_insights,
-    which may need a local copy if the behaviour here is modified.
     """
     return {
         d["projectlocale"]: (d["locale"], d["count"])
@@ -280,11 +432,6 @@ def count_created_entities(dt_max: datetime) -> dict[int, tuple[int, int]]:
 
 
 def count_projectlocale_stats() -> Iterable[dict[str, int]]:
-    """
-    Note that this function is also called from
-    pontoon.insights.migrations.0018_fix_locale_insights,
-    which may need a local copy if the behaviour here is modified.
-    """
     return (
         TranslatedResource.objects.filter(
             resource__project__disabled=False,
@@ -331,23 +478,23 @@ def projectlocale_insights(
             unreviewed_strings=pls["unreviewed"],
             # Translation activity
             completion=round(100 * pl_completion, 2),
-            human_translations=len(ad.human_translations),
-            machinery_translations=len(ad.machinery_translations),
+            human_translations=ad.human_translations,
+            machinery_translations=ad.machinery_translations,
             new_source_strings=new_entities.get(id, (0, 0))[1],
             # Review activity
-            peer_approved=len(ad.peer_approved),
-            self_approved=len(ad.self_approved),
-            rejected=len(ad.rejected),
-            new_suggestions=len(ad.new_suggestions),
+            peer_approved=ad.peer_approved,
+            self_approved=ad.self_approved,
+            rejected=ad.rejected,
+            new_suggestions=ad.new_suggestions,
             # Pretranslation quality
             pretranslations_chrf_score=(
                 mean(ad.pretranslations_chrf_scores)
                 if ad.pretranslations_chrf_scores
                 else None
             ),
-            pretranslations_approved=len(ad.pretranslations_approved),
-            pretranslations_rejected=len(ad.pretranslations_rejected),
-            pretranslations_new=len(ad.pretranslations_new),
+            pretranslations_approved=ad.pretranslations_approved,
+            pretranslations_rejected=ad.pretranslations_rejected,
+            pretranslations_new=ad.pretranslations_new,
         )
 
 
@@ -356,20 +503,19 @@ def locale_insights(
     activities: dict[int, Activity],
     new_entities: dict[int, tuple[int, int]],
     pl_stats: Iterable[dict[str, int]],
+    locale_data: LocaleData | None = None,
 ) -> Iterator[LocaleInsightsSnapshot]:
     """
-    Note that this function is also called from
-    pontoon.insights.migrations.0018_fix_locale_insights,
-    which may need a local copy if the behaviour here is modified.
+    :arg locale_data: Data gathered for a range of days including `dt_max`,
+        or `None` to gather it for `dt_max`.
     """
-    privileged_users = get_privileged_users()
-    contributors = get_contributors()
-    active_users_actions = get_active_users_actions(dt_max)
-    suggestion_ages = get_average_suggestion_ages()
+    if locale_data is None:
+        locale_data = LocaleData.collect(dt_max)
     for locale, lc_stats_iter in groupby(pl_stats, lambda ps: ps["locale"]):
         lc_activities = [a for a in activities.values() if a.locale == locale]
         lc_new_entities = sum(c for li, c in new_entities.values() if li == locale)
-        lc_manager_logins, lc_translators = privileged_users[locale]
+        lc_manager_logins, lc_translators = locale_data.privileged_users[locale]
+        lc_actions = locale_data.active_users_actions.get(locale, [])
         yield (
             get_locale_insights_snapshot(
                 locale,
@@ -379,9 +525,12 @@ def locale_insights(
                 lc_stats_iter,
                 lc_manager_logins,
                 lc_translators,
-                contributors.get(locale, set()),
-                active_users_actions.get(locale, []),
-                suggestion_ages.get(locale, timedelta()),
+                locale_data.contributors.get(locale, set()),
+                # Actions are ordered by creation time
+                lc_actions[
+                    : bisect_left(lc_actions, dt_max, key=lambda a: a["created_at"])
+                ],
+                locale_data.suggestion_ages.get(locale, timedelta()),
             )
         )
 
@@ -434,18 +583,23 @@ def get_contributors() -> dict[int, set[int]]:
 
 
 def get_active_users_actions(
-    dt_max: datetime,
+    dt_max: datetime, dt_min: datetime | None = None
 ) -> dict[int, list[dict[str, Any]]]:
-    """Get actions of the previous year, needed for the Active users charts."""
+    """
+    Get actions of the year before `dt_max`, or before each day from `dt_min`
+    to `dt_max`, needed for the Active users charts.
+
+    The actions of each locale are ordered by their creation time.
+    """
     actions = (
         ActionLog.objects.filter(
-            created_at__gte=dt_max - relativedelta(year=1),
+            created_at__gte=(dt_min or dt_max) - relativedelta(years=1),
             created_at__lt=dt_max,
         )
         # Exclude implicit actions (e.g. self-approvals on submission).
         .exclude(is_implicit_action=True)
         .values("action_type", "created_at", "performed_by", "translation__locale")
-        .order_by("translation__locale")
+        .order_by("translation__locale", "created_at")
         .distinct()
     )
     return {
@@ -544,19 +698,19 @@ def get_locale_insights_snapshot(
         time_to_review_pretranslations=avg_pt_review_age,
         # Translation activity
         completion=round(100 * ls_completion, 2),
-        human_translations=len(ma.human_translations),
-        machinery_translations=len(ma.machinery_translations),
+        human_translations=ma.human_translations,
+        machinery_translations=ma.machinery_translations,
         new_source_strings=entities_count,
         # Review activity
-        peer_approved=len(ma.peer_approved),
-        self_approved=len(ma.self_approved),
-        rejected=len(ma.rejected),
-        new_suggestions=len(ma.new_suggestions),
+        peer_approved=ma.peer_approved,
+        self_approved=ma.self_approved,
+        rejected=ma.rejected,
+        new_suggestions=ma.new_suggestions,
         # Pretranslation quality
         pretranslations_chrf_score=pt_chrf_score,
-        pretranslations_approved=len(ma.pretranslations_approved),
-        pretranslations_rejected=len(ma.pretranslations_rejected),
-        pretranslations_new=len(ma.pretranslations_new),
+        pretranslations_approved=ma.pretranslations_approved,
+        pretranslations_rejected=ma.pretranslations_rejected,
+        pretranslations_new=ma.pretranslations_new,
     )
 
 
@@ -567,12 +721,10 @@ def get_review_ages(activities: list[Activity]):
     sum_pretranslations = timedelta()
     count_pretranslations = 0
     for data in activities:
-        sum_suggestions = sum(data.times_to_review_suggestions, sum_suggestions)
-        count_suggestions += len(data.times_to_review_suggestions)
-        sum_pretranslations = sum(
-            data.times_to_review_pretranslations, sum_pretranslations
-        )
-        count_pretranslations += len(data.times_to_review_pretranslations)
+        sum_suggestions += data.suggestion_review_time
+        count_suggestions += data.suggestion_reviews
+        sum_pretranslations += data.pretranslation_review_time
+        count_pretranslations += data.pretranslation_reviews
 
     avg_suggestion_time = (
         sum_suggestions / count_suggestions if count_suggestions else None
@@ -584,19 +736,24 @@ def get_review_ages(activities: list[Activity]):
 
 
 def merge_activities(activities: list[Activity]) -> Activity:
-    """Get data for Translation activity and Review activity charts."""
+    """
+    Get data for Translation activity and Review activity charts.
+
+    Each translation belongs to a single projectlocale,
+    so the counts of different projectlocales can be summed.
+    """
     res = Activity(0)
     for data in activities:
-        res.human_translations.update(data.human_translations)
-        res.machinery_translations.update(data.machinery_translations)
-        res.new_suggestions.update(data.new_suggestions)
-        res.peer_approved.update(data.peer_approved)
-        res.self_approved.update(data.self_approved)
-        res.rejected.update(data.rejected)
+        res.human_translations += data.human_translations
+        res.machinery_translations += data.machinery_translations
+        res.new_suggestions += data.new_suggestions
+        res.peer_approved += data.peer_approved
+        res.self_approved += data.self_approved
+        res.rejected += data.rejected
         res.pretranslations_chrf_scores.extend(data.pretranslations_chrf_scores)
-        res.pretranslations_approved.update(data.pretranslations_approved)
-        res.pretranslations_rejected.update(data.pretranslations_rejected)
-        res.pretranslations_new.update(data.pretranslations_new)
+        res.pretranslations_approved += data.pretranslations_approved
+        res.pretranslations_rejected += data.pretranslations_rejected
+        res.pretranslations_new += data.pretranslations_new
     return res
 
 
@@ -16,9 +16,15 @@ from pontoon.insights.chs import (
     get_contributor_metrics_by_locale,
     get_key_projects_enabled_by_locale,
 )
+from pontoon.insights.models import (
+    LocaleInsightsSnapshot,
+    ProjectLocaleInsightsSnapshot,
+)
 from pontoon.insights.tasks import (
     Activity,
+    backfill_insights,
     count_activities,
+    count_activities_range,
     count_created_entities,
     count_projectlocale_stats,
     locale_insights,
@@ -76,10 +82,11 @@ def test_count_activities(user_a, user_b, locale_a, project_locale_a, resource_a
     assert count_activities(now) == {
         project_locale_a.pk: Activity(
             locale=locale_a.pk,
-            human_translations={tr.pk},
-            new_suggestions={tr.pk},
-            peer_approved={tr.pk},
-            times_to_review_suggestions=[t[2] - t[1]],
+            human_translations=1,
+            new_suggestions=1,
+            peer_approved=1,
+            suggestion_reviews=1,
+            suggestion_review_time=t[2] - t[1],
         )
     }
 
@@ -125,9 +132,9 @@ def test_projectlocale_insights(locale_a, project_locale_a, resource_a):
     activities = {
         project_locale_a.pk: Activity(
             locale=locale_a.pk,
-            human_translations={1, 2},
-            new_suggestions={1, 2},
-            peer_approved={1},
+            human_translations=2,
+            new_suggestions=2,
+            peer_approved=1,
         )
     }
     new_entities = {project_locale_a.pk: (locale_a.pk, 3)}
@@ -163,17 +170,19 @@ def test_locale_insights(
     activities = {
         pla.pk: Activity(
             locale=locale_a.pk,
-            human_translations={1, 2},
-            new_suggestions={1, 2},
-            peer_approved={1},
-            times_to_review_suggestions=[t[2] - t[1]],
+            human_translations=2,
+            new_suggestions=2,
+            peer_approved=1,
+            suggestion_reviews=1,
+            suggestion_review_time=t[2] - t[1],
         ),
         plb.pk: Activity(
             locale=locale_a.pk,
-            human_translations={3, 4},
-            new_suggestions={3, 4},
-            peer_approved={3},
-            times_to_review_suggestions=[t[3] - t[1]],
+            human_translations=2,
+            new_suggestions=2,
+            peer_approved=1,
+            suggestion_reviews=1,
+            suggestion_review_time=t[3] - t[1],
         ),
     }
     new_entities = {
@@ -228,9 +237,9 @@ def test_projectlocale_insights_no_pretranslations_chrf_score_is_none(
     activities = {
         project_locale_a.pk: Activity(
             locale=locale_a.pk,
-            human_translations={1},
-            new_suggestions={1},
-            peer_approved={1},
+            human_translations=1,
+            new_suggestions=1,
+            peer_approved=1,
         )
     }
     pl_stats = [
@@ -279,12 +288,87 @@ def test_count_activities_chrf_score_zero_included(
         performed_by=user_a,
         translation=tr,
     )
-    with patch("pontoon.insights.tasks.calculate_chrf_score", return_value=0.0):
+    TranslationFactory.create(
+        entity=tr.entity, locale=locale_a, string="Approved", approved=True
+    )
+    with patch(
+        "pontoon.insights.tasks._chrf_scores",
+        side_effect=lambda pairs: [0.0] * len(pairs),
+    ):
         result = count_activities(now)
     activity = result[project_locale_a.pk]
     assert 0.0 in activity.pretranslations_chrf_scores
 
 
+@pytest.mark.django_db
+def test_count_activities_range(user_a, locale_a, project_locale_a, resource_a):
+    now, t = now_times()
+    for days_ago in (0, 2, 2):
+        tr = TranslationFactory.create(
+            entity__resource=resource_a,
+            locale=locale_a,
+            user=user_a,
+            date=t[1] - relativedelta(days=days_ago),
+        )
+        ActionLog.objects.create(
+            action_type=ActionLog.ActionType.TRANSLATION_CREATED,
+            created_at=t[1] - relativedelta(days=days_ago),
+            performed_by=user_a,
+            translation=tr,
+        )
+
+    activities = count_activities_range(now, 3)
+
+    assert {
+        days_ago: {pl: a.human_translations for pl, a in day.items()}
+        for days_ago, day in activities.items()
+    } == {0: {project_locale_a.pk: 1}, 2: {project_locale_a.pk: 2}}
+    assert activities[0] == count_activities(now)
+
+
+@pytest.mark.django_db
+def test_backfill_insights(user_a, locale_a, project_locale_a, resource_a):
+    now, t = now_times()
+    TranslatedResourceFactory.create(resource=resource_a, locale=locale_a)
+    tr = TranslationFactory.create(
+        entity__resource=resource_a, locale=locale_a, user=user_a, date=t[1]
+    )
+    ActionLog.objects.create(
+        action_type=ActionLog.ActionType.TRANSLATION_CREATED,
+        created_at=t[1],
+        performed_by=user_a,
+        translation=tr,
+    )
+    LocaleInsightsSnapshot.objects.create(
+        locale=locale_a,
+        created_at=(now - relativedelta(days=2)).date(),
+        completion=0,
+    )
+
+    backfill_insights(now - relativedelta(days=2), now)
+
+    assert sorted(
+        ProjectLocaleInsightsSnapshot.objects.filter(
+            project_locale=project_locale_a
+        ).values_list("created_at", "human_translations")
+    ) == [
+        ((now - relativedelta(days=1)).date(), 0),
+        (now.date(), 1),
+    ]
+    assert LocaleInsightsSnapshot.objects.filter(locale=locale_a).count() == 3
+
+    # Active users of each day are counted from the actions before it
+    assert sorted(
+        (li.created_at, li.active_users_last_month["contributors"])
+        for li in LocaleInsightsSnapshot.objects.filter(
+            locale=locale_a, created_at__gt=(now - relativedelta(days=2)).date()
+        )
+    ) == [
+        ((now - relativedelta(days=1)).date(), 0),
+        (now.date(), 1),
+    ]
+
+
 def test_compute_chs():
     # full metric chs activity
     assert compute_chs(
@@ -178,6 +178,4 @@ class LocalizationContributorsView(ContributorsMixin, DetailView):
         return "projectlocale"
 
     def contributors_filter(self, **kwargs):
-        return Q(
-            entity__resource__project=self.object.project, locale=self.object.locale
-        )
+        return Q(project=self.object.project, locale=self.object.locale)
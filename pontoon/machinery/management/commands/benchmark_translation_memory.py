@@ -0,0 +1,113 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+
+from pontoon.base.models import Locale, TranslationMemoryEntry
+from pontoon.machinery.utils import get_translation_memory_data
+
+
+WORDS = (
+    "add bookmark browser cancel close connection content delete download edit "
+    "error extension file folder history home import learn more menu new open "
+    "page password private profile reload remove restart save search settings "
+    "share sign site tab theme update window your this to the of and with"
+).split()
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = """
+        Compare the latency of Translation Memory lookups with and without the
+        trigram candidate stage, using a synthetic Translation Memory.
+
+        Synthetic entries are stored for the given locale in a transaction,
+        which is rolled back once the benchmark completes.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", help="Code of the locale to store entries for")
+        parser.add_argument(
+            "--entries",
+            type=int,
+            default=1_000_000,
+            help="Number of synthetic Translation Memory entries (default: 1000000)",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=50,
+            help="Number of lookups per engine (default: 50)",
+        )
+        parser.add_argument(
+            "--candidates",
+            type=int,
+            default=500,
+            help="Number of trigram candidates to rank (default: 500)",
+        )
+
+    def sentence(self, rng):
+        return " ".join(rng.choices(WORDS, k=rng.randint(1, 20))).capitalize()
+
+    def measure(self, texts, locale, candidates):
+        timings = []
+        results = []
+
+        with override_settings(TRANSLATION_MEMORY_TRIGRAM_CANDIDATES=candidates):
+            for text in texts:
+                start = time.monotonic()
+                results.append(get_translation_memory_data(text, locale))
+                timings.append((time.monotonic() - start) * 1000)
+
+        return timings, results
+
+    def report(self, name, timings):
+        self.stdout.write(
+            f"{name}: median {statistics.median(timings):.1f}ms, "
+            f"max {max(timings):.1f}ms"
+        )
+
+    def handle(self, *args, **options):
+        locale = Locale.objects.get(code=options["locale"])
+        rng = random.Random(0)
+
+        try:
+            with transaction.atomic():
+                self.stdout.write(f"Storing {options['entries']} entries...")
+                TranslationMemoryEntry.objects.bulk_create(
+                    (
+                        TranslationMemoryEntry(
+                            source=self.sentence(rng),
+                            target=self.sentence(rng),
+                            locale=locale,
+                        )
+                        for _ in range(options["entries"])
+                    ),
+                    batch_size=10_000,
+                )
+
+                texts = [self.sentence(rng) for _ in range(options["queries"])]
+
+                scan_timings, scan_results = self.measure(texts, locale, 0)
+                trigram_timings, trigram_results = self.measure(
+                    texts, locale, options["candidates"]
+                )
+
+                self.report("Levenshtein scan", scan_timings)
+                self.report("Trigram candidates", trigram_timings)
+
+                mismatches = sum(
+                    scan != trigram
+                    for scan, trigram in zip(scan_results, trigram_results)
+                )
+                self.stdout.write(f"Lookups with different results: {mismatches}")
+
+                raise Rollback()
+        except Rollback:
+            pass
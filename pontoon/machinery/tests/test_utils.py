@@ -1,12 +1,14 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests_mock
 
 from django.core.cache import cache
 from django.core.management import call_command
 
 from pontoon.machinery.utils import (
     get_google_automl_translation,
+    get_google_generic_translations,
     get_machinery_service_cache_key,
 )
 from pontoon.test.factories import LocaleFactory
@@ -94,3 +96,33 @@ def test_warmup_automl_command_bypasses_cache(automl_project_id, automl_locale):
 
     # The warmup made a real request even though a cached value was present.
     assert client.translate_text.call_count == 1
+
+
+@pytest.mark.django_db
+def test_get_google_generic_translations_batches_uncached_texts(settings):
+    """
+    Multiple texts are translated with a single request, which skips cached texts.
+    """
+    cache.clear()
+    settings.GOOGLE_TRANSLATE_API_KEY = "2fffff"
+    cache.set(
+        get_machinery_service_cache_key("google_generic", "b", "kk", "text"), "cached"
+    )
+
+    with requests_mock.mock() as m:
+        m.post(
+            "https://translation.googleapis.com/language/translate/v2",
+            json={
+                "data": {
+                    "translations": [
+                        {"translatedText": "translated a"},
+                        {"translatedText": "translated c"},
+                    ]
+                }
+            },
+        )
+        translations = get_google_generic_translations(["a", "b", "c"], "kk")
+
+    assert translations == ["translated a", "cached", "translated c"]
+    assert m.call_count == 1
+    assert m.last_request.body == "q=a&q=c&source=en&target=kk&format=text&key=2fffff"
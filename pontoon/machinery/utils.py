@@ -42,6 +42,28 @@ def set_machinery_service_cache_key(key, value):
     cache.set(key, value, settings.MACHINERY_SERVICE_CACHE_TIMEOUT)
 
 
+def get_cached_translations(cache_keys, texts, fetch):
+    """
+    Return translations of `texts`, served from cache where possible. The rest
+    is translated with a single `fetch` call, which takes a list of texts and
+    returns a list of their translations.
+    """
+    translations = cache.get_many(cache_keys)
+    missing = [
+        (key, text) for key, text in zip(cache_keys, texts) if key not in translations
+    ]
+
+    if missing:
+        fetched = fetch([text for _, text in missing])
+        fetched_translations = {
+            key: translation for (key, _), translation in zip(missing, fetched)
+        }
+        cache.set_many(fetched_translations, settings.MACHINERY_SERVICE_CACHE_TIMEOUT)
+        translations.update(fetched_translations)
+
+    return [translations[key] for key in cache_keys]
+
+
 def get_google_translate_data(text, locale, format="text", preserve_placeables=False):
     translation = (
         get_google_automl_translation(text, locale, format, preserve_placeables)
@@ -54,6 +76,26 @@ def get_google_translate_data(text, locale, format="text", preserve_placeables=F
     return translation
 
 
+def get_google_translate_batch_data(
+    texts, locale, format="text", preserve_placeables=False
+):
+    """
+    Translate multiple texts with a single request to Google Translate. Unlike
+    `get_google_translate_data`, returns a list of translations in the order of `texts`.
+    """
+    translations = (
+        get_google_automl_translations(texts, locale, format, preserve_placeables)
+        if locale.google_automl_model
+        else get_google_generic_translations(
+            texts, locale.google_translate_code, format
+        )
+    )
+    if format == "html":
+        translations = [unescape(translation) for translation in translations]
+
+    return translations
+
+
 def get_google_generic_translation(text, locale_code, format="text"):
     cache_key = get_machinery_service_cache_key(
         "google_generic", text, locale_code, format
@@ -89,6 +131,41 @@ def get_google_generic_translation(text, locale_code, format="text"):
     return translation
 
 
+def get_google_generic_translations(texts, locale_code, format="text"):
+    cache_keys = [
+        get_machinery_service_cache_key("google_generic", text, locale_code, format)
+        for text in texts
+    ]
+
+    def fetch(texts):
+        api_key = settings.GOOGLE_TRANSLATE_API_KEY
+
+        if not api_key:
+            raise ImproperlyConfigured("GOOGLE_TRANSLATE_API_KEY not set")
+
+        url = "https://translation.googleapis.com/language/translate/v2"
+
+        # Multiple segments don't fit into the query string, so send a form body
+        payload = {
+            "q": texts,
+            "source": "en",
+            "target": locale_code,
+            "format": format,
+            "key": api_key,
+        }
+
+        r = requests.post(url, data=payload)
+        r.raise_for_status()
+        root = json.loads(r.content)
+
+        if "data" not in root:
+            raise ValueError(f"Google Translate error: {root}")
+
+        return [t["translatedText"] for t in root["data"]["translations"]]
+
+    return get_cached_translations(cache_keys, texts, fetch)
+
+
 def get_google_automl_translation(
     text, locale, format="text", preserve_placeables=False, use_cache=True
 ):
@@ -151,6 +228,63 @@ def get_google_automl_translation(
     return translation
 
 
+def get_google_automl_translations(
+    texts, locale, format="text", preserve_placeables=False
+):
+    cache_keys = [
+        get_machinery_service_cache_key(
+            "google_automl", text, locale.code, format, preserve_placeables
+        )
+        for text in texts
+    ]
+
+    def fetch(texts):
+        try:
+            client = translate.TranslationServiceClient()
+        except DefaultCredentialsError as e:
+            raise ImproperlyConfigured(
+                f"Google AutoML credentials incorrectly configured: {e}"
+            )
+
+        project_id = settings.GOOGLE_AUTOML_PROJECT_ID
+
+        if not project_id:
+            raise ImproperlyConfigured("GOOGLE_AUTOML_PROJECT_ID not set")
+
+        # Google AutoML Translation requires location "us-central1"
+        location = "us-central1"
+
+        parent = f"projects/{project_id}/locations/{location}"
+        model_path = f"{parent}/models/{locale.google_automl_model}"
+
+        request_params = {
+            "contents": texts,
+            "target_language_code": locale.google_translate_code,
+            "model": model_path,
+            "source_language_code": "en",
+            "parent": parent,
+            "mime_type": "text/html" if format == "html" else "text/plain",
+        }
+
+        if preserve_placeables:
+            use_placeables_glossary(
+                "\n".join(texts), client, project_id, location, request_params
+            )
+
+        response = client.translate_text(request=request_params)
+
+        translations = response.translations
+        if response.glossary_translations:
+            translations = response.glossary_translations
+
+        if len(translations) != len(texts):
+            raise ValueError("No translations found.")
+
+        return [translation.translated_text for translation in translations]
+
+    return get_cached_translations(cache_keys, texts, fetch)
+
+
 def get_microsoft_translator_data(text, locale, preserve_placeables=False):
     locale_code = locale.ms_translator_code
     cache_key = get_machinery_service_cache_key(
@@ -187,6 +321,48 @@ def get_microsoft_translator_data(text, locale, preserve_placeables=False):
     return translation
 
 
+def get_microsoft_translator_batch_data(texts, locale, preserve_placeables=False):
+    """
+    Translate multiple texts with a single request to Microsoft Translator. Unlike
+    `get_microsoft_translator_data`, returns a list of translations in the order of `texts`.
+    """
+    locale_code = locale.ms_translator_code
+    cache_keys = [
+        get_machinery_service_cache_key("microsoft_translator", text, locale_code)
+        for text in texts
+    ]
+
+    def fetch(texts):
+        api_key = settings.MICROSOFT_TRANSLATOR_API_KEY
+
+        if not api_key:
+            raise ImproperlyConfigured("MICROSOFT_TRANSLATOR_API_KEY not set")
+
+        url = "https://api.cognitive.microsofttranslator.com/translate"
+        headers = {
+            "Ocp-Apim-Subscription-Key": api_key,
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "api-version": "3.0",
+            "from": "en",
+            "to": locale_code,
+            "textType": "html",
+        }
+        body = [{"Text": text} for text in texts]
+
+        r = requests.post(url, params=payload, headers=headers, json=body)
+        r.raise_for_status()
+        root = json.loads(r.content)
+
+        if "error" in root:
+            raise ValueError(f"Unexpected response: {root}")
+
+        return [item["translations"][0]["text"] for item in root]
+
+    return get_cached_translations(cache_keys, texts, fetch)
+
+
 def use_placeables_glossary(text, client, project_id, location, request_params):
     placeables = get_placeables(text)
 
@@ -0,0 +1,107 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from pontoon.base.models import (
+    Entity,
+    Locale,
+    Project,
+    Resource,
+    TranslatedResource,
+    Translation,
+)
+from pontoon.base.user_utils import get_pretranslation_authors
+from pontoon.pretranslation.tasks import get_pretranslation_candidates
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = """
+        Measure the time spent selecting the strings to pretranslate in a project
+        with many strings and locales, every other string being translated.
+
+        The synthetic project is stored in a transaction, which is rolled back
+        once the benchmark completes.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entities",
+            type=int,
+            default=50_000,
+            help="Number of strings in the project (default: 50000)",
+        )
+        parser.add_argument(
+            "--locales",
+            type=int,
+            default=100,
+            help="Number of locales enabled for pretranslation (default: 100)",
+        )
+
+    def handle(self, *args, **options):
+        pt_authors = get_pretranslation_authors()
+
+        try:
+            with transaction.atomic():
+                self.stdout.write(
+                    f"Storing {options['entities']} strings "
+                    f"in {options['locales']} locales..."
+                )
+                project = Project.objects.create(
+                    name="Pretranslation benchmark", slug="pretranslation-benchmark"
+                )
+                resource = Resource.objects.create(
+                    project=project, path="strings.po", format=Resource.Format.GETTEXT
+                )
+                entities = Entity.objects.bulk_create(
+                    (
+                        Entity(
+                            resource=resource,
+                            key=[f"key{i}"],
+                            string=f"Hello, world! {i}",
+                            value=[f"Hello, world! {i}"],
+                        )
+                        for i in range(options["entities"])
+                    ),
+                    batch_size=10_000,
+                )
+                locales = Locale.objects.bulk_create(
+                    Locale(code=f"benchmark-{i}", name=f"Benchmark {i}")
+                    for i in range(options["locales"])
+                )
+                TranslatedResource.objects.bulk_create(
+                    TranslatedResource(resource=resource, locale=locale)
+                    for locale in locales
+                )
+                Translation.objects.bulk_create(
+                    (
+                        Translation(
+                            entity=entity, locale=locale, string="Bonjour, le monde !"
+                        )
+                        for locale in locales
+                        for entity in entities[::2]
+                    ),
+                    batch_size=10_000,
+                )
+
+                start = time.monotonic()
+                candidates = get_pretranslation_candidates(
+                    project,
+                    Locale.objects.filter(pk__in=[locale.pk for locale in locales]),
+                    None,
+                    pt_authors,
+                )
+                elapsed = time.monotonic() - start
+
+                selected = sum(len(entities) for entities in candidates.values())
+                self.stdout.write(
+                    f"Selected {selected} strings to pretranslate in {elapsed:.2f}s"
+                )
+
+                raise Rollback()
+        except Rollback:
+            pass
@@ -1,6 +1,12 @@
-from collections.abc import Callable
+import logging
+import threading
+import time
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from enum import Enum
+from itertools import batched
 from re import compile
 from typing import Literal
 
@@ -22,18 +28,26 @@ from moz.l10n.model import (
     PatternMessage,
 )
 
+from django.conf import settings
+from django.db import connections
+
 from pontoon.base.models import Entity, Locale, Resource, TranslationMemoryEntry
 from pontoon.machinery.utils import (
+    get_google_translate_batch_data,
     get_google_translate_data,
+    get_microsoft_translator_batch_data,
     get_microsoft_translator_data,
 )
 from pontoon.sync.formats import as_string
 
 
+log = logging.getLogger(__name__)
+
 pt_placeholder = compile(r"{ *\$(\d+) *}")
 
 
 MTService = Callable[..., str]
+MTBatchService = Callable[..., list[str]]
 
 
 class MTEngine(Enum):
@@ -45,12 +59,13 @@ class MTEngine(Enum):
     engine supports a given locale, and the callable that performs the request.
     """
 
-    GOOGLE_TRANSLATE = ("gt", "google_translate_code")
-    MICROSOFT_TRANSLATOR = ("ms", "ms_translator_code")
+    GOOGLE_TRANSLATE = ("gt", "google_translate_code", 128)
+    MICROSOFT_TRANSLATOR = ("ms", "ms_translator_code", 100)
 
-    def __init__(self, service_name: str, locale_code_attr: str):
+    def __init__(self, service_name: str, locale_code_attr: str, batch_size: int):
         self.service_name = service_name
         self.locale_code_attr = locale_code_attr
+        self.batch_size = batch_size
 
     def supports(self, locale: Locale) -> bool:
         return bool(getattr(locale, self.locale_code_attr))
@@ -65,9 +80,52 @@ class MTEngine(Enum):
             case MTEngine.MICROSOFT_TRANSLATOR:
                 return get_microsoft_translator_data
 
+    @property
+    def batch_service(self) -> MTBatchService:
+        """Translates a list of texts with a single request (up to `batch_size`)."""
+        match self:
+            case MTEngine.GOOGLE_TRANSLATE:
+                return get_google_translate_batch_data
+            case MTEngine.MICROSOFT_TRANSLATOR:
+                return get_microsoft_translator_batch_data
+
+    @property
+    def rate_limiter(self) -> "RateLimiter":
+        # Process-wide, so that all pretranslations share the engine's limit
+        with rate_limiters_lock:
+            if self not in rate_limiters:
+                rate_limiters[self] = RateLimiter(
+                    settings.PRETRANSLATION_MT_REQUESTS_PER_SECOND
+                )
+            return rate_limiters[self]
+
+
+class RateLimiter:
+    """Spaces out calls to `wait()` across threads to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate else 0
+        self.next_call = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+rate_limiters: dict[MTEngine, RateLimiter] = {}
+rate_limiters_lock = threading.Lock()
+
 
 def get_pretranslation(
-    entity: Entity, locale: Locale, preserve_placeables: bool = False
+    entity: Entity,
+    locale: Locale,
+    preserve_placeables: bool = False,
+    batch: "PretranslationBatch | None" = None,
 ) -> tuple[str, Literal["gt", "tm"]]:
     """
     Get pretranslations for the entity-locale pair using internal translation memory and
@@ -76,11 +134,14 @@ def get_pretranslation(
     For entities with multiple variants and/or Fluent attributes,
     sets the most frequent pretranslation author as the author of the entire pretranslation.
 
+    :arg batch: TM matches and machine translations prefetched for the locale,
+        see `PretranslationBatch`.
+
     :returns: A tuple consisting of:
         - a pretranslation of the entity
         - a pretranslation service identifier, either "gt" or "tm"
     """
-    pt = Pretranslation(entity, locale, preserve_placeables)
+    pt = Pretranslation(entity, locale, preserve_placeables, batch=batch)
     value, properties = pt.walk_entity()
     pt_res = pt.serialize(value, properties)
     pt_service = max(set(pt.services), key=pt.services.count) if pt.services else "tm"
@@ -102,6 +163,7 @@ class Pretranslation:
         *,
         mt_engine: MTEngine | None = MTEngine.GOOGLE_TRANSLATE,
         exclude_entity: bool = False,
+        batch: "PretranslationBatch | None" = None,
     ):
         """
         :param mt_engine: Machine-translation engine invoked when a leaf has no
@@ -114,6 +176,9 @@ class Pretranslation:
             A leaf that can only be served by the entity's own translation then
             has no TM match, so a composed result is not reconstructed from the
             current entity. Defaults to False.
+        :param batch: TM matches and machine translations prefetched for the
+            locale. Leaves missing from it are looked up one at a time. Must not
+            be combined with ``exclude_entity``.
         """
         self.entity = entity
         match entity.resource.format:
@@ -137,6 +202,7 @@ class Pretranslation:
             mt_engine if mt_engine is not None and mt_engine.supports(locale) else None
         )
         self.exclude_entity = exclude_entity
+        self.batch = batch
 
     def walk_entity(self) -> tuple[Message, dict[str, Message]]:
         """
@@ -226,10 +292,10 @@ class Pretranslation:
                         tgt_variants[keys] = pattern
                     msg.variants = tgt_variants
 
-    def pattern(self, pattern: Pattern) -> Pattern:
-        # First try to get a 100% match from Translation Memory
-        tm_source = (
-            "".join(
+    def tm_source(self, pattern: Pattern) -> str:
+        """The source string of `pattern` to look up in Translation Memory."""
+        if self.format == Format.fluent:
+            return "".join(
                 el.value
                 if isinstance(el, FTL.TextElement)
                 else serialize_expression(el)
@@ -237,29 +303,22 @@ class Pretranslation:
                     PatternMessage(pattern), escape_syntax=False
                 ).elements
             )
-            if self.format == Format.fluent
-            else self.source
-        )
-        if not tm_source or tm_source.isspace():
-            return pattern
-        tm_entries = TranslationMemoryEntry.objects.filter(
-            locale=self.locale, source=tm_source
-        )
-        if self.exclude_entity:
-            tm_entries = tm_entries.exclude(entity=self.entity)
-        tm_q100 = list(tm_entries.values_list("target", flat=True))
-        if tm_q100:
-            tm_best = max(set(tm_q100), key=tm_q100.count)
-            self.services.append("tm")
-            if self.format == Format.fluent:
-                te = fluent_parse_entry(f"key = {tm_best}\n")
-                assert isinstance(te.value, PatternMessage)
-                return te.value.pattern
-            else:
-                return [tm_best]
+        return self.source
+
+    def mt_source(
+        self, pattern: Pattern
+    ) -> tuple[str, list[Expression | Markup], bool]:
+        """
+        The source string of `pattern` to machine-translate, with placeholders
+        standing in for its expressions and markup.
 
+        :returns: A tuple consisting of:
+            - the source string
+            - the placeholder elements
+            - whether the pattern has any text to translate
+        """
         placeholders: list[Expression | Markup] = []
-        gt_source = ""
+        mt_source = ""
         has_text = False
         for el in pattern:
             if isinstance(el, str):
@@ -267,20 +326,53 @@ class Pretranslation:
                     has_text = True
                 # Machine translation treats each line as a separate sentence,
                 # hence we replace newline characters with spaces.
-                gt_source += el.replace("\n", " ")
+                mt_source += el.replace("\n", " ")
             else:
                 idx = len(placeholders)
                 placeholders.append(el)
-                gt_source += "{$" + str(idx) + "}"
+                mt_source += "{$" + str(idx) + "}"
+        return mt_source, placeholders, has_text
+
+    def pattern(self, pattern: Pattern) -> Pattern:
+        # First try to get a 100% match from Translation Memory
+        tm_source = self.tm_source(pattern)
+        if not tm_source or tm_source.isspace():
+            return pattern
+        if self.batch is not None:
+            tm_q100 = self.batch.tm_matches.get(tm_source, [])
+        else:
+            tm_entries = TranslationMemoryEntry.objects.filter(
+                locale=self.locale, source=tm_source
+            )
+            if self.exclude_entity:
+                tm_entries = tm_entries.exclude(entity=self.entity)
+            tm_q100 = list(tm_entries.values_list("target", flat=True))
+        if tm_q100:
+            tm_best = max(set(tm_q100), key=tm_q100.count)
+            self.services.append("tm")
+            if self.format == Format.fluent:
+                te = fluent_parse_entry(f"key = {tm_best}\n")
+                assert isinstance(te.value, PatternMessage)
+                return te.value.pattern
+            else:
+                return [tm_best]
+
+        gt_source, placeholders, has_text = self.mt_source(pattern)
         if not has_text:
             return pattern
 
         if self.mt_engine is not None:
-            mt_translation = self.mt_engine.service(
-                text=gt_source,
-                locale=self.locale,
-                preserve_placeables=self.preserve_placeables,
+            mt_translation = (
+                self.batch.mt_translations.get(gt_source)
+                if self.batch is not None
+                else None
             )
+            if mt_translation is None:
+                mt_translation = self.mt_engine.service(
+                    text=gt_source,
+                    locale=self.locale,
+                    preserve_placeables=self.preserve_placeables,
+                )
             self.services.append(self.mt_engine.service_name)
             return [
                 el
@@ -299,6 +391,112 @@ class Pretranslation:
         )
 
 
+class LeafCollector(Pretranslation):
+    """
+    Walks the entity like `Pretranslation`, but only records the TM and MT
+    source strings of its leaves, leaving them untranslated.
+    """
+
+    def __init__(self, entity: Entity, locale: Locale, leaves: list):
+        super().__init__(entity, locale, False, mt_engine=None)
+        self.leaves = leaves
+
+    def pattern(self, pattern: Pattern) -> Pattern:
+        tm_source = self.tm_source(pattern)
+        if tm_source and not tm_source.isspace():
+            mt_source, _, has_text = self.mt_source(pattern)
+            self.leaves.append((tm_source, mt_source if has_text else None))
+        return pattern
+
+
+class PretranslationBatch:
+    """
+    Translation Memory matches and machine translations of all leaves of a set
+    of entities, fetched in bulk for pretranslating them into a single locale.
+
+    All 100% TM matches are fetched with one query per `TM_CHUNK_SIZE` sources.
+    Leaves without a TM match are grouped into multi-segment MT requests, which
+    are issued concurrently by up to `PRETRANSLATION_MT_WORKERS` threads, and
+    rate limited per MT engine.
+    """
+
+    TM_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        locale: Locale,
+        preserve_placeables: bool = False,
+        *,
+        mt_engine: MTEngine | None = MTEngine.GOOGLE_TRANSLATE,
+    ):
+        self.locale = locale
+        self.preserve_placeables = preserve_placeables
+        self.mt_engine = (
+            mt_engine if mt_engine is not None and mt_engine.supports(locale) else None
+        )
+        self.tm_matches: dict[str, list[str]] = {}
+        self.mt_translations: dict[str, str] = {}
+        self.tm_queries = 0
+        self.mt_requests = 0
+        self.mt_errors = 0
+
+    def prefetch(self, entities: Iterable[Entity]) -> None:
+        leaves: list[tuple[str, str | None]] = []
+        for entity in entities:
+            LeafCollector(entity, self.locale, leaves).walk_entity()
+
+        tm_sources = {tm_source for tm_source, _ in leaves}
+        for chunk in batched(tm_sources, self.TM_CHUNK_SIZE):
+            self.tm_queries += 1
+            for source, target in TranslationMemoryEntry.objects.filter(
+                locale=self.locale, source__in=chunk
+            ).values_list("source", "target"):
+                self.tm_matches.setdefault(source, []).append(target)
+
+        if self.mt_engine is not None:
+            mt_sources = {
+                mt_source: None
+                for tm_source, mt_source in leaves
+                if mt_source is not None and tm_source not in self.tm_matches
+            }
+            self.fetch_mt(list(mt_sources))
+
+    def fetch_mt(self, sources: list[str]) -> None:
+        engine = self.mt_engine
+        if engine is None or not sources:
+            return
+
+        def translate(texts: tuple[str, ...]) -> list[str]:
+            engine.rate_limiter.wait()
+            try:
+                return engine.batch_service(
+                    texts=list(texts),
+                    locale=self.locale,
+                    preserve_placeables=self.preserve_placeables,
+                )
+            finally:
+                # Threads get their own DB connections, which need to be closed
+                connections.close_all()
+
+        with ThreadPoolExecutor(
+            max_workers=settings.PRETRANSLATION_MT_WORKERS
+        ) as executor:
+            futures = {
+                executor.submit(translate, texts): texts
+                for texts in batched(sources, engine.batch_size)
+            }
+            for future in as_completed(futures):
+                self.mt_requests += 1
+                try:
+                    translations = future.result()
+                except Exception as e:
+                    # Leaves of failed requests get translated one at a time
+                    log.error(f"Batch machine translation error: {e}")
+                    self.mt_errors += 1
+                    continue
+                self.mt_translations.update(zip(futures[future], translations))
+
+
 def set_accesskey(entry: Entry[Message], ak_name: str, ak_msg: Message):
     """Modifies `ak_msg`.
 
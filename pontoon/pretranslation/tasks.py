@@ -1,34 +1,87 @@
 import logging
-import operator
-
-from functools import reduce
+import time
 
 from celery import shared_task
 
 from django.conf import settings
+from django.contrib.auth.models import User
 from django.core.cache import cache
-from django.db.models import CharField, Q, Value as V
-from django.db.models.functions import Concat
+from django.db.models import Q, QuerySet
 
 from pontoon.actionlog.models import ActionLog
+from pontoon.actionlog.utils import save_actions
 from pontoon.base.models import (
     Entity,
+    Locale,
     Project,
     TranslatedResource,
     Translation,
 )
+from pontoon.base.models.contribution_count import (
+    adjust_contribution_counts,
+    count_contributions,
+)
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.base.tasks import PontoonTask
 from pontoon.base.user_utils import get_pretranslation_authors
 from pontoon.checks.libraries import run_checks
 from pontoon.checks.utils import bulk_run_checks
 from pontoon.translations.utils import parse_source_string_to_json
 
-from .pretranslate import get_pretranslation
+from .pretranslate import PretranslationBatch, get_pretranslation
 
 
 log = logging.getLogger(__name__)
 
 
+def get_pretranslation_candidates(
+    project: Project,
+    locales: QuerySet[Locale],
+    paths: set[str] | None,
+    pt_authors: dict[str, User],
+) -> dict[int, list[Entity]]:
+    """
+    Selects the strings to pretranslate in each locale: strings of resources
+    enabled for the locale, without any translations and any suggestions
+    other than rejected pretranslations.
+
+    :returns: A dict mapping locale IDs to the lists of entities to pretranslate.
+    """
+    entities = Entity.objects.filter(resource__project=project, obsolete=False)
+    if paths:
+        entities = entities.filter(resource__path__in=paths)
+    entities = entities.prefetch_related("resource")
+
+    # Fetch all available locale-resource pairs (TranslatedResource objects)
+    tr_pairs = set(
+        TranslatedResource.objects.filter(
+            resource__project=project,
+            locale__in=locales,
+        ).values_list("locale_id", "resource_id")
+    )
+
+    # Fetch all locale-entity pairs with non-rejected or pretranslated translations
+    translated_entities = set(
+        Translation.objects.filter(
+            locale__in=locales,
+            entity__in=entities,
+        )
+        .filter(Q(rejected=False) | Q(user__in=pt_authors.values()))
+        .order_by()
+        .values_list("locale_id", "entity_id")
+    )
+
+    return {
+        locale.id: [
+            entity
+            for entity in entities
+            if (locale.id, entity.id) not in translated_entities
+            and (locale.id, entity.resource_id) in tr_pairs
+        ]
+        for locale in locales
+    }
+
+
 def pretranslate(project: Project, paths: set[str] | None):
     """
     Identifies strings without any translations and any suggestions.
@@ -58,63 +111,25 @@ def pretranslate(project: Project, paths: set[str] | None):
 
     log.info(f"Fetching pretranslations for project {project.name} started")
 
-    entities = Entity.objects.filter(resource__project=project, obsolete=False)
-    if paths:
-        entities = entities.filter(resource__path__in=paths)
-    entities = entities.prefetch_related("resource")
-
-    # Fetch all available locale-resource pairs (TranslatedResource objects)
-    tr_pairs = (
-        TranslatedResource.objects.filter(
-            resource__project=project,
-            locale__in=locales,
-        )
-        .annotate(
-            locale_resource=Concat(
-                "locale_id", V("-"), "resource_id", output_field=CharField()
-            )
-        )
-        .values_list("locale_resource", flat=True)
-        .distinct()
-    )
-
-    # Fetch all locale-entity pairs with non-rejected or pretranslated translations
     pt_authors = get_pretranslation_authors()
-    translated_entities = (
-        Translation.objects.filter(
-            locale__in=locales,
-            entity__in=entities,
-        )
-        .filter(Q(rejected=False) | Q(user__in=pt_authors.values()))
-        .annotate(
-            locale_entity=Concat(
-                "locale_id", V("-"), "entity_id", output_field=CharField()
-            )
-        )
-        .values_list("locale_entity", flat=True)
-        .distinct()
-    )
-
-    translated_entities = list(translated_entities)
+    candidates = get_pretranslation_candidates(project, locales, paths, pt_authors)
 
     for locale in locales:
         log.info(f"Fetching pretranslations for locale {locale.code} started")
+        start_time = time.monotonic()
 
-        translations = []
+        locale_entities = candidates[locale.id]
 
-        # To keep track of changed TranslatedResources and their latest_translation
-        tr_dict = {}
-        tr_filter = []
-        index = -1
+        # Fetch TM matches and machine translations for all entities at once
+        batch = PretranslationBatch(locale)
+        batch.prefetch(locale_entities)
 
-        for entity in entities:
-            locale_entity = f"{locale.id}-{entity.id}"
-            locale_resource = f"{locale.id}-{entity.resource.id}"
-            if locale_entity in translated_entities or locale_resource not in tr_pairs:
-                continue
+        pretranslations = {}
+        failed_entities = []
 
+        for entity in locale_entities:
             try:
-                pretranslation = get_pretranslation(entity, locale)
+                pretranslation = get_pretranslation(entity, locale, batch=batch)
             except ValueError as e:
                 log.info(f"Pretranslation error: {e}")
                 continue
@@ -127,13 +142,34 @@ def pretranslate(project: Project, paths: set[str] | None):
             )
 
             if failed_checks:
+                failed_entities.append(entity)
+            else:
+                pretranslations[entity.pk] = pretranslation
+
+        # Retry pretranslations with failed checks, preserving placeables
+        if failed_entities:
+            retry_batch = PretranslationBatch(locale, preserve_placeables=True)
+            retry_batch.prefetch(failed_entities)
+
+            for entity in failed_entities:
                 try:
-                    pretranslation = get_pretranslation(
-                        entity, locale, preserve_placeables=True
+                    pretranslations[entity.pk] = get_pretranslation(
+                        entity, locale, preserve_placeables=True, batch=retry_batch
                     )
                 except ValueError as e:
                     log.info(f"Pretranslation error: {e}")
-                    continue
+
+        translations = []
+
+        # To keep track of changed TranslatedResources and their latest_translation
+        tr_dict = {}
+        index = -1
+
+        for entity in locale_entities:
+            if entity.pk not in pretranslations:
+                continue
+
+            pretranslation = pretranslations[entity.pk]
 
             string, author_key = pretranslation
             _, value, properties = parse_source_string_to_json(
@@ -155,16 +191,8 @@ def pretranslate(project: Project, paths: set[str] | None):
             index += 1
             translations.append(t)
 
-            if locale_resource not in tr_dict:
-                tr_dict[locale_resource] = index
-
-                # Add query for fetching respective TranslatedResource.
-                tr_filter.append(
-                    Q(locale__id=locale.id) & Q(resource__id=entity.resource.id)
-                )
-
             # Update the latest translation index
-            tr_dict[locale_resource] = index
+            tr_dict[entity.resource_id] = index
 
         if len(translations) == 0:
             log.info(
@@ -172,6 +200,8 @@ def pretranslate(project: Project, paths: set[str] | None):
             )
             continue
 
+        pairs = [(t.entity_id, locale.pk) for t in translations]
+        contributions_before = count_contributions(pairs)
         translations = Translation.objects.bulk_create(translations)
 
         # Log creating actions
@@ -184,11 +214,13 @@ def pretranslate(project: Project, paths: set[str] | None):
             for t in translations
         ]
 
-        ActionLog.objects.bulk_create(actions_to_log)
+        save_actions(actions_to_log, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
         # Run checks on all translations
         translation_pks = {translation.pk for translation in translations}
         bulk_run_checks(Translation.objects.for_checks().filter(pk__in=translation_pks))
+        update_entity_statuses(pairs)
+        adjust_contribution_counts(contributions_before, count_contributions(pairs))
 
         # Mark translations as changed
         changed_translations = Translation.objects.filter(
@@ -200,21 +232,21 @@ def pretranslate(project: Project, paths: set[str] | None):
         changed_translations.bulk_mark_changed()
 
         # Update latest activity and stats for changed instances.
-        # `operator.ior` is the '|' Python operator, which turns into a logical OR
-        # when used between django ORM query objects.
-        tr_query = reduce(operator.ior, tr_filter)
-        translatedresources = TranslatedResource.objects.filter(tr_query).annotate(
-            locale_resource=Concat(
-                "locale_id", V("-"), "resource_id", output_field=CharField()
-            )
+        translatedresources = TranslatedResource.objects.filter(
+            locale=locale, resource__in=list(tr_dict)
         )
         translatedresources.calculate_stats()
         for tr in translatedresources:
-            index = tr_dict[tr.locale_resource]
+            index = tr_dict[tr.resource_id]
             translation = translations[index]
             translation.update_latest_translation()
 
-        log.info(f"Fetching pretranslations for locale {locale.code} done")
+        log.info(
+            f"Fetching pretranslations for locale {locale.code} done: "
+            f"{len(translations)} pretranslations of {len(locale_entities)} strings, "
+            f"{batch.tm_queries} TM queries, {batch.mt_requests} MT requests "
+            f"({batch.mt_errors} failed) in {time.monotonic() - start_time:.2f}s"
+        )
 
     log.info(f"Fetching pretranslations for project {project.name} done")
 
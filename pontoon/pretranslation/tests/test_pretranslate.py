@@ -5,7 +5,10 @@ import pytest
 
 from fluent.syntax import FluentParser, FluentSerializer
 
-from pontoon.pretranslation.pretranslate import get_pretranslation
+from pontoon.pretranslation.pretranslate import (
+    PretranslationBatch,
+    get_pretranslation,
+)
 from pontoon.test.factories import (
     EntityFactory,
     ResourceFactory,
@@ -70,6 +73,55 @@ def test_get_pretranslations_gt_match(gt_mock, entity_a, google_translate_locale
     assert response == ("gt_translation", "gt")
 
 
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_data")
+@patch("pontoon.pretranslation.pretranslate.get_google_translate_batch_data")
+@pytest.mark.django_db
+def test_get_pretranslations_batch(
+    gt_batch_mock,
+    gt_mock,
+    resource_a,
+    google_translate_locale,
+    django_assert_num_queries,
+):
+    # TM matches and machine translations are fetched in bulk
+    tm_entity = EntityFactory(resource=resource_a, string="tm_source")
+    gt_entities = [
+        EntityFactory(resource=resource_a, string=f"gt_source_{i}") for i in range(3)
+    ]
+    TranslationMemoryFactory.create(
+        source="tm_source",
+        target="tm_translation",
+        locale=google_translate_locale,
+    )
+    gt_batch_mock.side_effect = lambda texts, **kwargs: [
+        text.replace("source", "translation") for text in texts
+    ]
+
+    batch = PretranslationBatch(google_translate_locale)
+    with django_assert_num_queries(1):
+        batch.prefetch([tm_entity, *gt_entities])
+
+    assert gt_batch_mock.call_count == 1
+    assert gt_batch_mock.call_args.kwargs["texts"] == [
+        "gt_source_0",
+        "gt_source_1",
+        "gt_source_2",
+    ]
+
+    with django_assert_num_queries(0):
+        assert get_pretranslation(tm_entity, google_translate_locale, batch=batch) == (
+            "tm_translation",
+            "tm",
+        )
+        for i, entity in enumerate(gt_entities):
+            assert get_pretranslation(entity, google_translate_locale, batch=batch) == (
+                f"gt_translation_{i}",
+                "gt",
+            )
+
+    assert not gt_mock.called
+
+
 @pytest.mark.django_db
 def test_get_pretranslations_fluent_no_match(fluent_resource, locale_b):
     # 100% TM match does not exist and locale.google_translate_code is None
@@ -2,8 +2,11 @@ from unittest.mock import patch
 
 import pytest
 
-from pontoon.base.models import ChangedEntityLocale, Translation
-from pontoon.pretranslation.tasks import pretranslate_task
+from pontoon.base.models import ChangedEntityLocale, Locale, Translation
+from pontoon.pretranslation.tasks import (
+    get_pretranslation_candidates,
+    pretranslate_task,
+)
 from pontoon.test.factories import (
     EntityFactory,
     ProjectLocaleFactory,
@@ -110,3 +113,46 @@ def test_which_strings_to_pretranslate(
     assert len(non_rejected.translation_set.filter(string="pretranslation")) == 0
     assert len(rejected_by_human.translation_set.filter(string="pretranslation")) == 1
     assert len(rejected_by_machine.translation_set.filter(string="pretranslation")) == 0
+
+
+@pytest.mark.django_db
+def test_get_pretranslation_candidates(
+    project_a, locale_a, locale_b, gt_user, tm_user, django_assert_num_queries
+):
+    resources = [
+        ResourceFactory.create(project=project_a, path=x, format="gettext")
+        for x in ["resource_x.po", "resource_y.po"]
+    ]
+    x1, x2 = EntityFactory.create_batch(2, resource=resources[0])
+    y1, y2 = EntityFactory.create_batch(2, resource=resources[1])
+    EntityFactory.create(resource=resources[0], obsolete=True)
+
+    TranslatedResourceFactory.create(resource=resources[0], locale=locale_a)
+    TranslatedResourceFactory.create(resource=resources[1], locale=locale_a)
+    TranslatedResourceFactory.create(resource=resources[0], locale=locale_b)
+
+    TranslationFactory.create(entity=x1, locale=locale_a)
+    TranslationFactory.create(entity=y1, locale=locale_a, rejected=True)
+    TranslationFactory.create(entity=y2, locale=locale_a, rejected=True, user=gt_user)
+    TranslationFactory.create(entity=x2, locale=locale_b, rejected=True)
+
+    locales = Locale.objects.filter(pk__in=[locale_a.pk, locale_b.pk])
+    pt_authors = {"gt": gt_user, "tm": tm_user}
+
+    # The number of queries does not depend on the number of locales
+    with django_assert_num_queries(5):
+        candidates = get_pretranslation_candidates(project_a, locales, None, pt_authors)
+
+    assert {
+        locale_id: {entity.pk for entity in entities}
+        for locale_id, entities in candidates.items()
+    } == {
+        locale_a.pk: {x2.pk, y1.pk},
+        locale_b.pk: {x1.pk, x2.pk},
+    }
+
+    candidates = get_pretranslation_candidates(
+        project_a, locales, {"resource_y.po"}, pt_authors
+    )
+    assert [entity.pk for entity in candidates[locale_a.pk]] == [y1.pk]
+    assert candidates[locale_b.pk] == []
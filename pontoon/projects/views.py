@@ -183,4 +183,4 @@ class ProjectContributorsView(ContributorsMixin, DetailView):
         return "project"
 
     def contributors_filter(self, **kwargs):
-        return Q(entity__resource__project=self.object)
+        return Q(project=self.object)
@@ -0,0 +1,99 @@
+import statistics
+import time
+
+from urllib.parse import urlencode
+
+import requests
+
+from rest_framework.request import Request
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from pontoon.api.serializers import EntitySearchSerializer
+from pontoon.search.utils import (
+    SEARCH_PAGE_SIZE,
+    iter_search_results,
+    search_translations,
+)
+
+
+class Command(BaseCommand):
+    help = """
+        Compare the latency and worker occupancy of a multi-page search when
+        fetching results in-process and through HTTP requests to the
+        translation search API, as the search page used to.
+
+        The API must be served at SITE_URL. Worker time is the time spent by
+        the worker handling the search, plus the time spent by the workers
+        handling its API requests.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", help="Code of the locale to search in")
+        parser.add_argument("search", help="Text to search for")
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=5,
+            help="Number of result pages per search (default: 5)",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=10,
+            help="Number of searches per backend (default: 10)",
+        )
+
+    def in_process(self, locale, search, pages):
+        entities = search_translations(AnonymousUser(), locale, None, search)
+        results = iter_search_results(entities, 0, pages * SEARCH_PAGE_SIZE)
+        request = Request(RequestFactory().get("/"))
+        data = EntitySearchSerializer(
+            results, many=True, context={"request": request}
+        ).data
+        return data, 0
+
+    def loopback(self, locale, search, pages):
+        results = []
+        api_time = 0
+        for page in range(1, pages + 1):
+            params = urlencode({"text": search, "locale": locale, "page": page})
+            start = time.monotonic()
+            response = requests.get(
+                f"{settings.SITE_URL}/api/v2/search/translations/?{params}"
+            )
+            api_time += time.monotonic() - start
+            if response.status_code == 404:
+                break
+            response.raise_for_status()
+            data = response.json()
+            results.extend(data["results"])
+            if data["next"] is None:
+                break
+        return results, api_time
+
+    def measure(self, backend, options):
+        latencies = []
+        worker_times = []
+        for _ in range(options["runs"]):
+            start = time.monotonic()
+            _, api_time = backend(
+                options["locale"], options["search"], options["pages"]
+            )
+            latency = time.monotonic() - start
+            latencies.append(latency * 1000)
+            worker_times.append((latency + api_time) * 1000)
+        return latencies, worker_times
+
+    def report(self, name, latencies, worker_times):
+        self.stdout.write(
+            f"{name}: median latency {statistics.median(latencies):.1f}ms, "
+            f"median worker time {statistics.median(worker_times):.1f}ms"
+        )
+
+    def handle(self, *args, **options):
+        self.report("In-process", *self.measure(self.in_process, options))
+        self.report("HTTP loopback", *self.measure(self.loopback, options))
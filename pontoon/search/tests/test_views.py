@@ -2,6 +2,8 @@ import pytest
 
 from django.urls import reverse
 
+from pontoon.test.factories import EntityFactory, TranslationFactory
+
 
 @pytest.fixture
 def search_url():
@@ -72,3 +74,70 @@ def test_search_options_explicit_url_params_override_profile(
     assert "search-identifiers-enabled enabled" in content
     assert "match-case-enabled enabled" in content
     assert "match-whole-word-enabled enabled" in content
+
+
+@pytest.fixture
+def search_entities(locale_a, project_locale_a, resource_a):
+    entities = [
+        EntityFactory.create(resource=resource_a, string=f"Search string {i}", order=i)
+        for i in range(3)
+    ]
+    for entity in entities:
+        TranslationFactory.create(
+            entity=entity,
+            locale=locale_a,
+            string=f"Target {entity.order}",
+            approved=True,
+        )
+    return entities
+
+
+def get_search_results(client, params):
+    return client.get(
+        reverse("pontoon.search.results"),
+        params,
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+
+
+@pytest.mark.django_db
+def test_search_results_pages(member, locale_a, search_entities, monkeypatch):
+    """Search results are fetched in-process, one or several pages at a time."""
+    monkeypatch.setattr("pontoon.search.views.SEARCH_PAGE_SIZE", 2)
+    params = {"search": "Search string", "locale": locale_a.code}
+
+    response = get_search_results(member.client, {**params, "page": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["has_more"] is True
+    assert "Target 1" in data["html"]
+    assert "Target 2" not in data["html"]
+
+    response = get_search_results(member.client, {**params, "page": 2})
+    data = response.json()
+    assert data["has_more"] is False
+    assert "Target 1" not in data["html"]
+    assert "Target 2" in data["html"]
+
+    response = get_search_results(member.client, {**params, "pages": 2})
+    data = response.json()
+    assert data["has_more"] is False
+    for entity in search_entities:
+        assert f"Target {entity.order}" in data["html"]
+
+
+@pytest.mark.django_db
+def test_search_results_no_search(member, locale_a):
+    response = get_search_results(member.client, {"locale": locale_a.code})
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_entity(member, locale_a, search_entities):
+    entity = search_entities[0]
+    response = member.client.get(reverse("pontoon.entity", kwargs={"pk": entity.pk}))
+    assert response.status_code == 200
+    assert "Target 0" in response.content.decode()
+
+    response = member.client.get(reverse("pontoon.entity", kwargs={"pk": 0}))
+    assert response.status_code == 404
@@ -0,0 +1,116 @@
+from collections.abc import Iterator
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch, QuerySet
+from django.shortcuts import get_object_or_404
+
+from pontoon.base.forms import GetEntitiesForm
+from pontoon.base.get_entities import get_entities_for_project_locale
+from pontoon.base.models import Entity, Locale, Project, Translation
+
+
+# Number of search results per page, on the search page and in the API.
+SEARCH_PAGE_SIZE = 100
+
+
+def search_translations(
+    user: User,
+    locale_code: str,
+    project_slug: str | None,
+    search: str,
+    *,
+    search_identifiers: bool = False,
+    search_match_case: bool = False,
+    search_match_whole_word: bool = False,
+    with_translations: bool = True,
+) -> QuerySet[Entity]:
+    """
+    Get entities with translations in the given locale, matching the search.
+
+    Used in-process by both the search page and the translation search API.
+    Raises `ValidationError` on invalid parameters, and `Http404` if the
+    locale or the project does not exist.
+
+    :arg with_translations: Prefetch approved translations of the locale
+        as `active_translations`.
+    """
+    form = GetEntitiesForm(
+        {
+            "search": search,
+            "locale": locale_code,
+            "project": project_slug or "all-projects",
+            "search_identifiers": search_identifiers,
+            "search_match_case": search_match_case,
+            "search_match_whole_word": search_match_whole_word,
+        }
+    )
+    if not form.is_valid():
+        raise ValidationError(form.errors)
+
+    locale = get_object_or_404(Locale, code=form.cleaned_data["locale"])
+
+    project_slug = form.cleaned_data["project"]
+    if project_slug == "all-projects":
+        project = Project(slug="all-projects")
+    else:
+        project = get_object_or_404(Project, slug=project_slug)
+
+    entities = get_entities_for_project_locale(
+        user,
+        project,
+        locale,
+        status="translated",
+        search=form.cleaned_data["search"],
+        search_identifiers=form.cleaned_data["search_identifiers"],
+        search_match_case=form.cleaned_data["search_match_case"],
+        search_match_whole_word=form.cleaned_data["search_match_whole_word"],
+    ).select_related("resource__project")
+
+    if with_translations:
+        entities = entities.prefetch_related(
+            Prefetch(
+                "translation_set",
+                queryset=Translation.objects.filter(
+                    locale=locale, approved=True
+                ).select_related("locale"),
+                to_attr="active_translations",
+            )
+        )
+
+    return entities
+
+
+def iter_search_results(
+    entities: QuerySet[Entity], offset: int = 0, limit: int | None = None
+) -> Iterator[Entity]:
+    """
+    Iterate over a range of search results spanning any number of pages,
+    reading them through a single database cursor.
+    """
+    end = None if limit is None else offset + limit
+    return entities[offset:end].iterator(chunk_size=SEARCH_PAGE_SIZE)
+
+
+def visible_entities(user: User, with_translations: bool = True) -> QuerySet[Entity]:
+    """
+    Get entities of projects visible to the user.
+
+    :arg with_translations: Prefetch approved translations of all locales
+        as `filtered_translations`.
+    """
+    visible_projects = Project.objects.visible().visible_for(user)
+    entities = Entity.objects.filter(resource__project__in=visible_projects)
+
+    if with_translations:
+        entities = entities.prefetch_related(
+            Prefetch(
+                "translation_set",
+                queryset=Translation.objects.filter(approved=True)
+                .select_related("locale")
+                .order_by("locale__code"),
+                to_attr="filtered_translations",
+            )
+        )
+
+    return entities
@@ -1,19 +1,22 @@
-from urllib.parse import urlencode
-
-import requests
-
-from requests.exceptions import RequestException
+from rest_framework.request import Request
 
+from django.core.exceptions import ValidationError
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
 
+from pontoon.api.serializers import EntitySearchSerializer, NestedEntitySerializer
 from pontoon.base.models.entity import Entity
 from pontoon.base.models.locale import Locale
 from pontoon.base.models.project import Project
 from pontoon.base.utils import get_project_locale_from_request, parse_bool, require_AJAX
-from pontoon.settings.base import SITE_URL
+from pontoon.search.utils import (
+    SEARCH_PAGE_SIZE,
+    iter_search_results,
+    search_translations,
+    visible_entities,
+)
 
 
 def get_valid_locale_code(request, locale_code):
@@ -24,36 +27,6 @@ def get_valid_locale_code(request, locale_code):
     return locale_code
 
 
-def create_api_url(
-    search,
-    project,
-    locale,
-    search_identifiers,
-    search_match_case,
-    search_match_whole_word,
-    page=None,
-):
-    query_params = {
-        "text": search,
-        "project": project,
-        "locale": locale,
-        "search_identifiers": search_identifiers,
-        "search_match_case": search_match_case,
-        "search_match_whole_word": search_match_whole_word,
-    }
-
-    query_params = {
-        key: value
-        for key, value in query_params.items()
-        if value is not None and value != "" and value is not False
-    }
-
-    if page:
-        query_params["page"] = page
-
-    return f"{SITE_URL}/api/v2/search/translations/?{urlencode(query_params)}"
-
-
 def get_search_option(request, name):
     """Return a search option from the URL, falling back to the user's profile setting.
 
@@ -135,57 +108,42 @@ def search_results(request):
     locale_code = get_valid_locale_code(request, locale_code)
 
     if page:
+        # Single page fetch
         try:
             page = int(page)
         except ValueError:
             page = 1
-        # Single page fetch
-        api_url = create_api_url(
-            search,
-            project_slug,
-            locale_code,
-            search_identifiers,
-            search_match_case,
-            search_match_whole_word,
-            page=page,
-        )
-
-        try:
-            response = requests.get(api_url)
-            response.raise_for_status()
-        except RequestException:
+        if page < 1:
             raise Http404
-
-        data = response.json()
-        entities = data["results"]
-        has_more = data["next"] is not None
+        offset = (page - 1) * SEARCH_PAGE_SIZE
+        limit = SEARCH_PAGE_SIZE
     else:
         # Multi-page fetch
-        entities = []
-        has_more = True
-        for p in range(1, pages + 1):
-            if not has_more:
-                break
-
-            api_url = create_api_url(
-                search,
-                project_slug,
-                locale_code,
-                search_identifiers,
-                search_match_case,
-                search_match_whole_word,
-                page=p,
-            )
-
-            try:
-                response = requests.get(api_url)
-                response.raise_for_status()
-            except RequestException:
-                raise Http404
-
-            data = response.json()
-            entities.extend(data["results"])
-            has_more = data["next"] is not None
+        offset = 0
+        limit = max(pages, 0) * SEARCH_PAGE_SIZE
+
+    if not search:
+        raise Http404
+
+    try:
+        entities = search_translations(
+            request.user,
+            locale_code,
+            project_slug,
+            search,
+            search_identifiers=search_identifiers,
+            search_match_case=search_match_case,
+            search_match_whole_word=search_match_whole_word,
+        )
+    except ValidationError:
+        raise Http404
+
+    # Fetch one more result to find out if there are more pages
+    results = list(iter_search_results(entities, offset, limit + 1))
+    has_more = len(results) > limit
+    entities = EntitySearchSerializer(
+        results[:limit], many=True, context={"request": Request(request)}
+    ).data
 
     html = render_to_string(
         "search/widgets/search_results.html",
@@ -206,13 +164,8 @@ def search_results(request):
 
 def entity(request, pk):
     """Get corresponding entity given entity id."""
-    api_url = f"{SITE_URL}/api/v2/entities/{pk}/?include_translations=True"
-    try:
-        response = requests.get(api_url)
-        response.raise_for_status()
-        data = response.json()
-    except (RequestException, ValueError):
-        raise Http404
+    entity = get_object_or_404(visible_entities(request.user), pk=pk)
+    data = NestedEntitySerializer(entity).data
 
     return render(request, "search/entity.html", {"entity": data})
 
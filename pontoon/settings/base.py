@@ -793,6 +793,17 @@ VIEW_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
 # Timeout for external Machinery service cache, in seconds.
 MACHINERY_SERVICE_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
 
+# Timeout for the cached aggregated stats of projects and locales, in seconds.
+# Cached stats are also discarded whenever the stats of translated resources change.
+STATS_CACHE_TIMEOUT = int(os.environ.get("STATS_CACHE_TIMEOUT", 60 * 60))
+
+# Number of the most trigram-similar Translation Memory entries that get ranked
+# by the Levenshtein ratio. This may leave out some matches, so by default (0)
+# all entries of similar length are ranked.
+TRANSLATION_MEMORY_TRIGRAM_CANDIDATES = int(
+    os.environ.get("TRANSLATION_MEMORY_TRIGRAM_CANDIDATES", "0")
+)
+
 # Site ID is used by Django's Sites framework.
 SITE_ID = 1
 
@@ -1079,6 +1090,17 @@ except ValueError:
 
 SYNC_LOG_RETENTION = 90  # days
 
+# Number of threads used by sync to write translations to target files.
+SYNC_WRITE_WORKERS = int(os.environ.get("SYNC_WRITE_WORKERS", "4"))
+
+# Maximum number of concurrent VCS network operations (clone, pull, push)
+# across all sync workers. Set to 0 to disable the limit.
+SYNC_VCS_CONCURRENCY = int(os.environ.get("SYNC_VCS_CONCURRENCY", "4"))
+
+# Maximum number of actions saved to the action log with a single query
+# by sync, pretranslation and batch actions.
+ACTION_LOG_BATCH_SIZE = int(os.environ.get("ACTION_LOG_BATCH_SIZE", "1000"))
+
 MANUAL_SYNC = os.environ.get("MANUAL_SYNC", "True") != "False"
 
 # Celery
@@ -1331,3 +1353,11 @@ SPECTACULAR_SETTINGS = {
 
 # Maximum length of input text allowed for pretranslation
 PRETRANSLATION_API_MAX_CHARS = int(os.environ.get("PRETRANSLATION_API_MAX_CHARS", 2048))
+
+# Maximum number of concurrent machine translation requests per pretranslated locale
+PRETRANSLATION_MT_WORKERS = int(os.environ.get("PRETRANSLATION_MT_WORKERS", 4))
+
+# Maximum number of machine translation requests per second, per MT engine
+PRETRANSLATION_MT_REQUESTS_PER_SECOND = float(
+    os.environ.get("PRETRANSLATION_MT_REQUESTS_PER_SECOND", 10)
+)
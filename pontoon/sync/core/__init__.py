@@ -24,6 +24,7 @@ from pontoon.sync.core.paths import find_paths
 from pontoon.sync.core.stats import update_stats
 from pontoon.sync.core.translations_from_repo import sync_translations_from_repo
 from pontoon.sync.core.translations_to_repo import sync_translations_to_repo
+from pontoon.sync.models import Sync, sync_phase
 
 
 log = logging.getLogger(__name__)
@@ -35,8 +36,13 @@ def sync_project(
     pull: bool = True,
     commit: bool = True,
     force: bool = False,
+    sync: Sync | None = None,
 ) -> tuple[bool, bool]:
-    """`(db_changed, repo_changed)`"""
+    """
+    `(db_changed, repo_changed)`
+
+    If `sync` is set, the duration of each sync phase is recorded on it.
+    """
     # Mark "now" at the start of sync to avoid messing with
     # translations submitted during sync.
     now = timezone.now()
@@ -45,8 +51,9 @@ def sync_project(
     log.info(f"{log_prefix} Sync start")
 
     try:
-        checkouts = checkout_repos(project, force=force, pull=pull)
-        paths = find_paths(project, checkouts)
+        with sync_phase(sync, "checkout"):
+            checkouts = checkout_repos(project, force=force, pull=pull)
+            paths = find_paths(project, checkouts)
     except Exception as e:
         log.error(f"{log_prefix} {e}")
         raise e
@@ -75,15 +82,16 @@ def sync_project(
         locale_map = {lc.code: lc for lc in project.locales.order_by("code")}
     paths.locales = list(locale_map.keys())
 
-    added_entities_count, changed_paths, removed_paths = sync_resources_from_repo(
-        project, locale_map, checkouts.source, paths, now
-    )
+    with sync_phase(sync, "parse"):
+        added_entities_count, changed_paths, removed_paths = sync_resources_from_repo(
+            project, locale_map, checkouts.source, paths, now, force=force
+        )
 
     db_changes = ChangedEntityLocale.objects.filter(
         entity__resource__project=project, when__lte=now
     ).select_related("entity__resource", "locale")
     del_trans_count, updated_trans_count = sync_translations_from_repo(
-        project, locale_map, checkouts, paths, db_changes, now
+        project, locale_map, checkouts, paths, db_changes, now, sync
     )
     db_changed = bool(
         added_entities_count
@@ -104,6 +112,7 @@ def sync_project(
         changed_paths,
         removed_paths,
         now,
+        sync,
     )
     if commit:
         db_changes.delete()
@@ -111,8 +120,17 @@ def sync_project(
     checkouts.source.repo.last_synced_revision = checkouts.source.commit
     if checkouts.target != checkouts.source:
         checkouts.target.repo.last_synced_revision = checkouts.target.commit
-    if db_changed:
-        update_stats(project)
+    if changed_paths or removed_paths:
+        # Translation changes have already updated their own stats
+        with sync_phase(sync, "db_write"):
+            update_stats(
+                project,
+                resource_ids=list(
+                    project.resources.filter(
+                        path__in=changed_paths | removed_paths
+                    ).values_list("id", flat=True)
+                ),
+            )
     log.info(f"{log_prefix} Sync done")
 
     if project.pretranslation_enabled and changed_paths:
@@ -1,15 +1,77 @@
 import logging
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from hashlib import sha256
 from os import walk
 from os.path import join, normpath, relpath
+from time import monotonic, sleep
 from typing import NamedTuple
 
+from django.conf import settings
+from django.core.cache import cache
+
 from pontoon.base.models import Project, Repository
 from pontoon.sync.repositories import get_repo
 
 
 log = logging.getLogger(__name__)
 
+VCS_SLOT_POLL_INTERVAL = 1  # seconds
+
+CONTENT_HASH_SALT = b"pontoon-sync-1"
+"""Change this to invalidate all stored content hashes, e.g. if parsing changes."""
+
+
+def file_hash(path: str, source_hash: str = "") -> str:
+    """
+    A hash of the file contents,
+    stored by sync to skip parsing files that have not changed.
+
+    For target files, `source_hash` is the content hash of their source resource,
+    so that they are parsed again when its entities change.
+    """
+    hash = sha256(CONTENT_HASH_SALT + source_hash.encode())
+    with open(path, "rb") as file:
+        while chunk := file.read(1 << 16):
+            hash.update(chunk)
+    return hash.hexdigest()
+
+
+@contextmanager
+def vcs_network_slot(slug: str) -> Iterator[None]:
+    """
+    Wait for one of the `settings.SYNC_VCS_CONCURRENCY` slots
+    shared by all sync workers, and hold it for the duration of the context.
+
+    Used to limit the number of concurrent VCS network operations.
+    Slots are stored in the cache, and expire after `settings.SYNC_TASK_TIMEOUT`
+    in case a worker fails to release its slot.
+    """
+    limit = settings.SYNC_VCS_CONCURRENCY
+    if limit < 1:
+        yield
+        return
+
+    start = monotonic()
+    slot: str | None = None
+    while slot is None:
+        for idx in range(limit):
+            key = f"sync_vcs_slot_{idx}"
+            if cache.add(key, slug, timeout=settings.SYNC_TASK_TIMEOUT):
+                slot = key
+                break
+        else:
+            sleep(VCS_SLOT_POLL_INTERVAL)
+    waited = monotonic() - start
+    if waited >= VCS_SLOT_POLL_INTERVAL:
+        log.info(f"[{slug}] Waited {waited:.0f}s for a VCS network slot")
+    try:
+        yield
+    finally:
+        cache.delete(slot)
+
 
 class Checkout:
     repo: Repository
@@ -42,7 +104,8 @@ class Checkout:
 
         versioncontrol = get_repo(db_repo.type)
         if pull:
-            versioncontrol.update(self.url, self.path, db_repo.branch, shallow)
+            with vcs_network_slot(slug):
+                versioncontrol.update(self.url, self.path, db_repo.branch, shallow)
         else:
             log.info(f"[{slug}] Skipping pull")
         self.commit = versioncontrol.revision(self.path)
@@ -94,24 +157,34 @@ def checkout_repos(
     For each project repository,
     update its local checkout (unless `pull` is false),
     and provide a `Checkout` representing their current state.
+
+    Separate source and target repositories are updated concurrently.
     """
-    source: Checkout | None = None
-    target: Checkout | None = None
+    source_repo: Repository | None = None
+    target_repo: Repository | None = None
     for repo in project.repositories.all():
+        # Avoid querying for the project in the checkout threads
+        repo.project = project
         if repo.source_repo:
-            if source:
+            if source_repo:
                 raise Exception("Multiple source repositories")
-            source = Checkout(
-                project.slug, repo, force=force, pull=pull, shallow=shallow
-            )
-            log.debug(f"[{project.slug}] source root: {source.path}")
-        elif target:
+            source_repo = repo
+        elif target_repo:
             raise Exception("Multiple target repositories")
         else:
-            target = Checkout(
-                project.slug, repo, force=force, pull=pull, shallow=shallow
-            )
-            log.debug(f"[{project.slug}] target root: {target.path}")
-    if source is None and target is None:
+            target_repo = repo
+    repos = [repo for repo in (source_repo, target_repo) if repo is not None]
+    if not repos:
         raise Exception("No repository found")
-    return Checkouts(source or target, target or source)
+
+    def checkout(repo: Repository) -> Checkout:
+        return Checkout(project.slug, repo, force=force, pull=pull, shallow=shallow)
+
+    with ThreadPoolExecutor(max_workers=len(repos)) as executor:
+        results = list(executor.map(checkout, repos))
+    checkouts = Checkouts(results[0], results[-1])
+    if source_repo:
+        log.debug(f"[{project.slug}] source root: {checkouts.source.path}")
+    if target_repo:
+        log.debug(f"[{project.slug}] target root: {checkouts.target.path}")
+    return checkouts
@@ -14,6 +14,7 @@ from moz.l10n.resource import parse_resource
 from django.db import transaction
 from django.db.models import Q
 
+from pontoon.base.aggregated_stats import invalidate_stats
 from pontoon.base.models import (
     Entity,
     Locale,
@@ -22,7 +23,8 @@ from pontoon.base.models import (
     Section,
     TranslatedResource,
 )
-from pontoon.sync.core.checkout import Checkout
+from pontoon.sync.core.checkout import Checkout, file_hash
+from pontoon.sync.core.stats import update_stats
 from pontoon.sync.formats import as_entity
 
 
@@ -35,13 +37,31 @@ def sync_resources_from_repo(
     checkout: Checkout,
     paths: L10nConfigPaths | L10nDiscoverPaths,
     now: datetime,
+    *,
+    force: bool = False,
 ) -> tuple[int, set[str], set[str]]:
-    """(added_entities_count, changed_source_paths, removed_source_paths"""
+    """
+    (added_entities_count, changed_source_paths, removed_source_paths)
+
+    Changed source files with the same content hash as when they were last parsed
+    are skipped, unless `force` is set. They are still included in the
+    changed source paths if they get new translated resources,
+    so that their target files are written.
+    """
     if not checkout.changed and not checkout.removed and not checkout.renamed:
         return 0, set(), set()
     log.info(f"[{project.slug}] Syncing entities from repo...")
     # db_path -> parsed_resource
     updates: dict[str, L10nResource[Message]] = {}
+    # db_path -> content_hash
+    prev_hashes: dict[str, str] = dict(
+        Resource.objects.current()
+        .filter(project=project)
+        .exclude(content_hash="")
+        .values_list("path", "content_hash")
+    )
+    next_hashes: dict[str, str] = {}
+    skipped_paths: set[str] = set()
     source_paths = set(paths.ref_paths)
     source_plurals = ["one", "other"]
     for co_path in checkout.changed:
@@ -49,6 +69,10 @@ def sync_resources_from_repo(
         if path in source_paths and exists(path):
             db_path = get_db_path(paths, path)
             try:
+                content_hash = file_hash(path)
+                if not force and prev_hashes.get(db_path, None) == content_hash:
+                    skipped_paths.add(db_path)
+                    continue
                 res = parse_resource(
                     path,
                     gettext_plurals=source_plurals,
@@ -59,6 +83,7 @@ def sync_resources_from_repo(
                 try:
                     Resource.Format(res.format.name)
                     updates[db_path] = res
+                    next_hashes[db_path] = content_hash
                 except ValueError:
                     log.error(
                         f"[{project.slug}:{db_path}] Skipping resource with unsupported format: {res.format.name}"
@@ -75,11 +100,16 @@ def sync_resources_from_repo(
         new_res_added_ent_count, added_paths = add_resources(
             project, updates, changed_paths, now
         )
-        update_translated_resources(project, locale_map, paths)
+        tr_added_paths = update_translated_resources(project, locale_map, paths)
+        update_content_hashes(project, next_hashes)
 
+    retarget_paths = skipped_paths & tr_added_paths
+    if skip_count := len(skipped_paths - retarget_paths):
+        str_files = "source file" if skip_count == 1 else "source files"
+        log.info(f"[{project.slug}] Skipped {skip_count} unchanged {str_files}")
     return (
         old_res_added_ent_count + new_res_added_ent_count,
-        renamed_paths | changed_paths | added_paths,
+        renamed_paths | changed_paths | added_paths | retarget_paths,
         removed_paths,
     )
 
@@ -379,7 +409,8 @@ def update_translated_resources(
     project: Project,
     locale_map: dict[str, Locale],
     paths: L10nConfigPaths | L10nDiscoverPaths,
-) -> None:
+) -> set[str]:
+    """Returns the paths of resources with added translated resources."""
     prev_tr_keys: set[tuple[int, int]] = {
         (tr["resource_id"], tr["locale_id"])
         for tr in TranslatedResource.objects.filter(resource__project=project)
@@ -387,6 +418,7 @@ def update_translated_resources(
         .iterator()
     }
     add_tr: list[TranslatedResource] = []
+    add_by_res: dict[str, list[str]] = defaultdict(list)
     for resource in Resource.objects.current().filter(project=project).iterator():
         _, locales = paths.target(resource.path)
         for lc in locales:
@@ -400,7 +432,11 @@ def update_translated_resources(
                     add_tr.append(TranslatedResource(resource=resource, locale=locale))
     if add_tr:
         add_tr = TranslatedResource.objects.bulk_create(add_tr)
-        add_by_res: dict[str, list[str]] = defaultdict(list)
+        # Unchanged resources may not otherwise get their stats updated
+        update_stats(
+            project,
+            translated_resources=[(tr.locale_id, tr.resource_id) for tr in add_tr],
+        )
         for tr in add_tr:
             add_by_res[tr.resource.path].append(tr.locale.code)
         for res_path, locale_codes in add_by_res.items():
@@ -413,9 +449,23 @@ def update_translated_resources(
         for resource_id, locale_id in prev_tr_keys:
             del_tr_q |= Q(resource_id=resource_id, locale_id=locale_id)
         _, del_dict = TranslatedResource.objects.filter(del_tr_q).delete()
+        invalidate_stats((project.pk, locale_id) for _, locale_id in prev_tr_keys)
         del_count = del_dict.get("base.translatedresource", 0)
         str_tr = "translated resource" if del_count == 1 else "translated resources"
         log.info(f"[{project.slug}] Removed {del_count} {str_tr}")
+    return set(add_by_res)
+
+
+def update_content_hashes(project: Project, content_hashes: dict[str, str]) -> None:
+    if content_hashes:
+        resources = list(
+            Resource.objects.current().filter(
+                project=project, path__in=content_hashes.keys()
+            )
+        )
+        for res in resources:
+            res.content_hash = content_hashes[res.path]
+        Resource.objects.bulk_update(resources, ["content_hash"])
 
 
 def is_translated_resource(
@@ -1,55 +1,100 @@
 import logging
 
+from collections.abc import Collection
 from textwrap import dedent
 
 from django.db import connection
 
+from pontoon.base.aggregated_stats import invalidate_stats
 from pontoon.base.models import Project
 
 
 log = logging.getLogger(__name__)
 
 
-def update_stats(project: Project) -> None:
-    """Uses raw SQL queries for performance."""
+def update_stats(
+    project: Project,
+    *,
+    resource_ids: Collection[int] | None = None,
+    translated_resources: Collection[tuple[int, int]] | None = None,
+) -> None:
+    """
+    Uses raw SQL queries for performance.
+
+    By default, recalculates the stats of all resources and translated resources
+    of the project. To only update the stats affected by a change, set either:
+
+    :arg resource_ids: Resources with changed entities. Their stats are updated,
+        along with the stats of all of their translated resources.
+    :arg translated_resources: `(locale_id, resource_id)` pairs of translated
+        resources with changed translations.
+    """
+    scoped = resource_ids is not None or translated_resources is not None
+    res_ids = list(resource_ids or [])
+    tr_locale_ids = [locale_id for locale_id, _ in translated_resources or []]
+    tr_resource_ids = [resource_id for _, resource_id in translated_resources or []]
+    if scoped and not res_ids and not tr_locale_ids:
+        return
+
+    def scope(locale_column: str, resource_column: str) -> tuple[str, list]:
+        if not scoped:
+            return "", []
+        return (
+            f"""AND (
+                    {resource_column} = ANY(%s)
+                    OR ({locale_column}, {resource_column}) IN (
+                        SELECT * FROM unnest(%s::integer[], %s::integer[])
+                    )
+                )""",
+            [res_ids, tr_locale_ids, tr_resource_ids],
+        )
 
     with connection.cursor() as cursor:
         # Resources, counted from entities
-        cursor.execute(
-            dedent(
-                """
-                UPDATE base_resource res
-                SET total_strings = agg.total
-                FROM (
-                    SELECT ent.resource_id AS "resource_id", COUNT(*) AS "total"
-                    FROM "base_entity" ent
-                    LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
-                    WHERE NOT ent.obsolete AND res.project_id = %s
-                    GROUP BY ent.resource_id
-                ) AS agg
-                WHERE res.id = agg.resource_id AND res.project_id = %s
-                """
-            ),
-            [project.id, project.id],
-        )
+        if not scoped or res_ids:
+            res_scope, res_params = (
+                ("AND res.id = ANY(%s)", [res_ids]) if scoped else ("", [])
+            )
+            cursor.execute(
+                dedent(
+                    f"""
+                    UPDATE base_resource res
+                    SET total_strings = agg.total
+                    FROM (
+                        SELECT ent.resource_id AS "resource_id", COUNT(*) AS "total"
+                        FROM "base_entity" ent
+                        LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
+                        WHERE NOT ent.obsolete AND res.project_id = %s {res_scope}
+                        GROUP BY ent.resource_id
+                    ) AS agg
+                    WHERE res.id = agg.resource_id AND res.project_id = %s
+                    """
+                ),
+                [project.id, *res_params, project.id],
+            )
 
         # Translated resources, copied from resources
+        tr_scope, tr_params = scope("tr.locale_id", "tr.resource_id")
         cursor.execute(
             dedent(
-                """
+                f"""
                 UPDATE "base_translatedresource" tr
                 SET total_strings = res.total_strings
                 FROM "base_resource" res
-                WHERE tr.resource_id = res.id AND res.project_id = %s
+                WHERE tr.resource_id = res.id AND res.project_id = %s {tr_scope}
+                RETURNING tr.locale_id
                 """
             ),
-            [project.id],
+            [project.id, *tr_params],
         )
+        # Includes all translated resources of the next query
+        locale_ids = {locale_id for (locale_id,) in cursor.fetchall()}
 
         # Other translated resource string counts, counted directly from translations
+        trans_scope, trans_params = scope("trans.locale_id", "ent.resource_id")
         cursor.execute(
             dedent(
-                """
+                f"""
                 UPDATE base_translatedresource tr
                 SET
                     approved_strings = agg.approved,
@@ -71,16 +116,18 @@ def update_stats(project: Project) -> None:
                     LEFT OUTER JOIN "checks_warning" warn ON (trans.id = warn.translation_id)
                     LEFT OUTER JOIN "base_entity" ent ON (trans.entity_id = ent.id)
                     LEFT OUTER JOIN "base_resource" res ON (ent.resource_id = res.id)
-                    WHERE NOT ent.obsolete AND res.project_id = %s
+                    WHERE NOT ent.obsolete AND res.project_id = %s {trans_scope}
                     GROUP BY trans.locale_id, ent.resource_id
                 ) AS agg
                 WHERE agg.locale_id = tr.locale_id AND agg.resource_id = tr.resource_id
                 """
             ),
-            [project.id],
+            [project.id, *trans_params],
         )
         tr_count = cursor.rowcount
 
+    invalidate_stats((project.id, locale_id) for locale_id in locale_ids)
+
     tr_str = (
         "1 translated resource" if tr_count == 1 else f"{tr_count} translated resources"
     )
@@ -1,9 +1,10 @@
 import logging
 
 from collections import defaultdict
-from collections.abc import Iterable, Sized
+from collections.abc import Iterable, Iterator, Sized
 from datetime import datetime
 from os.path import join, relpath, splitext
+from typing import Any
 
 from fluent.syntax import FluentParser
 from moz.l10n.formats import l10n_extensions
@@ -12,12 +13,13 @@ from moz.l10n.model import Id as L10nId
 from moz.l10n.paths import L10nConfigPaths, L10nDiscoverPaths, parse_android_locale
 from moz.l10n.resource import parse_resource
 
-from django.core.paginator import Paginator
+from django.conf import settings
 from django.db import transaction
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
 from pontoon.actionlog.models import ActionLog
+from pontoon.actionlog.utils import save_actions
 from pontoon.base.models import (
     ChangedEntityLocale,
     Entity,
@@ -30,12 +32,19 @@ from pontoon.base.models import (
     User,
     UserProfile,
 )
+from pontoon.base.models.contribution_count import (
+    adjust_contribution_counts,
+    count_contributions,
+)
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.base.user_utils import get_system_user
 from pontoon.checks import DB_FORMATS
 from pontoon.checks.utils import bulk_run_checks
-from pontoon.sync.core.checkout import Checkout, Checkouts
+from pontoon.sync.core.checkout import Checkout, Checkouts, file_hash
 from pontoon.sync.core.paths import UploadPaths
+from pontoon.sync.core.stats import update_stats
 from pontoon.sync.formats import RepoTranslation, as_repo_translations
+from pontoon.sync.models import Sync, sync_phase
 
 
 log = logging.getLogger(__name__)
@@ -43,6 +52,15 @@ log = logging.getLogger(__name__)
 Updates = dict[tuple[int, int], RepoTranslation | None]
 """ (entity.id, locale.id) -> RepoTranslation """
 
+ContentHashes = dict[tuple[int, int], str]
+""" (resource.id, locale.id) -> content_hash """
+
+UPDATES_BATCH_SIZE = 10_000
+"""
+Translation updates are written to the database once at least this many
+have been found, or once all changed resources have been processed.
+"""
+
 
 def sync_translations_from_repo(
     project: Project,
@@ -51,19 +69,21 @@ def sync_translations_from_repo(
     paths: L10nConfigPaths | L10nDiscoverPaths,
     db_changes: QuerySet[ChangedEntityLocale, ChangedEntityLocale],
     now: datetime,
+    sync: Sync | None = None,
 ) -> tuple[int, int]:
     """(removed_resource_count, updated_translation_count)"""
     co = checkouts.target
     source_paths: set[str] = set(paths.ref_paths) if checkouts.source == co else set()
-    del_count = (
-        delete_removed_resources(project, co, paths, source_paths)
-        if (
-            isinstance(paths, L10nDiscoverPaths)
-            and project.set_locales_from_repo
-            and project.set_translated_resources_from_repo
+    with sync_phase(sync, "db_write"):
+        del_count = (
+            delete_removed_resources(project, co, paths, source_paths)
+            if (
+                isinstance(paths, L10nDiscoverPaths)
+                and project.set_locales_from_repo
+                and project.set_translated_resources_from_repo
+            )
+            else 0
         )
-        else 0
-    )
 
     changed_target_paths = [
         path
@@ -74,23 +94,51 @@ def sync_translations_from_repo(
         n = len(changed_target_paths)
         str_files = "file" if n == 1 else "files"
         log.info(f"[{project.slug}] Reading changes from {n} target {str_files}")
-    updates = find_db_updates(
-        project, locale_map, changed_target_paths, paths, db_changes
+    content_hashes: ContentHashes = {}
+    batches = iter_db_updates(
+        project, locale_map, changed_target_paths, paths, db_changes, content_hashes
     )
-    update_count = 0 if updates is None else len(updates)
-    if updates:
-        write_db_updates(project, updates, None, now)
+    update_count = 0
+    while True:
+        with sync_phase(sync, "parse"):
+            updates = next(batches, None)
+        if updates is None:
+            break
+        update_count += len(updates)
+        with sync_phase(sync, "db_write"):
+            write_db_updates(project, updates, None, now)
+    with sync_phase(sync, "db_write"):
+        update_content_hashes(content_hashes)
     return del_count, update_count
 
 
 def write_db_updates(
     project: Project, updates: Updates, user: User | None, now: datetime
 ) -> None:
+    """
+    Write translation updates to the database, and update the statuses of the
+    affected entities, the contribution counts of their translations,
+    and the stats of the affected translated resources.
+    """
+    entity_resources = dict(
+        Entity.objects.filter(id__in={entity_id for entity_id, _ in updates})
+        .values_list("id", "resource_id")
+        .iterator()
+    )
+    translated_resources = {
+        (locale_id, entity_resources[entity_id]) for entity_id, locale_id in updates
+    }
+    # update_db_translations() removes the suggestions it approves from `updates`
+    pairs = set(updates)
+    contributions_before = count_contributions(pairs)
     updated_translations, new_translations = update_db_translations(
         project, updates, user, now
     )
     add_failed_checks(new_translations)
     add_translation_memory_entries(project, new_translations + updated_translations)
+    update_entity_statuses(pairs)
+    adjust_contribution_counts(contributions_before, count_contributions(pairs))
+    update_stats(project, translated_resources=translated_resources)
 
 
 def delete_removed_resources(
@@ -123,9 +171,14 @@ def delete_removed_resources(
         str_del_resources = "deleted resource" if count == 1 else "deleted resources"
         log.info(f"[{project.slug}] Removing {count} {str_del_resources}")
         with transaction.atomic():
-            Translation.objects.filter(entity__resource__project=project).filter(
-                rm_t
-            ).delete()
+            translations = Translation.objects.filter(
+                entity__resource__project=project
+            ).filter(rm_t)
+            pairs = set(translations.values_list("entity_id", "locale_id"))
+            contributions_before = count_contributions(pairs)
+            translations.delete()
+            update_entity_statuses(pairs)
+            adjust_contribution_counts(contributions_before, count_contributions(pairs))
             TranslatedResource.objects.filter(resource__project=project).filter(
                 rm_tr
             ).delete()
@@ -138,143 +191,221 @@ def find_db_updates(
     changed_target_paths: Iterable[str],
     paths: L10nConfigPaths | L10nDiscoverPaths | UploadPaths,
     db_changes: Iterable[ChangedEntityLocale],
+    content_hashes: ContentHashes | None = None,
 ) -> Updates | None:
     """
     `(entity.id, locale.id) -> RepoTranslation`
 
+    All batches of `iter_db_updates()` in a single dict.
+    """
+    updates: Updates = {}
+    for batch in iter_db_updates(
+        project, locale_map, changed_target_paths, paths, db_changes, content_hashes
+    ):
+        updates.update(batch)
+    return updates or None
+
+
+def iter_db_updates(
+    project: Project,
+    locale_map: dict[str, Locale],
+    changed_target_paths: Iterable[str],
+    paths: L10nConfigPaths | L10nDiscoverPaths | UploadPaths,
+    db_changes: Iterable[ChangedEntityLocale],
+    content_hashes: ContentHashes | None = None,
+) -> Iterator[Updates]:
+    """
+    Batches of `(entity.id, locale.id) -> RepoTranslation`
+
     Translations in changed resources, excluding:
     - Exact matches with previous approved or pretranslated translations
     - Entity/Locale combos for which Pontoon has changes since the last sync
     - Translations for which no matching entity is found
+
+    Resources are processed one at a time, and their updates are yielded
+    in batches of at least `UPDATES_BATCH_SIZE` updates, so that they can be
+    written before the next resources are processed. Peak memory use then
+    depends on the size of the largest resource rather than of the project.
+
+    If `content_hashes` is set, target files with the same content hash
+    as when they were last parsed, for the same source resource, are skipped,
+    and the content hashes of the parsed files are added to it.
     """
     log.debug(f"[{project.slug}] Scanning for translation updates...")
-    resource_paths: set[str] = set()
-    # db_path -> {locale.id}
-    translated_resources: dict[str, set[int]] = defaultdict(set)
-    # (db_path, tx.key, locale.id) -> RepoTranslation|None
-    translations: dict[tuple[str, L10nId, int], RepoTranslation | None] = {}
+    # db_path -> [(target_path, locale)]
+    targets: dict[str, list[tuple[str, Locale]]] = defaultdict(list)
     for target_path in changed_target_paths:
         ref = paths.find_reference(target_path)
         if ref:
             ref_path, path_vars = ref
             lc = get_path_locale(path_vars)
             if lc in locale_map:
-                locale = locale_map[lc]
                 db_path = relpath(ref_path, paths.ref_root)
-                try:
-                    l10n_res = parse_resource(
-                        target_path,
-                        gettext_plurals=locale.cldr_plurals_list(),
-                        gettext_skip_obsolete=True,
-                    )
-                    if not project.configuration_file and db_path.endswith(".pot"):
-                        db_path = db_path[:-1]
-                    resource_paths.add(db_path)
-                    translated_resources[db_path].add(locale.pk)
-                    translations.update(
-                        ((db_path, rt.key, locale.pk), rt)
-                        for rt in as_repo_translations(l10n_res)
-                    )
-                except Exception as error:
-                    scope = f"[{project.slug}:{db_path}, {locale.code}]"
-                    log.warning(f"{scope} Skipping resource with parse error: {error}")
+                if not project.configuration_file and db_path.endswith(".pot"):
+                    db_path = db_path[:-1]
+                targets[db_path].append((target_path, locale_map[lc]))
         elif splitext(target_path)[1] in l10n_extensions and not isinstance(
             paths, UploadPaths
         ):
             log.debug(
                 f"[{project.slug}:{relpath(target_path, paths.base)}] Not an L10n target path"
             )
-    if not translations:
-        return None
+    if not targets:
+        return
 
     resources: dict[str, Resource] = {
         res.path: res
         for res in Resource.objects.current()
-        .filter(project=project, path__in=resource_paths)
+        .filter(project=project, path__in=targets)
         .iterator()
     }
 
-    # Exclude translations for which DB & repo already match
-    # TODO: Should be able to use repo diff to identify changed entities and refactor this.
-    trans_q = Q()
-    for db_path, locale_ids in translated_resources.items():
+    # If repo and database both have changes, database wins.
+    db_changed = {(change.entity_id, change.locale_id) for change in db_changes}
+
+    prev_hashes: ContentHashes = (
+        {
+            (tr["resource_id"], tr["locale_id"]): tr["content_hash"]
+            for tr in TranslatedResource.objects.filter(resource__in=resources.values())
+            .exclude(content_hash="")
+            .values("resource_id", "locale_id", "content_hash")
+            .iterator()
+        }
+        if content_hashes is not None
+        else {}
+    )
+
+    updates: Updates = {}
+    update_count = 0
+    for idx, (db_path, res_targets) in enumerate(targets.items(), start=1):
         res = resources.get(db_path, None)
         if res is not None:
-            trans_q |= Q(entity__resource=res, locale_id__in=locale_ids)
-    if trans_q:
-        log.debug(f"[{project.slug}] Filtering matches from translations...")
-        trans_query = (
-            Translation.objects.filter(trans_q)
-            .filter(Q(entity__obsolete=False))
-            .filter(Q(approved=True) | Q(pretranslated=True))
-            .order_by("id")
-            .values(
-                "entity__resource__path",
-                "entity__resource__format",
-                "entity__key",
-                "locale_id",
-                "string",
-            )
-        )
-        paginator = Paginator(trans_query, per_page=10000, allow_empty_first_page=True)
-        for page_number in paginator.page_range:
-            page = paginator.page(page_number)
-            for trans_values in page:
-                key = (
-                    trans_values["entity__resource__path"],
-                    tuple(trans_values["entity__key"]),
-                    trans_values["locale_id"],
+            updates.update(
+                find_resource_updates(
+                    project, res, res_targets, db_changed, prev_hashes, content_hashes
                 )
-                if key in translations:
-                    rt = translations[key]
-                    if rt is not None and translations_equal(
-                        project,
-                        key[0],
-                        trans_values["entity__resource__format"],
-                        rt.string,
-                        trans_values["string"],
-                    ):
-                        del translations[key]
-                else:
-                    # The translation has been removed from the repo
-                    translations[key] = None
-            if paginator.num_pages > 3:
-                log.debug(
-                    f"[{project.slug}] Filtering matches from translations... {page_number}/{paginator.num_pages}"
-                )
-    if not translations:
-        return None
+            )
+        if len(targets) > 100 and idx % 100 == 0:
+            log.debug(
+                f"[{project.slug}] Scanning for translation updates... {idx}/{len(targets)}"
+            )
+        if len(updates) >= UPDATES_BATCH_SIZE:
+            update_count += len(updates)
+            yield updates
+            updates = {}
+    update_count += len(updates)
+    log.debug(f"[{project.slug}] Compiling updates... Found {update_count}")
+    if updates:
+        yield updates
 
-    # If repo and database both have changes, database wins.
-    log.debug(f"[{project.slug}] Filtering db changes from translations...")
-    for change in db_changes:
-        key = (
-            change.entity.resource.path,
-            tuple(change.entity.key),
-            change.locale_id,
-        )
-        if key in translations:
-            del translations[key]
-    if not translations:
-        return None
 
-    log.debug(f"[{project.slug}] Compiling updates...")
-    trans_res = {
-        resources[db_path] for db_path, _, _ in translations if db_path in resources
-    }
-    entities: dict[tuple[str, L10nId], int] = {
-        (e["resource__path"], tuple(e["key"])): e["id"]
-        for e in Entity.objects.filter(resource__in=trans_res, obsolete=False)
-        .values("id", "key", "resource__path")
+def find_resource_updates(
+    project: Project,
+    res: Resource,
+    targets: list[tuple[str, Locale]],
+    db_changed: set[tuple[int, int]],
+    prev_hashes: ContentHashes,
+    content_hashes: ContentHashes | None,
+) -> Updates:
+    """
+    `(entity.id, locale.id) -> RepoTranslation`
+
+    Translation updates for a single resource,
+    from its changed `(target_path, locale)` files.
+    """
+    entities: dict[L10nId, int] = {
+        tuple(key): entity_id
+        for entity_id, key in Entity.objects.filter(resource=res, obsolete=False)
+        .values_list("id", "key")
         .iterator()
     }
-    updates: Updates = {}
-    for (db_path, ent_key, locale_id), rt in translations.items():
-        entity_id = entities.get((db_path, ent_key), None)
-        if entity_id is not None:
-            updates[(entity_id, locale_id)] = rt
-    log.debug(f"[{project.slug}] Compiling updates... Found {len(updates)}")
-    return updates
+
+    translations: Updates = {}
+    locale_ids: set[int] = set()
+    for target_path, locale in targets:
+        try:
+            if content_hashes is not None:
+                content_hash = file_hash(target_path, res.content_hash)
+                if prev_hashes.get((res.pk, locale.pk), None) == content_hash:
+                    continue
+            l10n_res = parse_resource(
+                target_path,
+                gettext_plurals=locale.cldr_plurals_list(),
+                gettext_skip_obsolete=True,
+            )
+            rt_list = list(as_repo_translations(l10n_res))
+        except Exception as error:
+            scope = f"[{project.slug}:{res.path}, {locale.code}]"
+            log.warning(f"{scope} Skipping resource with parse error: {error}")
+            continue
+        if content_hashes is not None:
+            content_hashes[(res.pk, locale.pk)] = content_hash
+        locale_ids.add(locale.pk)
+        for rt in rt_list:
+            entity_id = entities.get(rt.key, None)
+            if entity_id is not None:
+                translations[(entity_id, locale.pk)] = rt
+    if not locale_ids:
+        return {}
+
+    # Exclude translations for which DB & repo already match
+    # TODO: Should be able to use repo diff to identify changed entities and refactor this.
+    trans_query = (
+        Translation.objects.filter(
+            entity__resource=res, entity__obsolete=False, locale_id__in=locale_ids
+        )
+        .filter(Q(approved=True) | Q(pretranslated=True))
+        .values("id", "entity_id", "locale_id", "string")
+    )
+    for trans_values in iter_keyset(trans_query):
+        key = (trans_values["entity_id"], trans_values["locale_id"])
+        if key in translations:
+            rt = translations[key]
+            if rt is not None and translations_equal(
+                project, res.path, res.format, rt.string, trans_values["string"]
+            ):
+                del translations[key]
+        else:
+            # The translation has been removed from the repo
+            translations[key] = None
+
+    for key in db_changed.intersection(translations):
+        del translations[key]
+    return translations
+
+
+def iter_keyset(query: QuerySet, chunk_size: int = 10000) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over the `.values()` of `query` in chunks ordered by `id`.
+
+    Unlike offset pagination, each chunk is a cheap index range scan,
+    no matter how deep into the results it is.
+    """
+    last_id = 0
+    while True:
+        chunk = list(query.filter(id__gt=last_id).order_by("id")[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            break
+        last_id = chunk[-1]["id"]
+
+
+def update_content_hashes(content_hashes: ContentHashes) -> None:
+    """Store the content hashes of parsed target files."""
+    if content_hashes:
+        translated_resources = [
+            tr
+            for tr in TranslatedResource.objects.filter(
+                resource_id__in={resource_id for resource_id, _ in content_hashes},
+                locale_id__in={locale_id for _, locale_id in content_hashes},
+            ).only("resource_id", "locale_id", "content_hash")
+            if (tr.resource_id, tr.locale_id) in content_hashes
+        ]
+        for tr in translated_resources:
+            tr.content_hash = content_hashes[(tr.resource_id, tr.locale_id)]
+        TranslatedResource.objects.bulk_update(
+            translated_resources, ["content_hash"], batch_size=1000
+        )
 
 
 def translations_equal(
@@ -470,8 +601,7 @@ def update_db_translations(
     if created:
         log.info(f"{scope} Created {str_n_translations(created)} from repo changes")
 
-    if actions:
-        ActionLog.objects.bulk_create(actions)
+    save_actions(actions, batch_size=settings.ACTION_LOG_BATCH_SIZE)
 
     return created, list(suggestions.values())
 
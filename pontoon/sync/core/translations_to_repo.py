@@ -1,9 +1,14 @@
 import logging
 
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime
 from os import makedirs, remove
 from os.path import commonpath, dirname, isfile, join, normpath
+from typing import NamedTuple
 
 from moz.l10n.formats import Format
 from moz.l10n.formats.xliff import xliff_is_xcode
@@ -27,7 +32,12 @@ from django.db.models.query import QuerySet
 
 from pontoon.base.models import Locale, Project, Translation, User
 from pontoon.base.models.changed_entity_locale import ChangedEntityLocale
-from pontoon.sync.core.checkout import Checkouts
+from pontoon.sync.core.checkout import Checkouts, file_hash, vcs_network_slot
+from pontoon.sync.core.translations_from_repo import (
+    ContentHashes,
+    update_content_hashes,
+)
+from pontoon.sync.models import Sync, sync_phase
 from pontoon.sync.repositories import CommitToRepositoryException, get_repo
 
 
@@ -69,21 +79,23 @@ def sync_translations_to_repo(
     changed_source_paths: set[str],
     removed_source_paths: set[str],
     now: datetime,
+    sync: Sync | None = None,
 ) -> bool:
     """Returns `True` if the sync includes changes to the repo."""
-    readonly_locales = project.locales.filter(project_locale__readonly=True)
-    removed = delete_removed_resources(
-        project, paths, locale_map, readonly_locales, removed_source_paths
-    )
-    updated, updated_locales, translators = update_changed_resources(
-        project,
-        paths,
-        locale_map,
-        readonly_locales,
-        db_changes,
-        changed_source_paths,
-        now,
-    )
+    with sync_phase(sync, "serialize"):
+        readonly_locales = project.locales.filter(project_locale__readonly=True)
+        removed = delete_removed_resources(
+            project, paths, locale_map, readonly_locales, removed_source_paths
+        )
+        updated, updated_locales, translators = update_changed_resources(
+            project,
+            paths,
+            locale_map,
+            readonly_locales,
+            db_changes,
+            changed_source_paths,
+            now,
+        )
     if not removed and not updated:
         return False
 
@@ -112,7 +124,8 @@ def sync_translations_to_repo(
     co = checkouts.target
     repo = get_repo(co.repo.type)
     try:
-        repo.commit(co.path, commit_msg, commit_author, co.repo.branch, co.url)
+        with sync_phase(sync, "commit"), vcs_network_slot(project.slug):
+            repo.commit(co.path, commit_msg, commit_author, co.repo.branch, co.url)
         co.commit = repo.revision(co.path)
     except CommitToRepositoryException as error:
         log.warning(f"[{project.slug}] {co.repo.type} commit failed: {error}")
@@ -180,78 +193,180 @@ def update_changed_resources(
 
     updated_locales: set[Locale] = set()
     translators: dict[User, set[str]] = defaultdict(set)
-    for path, locales_ in changed_resources.items():
-        log_scope = f"[{project.slug}:{path}]"
-        target, locale_codes = paths.target(path)
-        if target is None:
-            continue
-        if commonpath((paths.base or "", target)) != paths.base:
-            log.error(f"{log_scope} Invalid resource path")
-            continue
-        locales = locales_ or {
-            locale
-            for locale in (
-                locale_map[lc] for lc in sorted(locale_codes) if lc in locale_map
-            )
-            if locale not in readonly_locales
-        }
-        if not locales:
-            continue
-        ref_path = normpath(join(paths.ref_root, path))
-        if ref_path.endswith(".po"):
-            ref_path += "t"
-        if not isfile(ref_path):
-            log.error(f"{log_scope} Missing source file")
-            continue
-        if locales_:
-            lc_str = ", ".join(locale.code for locale in locales_)
-            log.info(f"{log_scope} Updating locales: {lc_str}")
-        else:
-            log.info(f"{log_scope} Updating all locales")
-
-        translations = (
-            Translation.objects.filter(
-                entity__obsolete=False,
-                entity__resource__project_id=project.pk,
-                entity__resource__path=path,
-                locale__in=[locale.pk for locale in locales],
-                active=True,
-            )
-            .filter(
-                Q(approved=True)
-                | Q(pretranslated=True, warnings__isnull=True)
-                | Q(fuzzy=True)
-            )
-            .exclude(approved_date__gt=now)  # includes approved_date = None
-            .select_related("entity")
-        )
-        for locale in locales:
-            lc_scope = f"[{project.slug}:{path}, {locale.code}]"
-            lc_translations = [tx for tx in translations if tx.locale_id == locale.pk]
-            target_path = paths.format_target_path(target, locale.code)
-            if not lc_translations and not isfile(target_path):
+    # path -> (resource.id, resource.content_hash)
+    resource_hashes: dict[str, tuple[int, str]] = {
+        path: (res_id, source_hash)
+        for path, res_id, source_hash in project.resources.filter(
+            path__in=changed_resources.keys()
+        ).values_list("path", "id", "content_hash")
+    }
+    # The written target files have been parsed as far as the next sync is concerned
+    content_hashes: ContentHashes = {}
+    with target_write_pool() as pool:
+        for path, locales_ in changed_resources.items():
+            log_scope = f"[{project.slug}:{path}]"
+            target, locale_codes = paths.target(path)
+            if target is None:
+                continue
+            if commonpath((paths.base or "", target)) != paths.base:
+                log.error(f"{log_scope} Invalid resource path")
+                continue
+            locales = locales_ or {
+                locale
+                for locale in (
+                    locale_map[lc] for lc in sorted(locale_codes) if lc in locale_map
+                )
+                if locale not in readonly_locales
+            }
+            if not locales:
+                continue
+            ref_path = normpath(join(paths.ref_root, path))
+            if ref_path.endswith(".po"):
+                ref_path += "t"
+            if not isfile(ref_path):
+                log.error(f"{log_scope} Missing source file")
                 continue
+            if locales_:
+                lc_str = ", ".join(locale.code for locale in locales_)
+                log.info(f"{log_scope} Updating locales: {lc_str}")
+            else:
+                log.info(f"{log_scope} Updating all locales")
+
             try:
-                lc_plurals = locale.cldr_plurals_list()
-                res = parse_resource(ref_path)
-                set_translations(locale, lc_translations, res)
-                makedirs(dirname(target_path), exist_ok=True)
-                with open(target_path, "w", encoding="utf-8") as file:
-                    for line in serialize_resource(res, gettext_plurals=lc_plurals):
-                        file.write(line)
+                ref_res = parse_resource(ref_path)
+            except Exception as error:
+                log.error(f"{log_scope} Update failed: {error}")
+                continue
+
+            translations = (
+                Translation.objects.filter(
+                    entity__obsolete=False,
+                    entity__resource__project_id=project.pk,
+                    entity__resource__path=path,
+                    locale__in=[locale.pk for locale in locales],
+                    active=True,
+                )
+                .filter(
+                    Q(approved=True)
+                    | Q(pretranslated=True, warnings__isnull=True)
+                    | Q(fuzzy=True)
+                )
+                .exclude(approved_date__gt=now)  # includes approved_date = None
+                .select_related("entity")
+            )
+            # locale.pk -> [Translation]
+            lc_translations: dict[int, list[Translation]] = defaultdict(list)
+            for tx in translations:
+                lc_translations[tx.locale_id].append(tx)
+
+            writes: list[tuple[Locale, TargetWrite]] = []
+            for locale in locales:
+                target_path = paths.format_target_path(target, locale.code)
+                if not lc_translations[locale.pk] and not isfile(target_path):
+                    continue
+                write = TargetWrite(
+                    target_path,
+                    locale,
+                    [
+                        TargetTranslation(tuple(tx.entity.key), tx.string, tx.fuzzy)
+                        for tx in lc_translations[locale.pk]
+                    ],
+                )
+                writes.append((locale, write))
+
+            target_paths = {locale.pk: write.target_path for locale, write in writes}
+            for locale, error in run_target_writes(ref_res, writes, pool):
+                if error is not None:
+                    lc_scope = f"[{project.slug}:{path}, {locale.code}]"
+                    log.error(f"{lc_scope} Update failed: {error}")
+                    continue
+                if path in resource_hashes:
+                    res_id, source_hash = resource_hashes[path]
+                    content_hashes[(res_id, locale.pk)] = file_hash(
+                        target_paths[locale.pk], source_hash
+                    )
                 updated_locales.add(locale)
-                for tx in lc_translations:
+                for tx in lc_translations[locale.pk]:
                     if tx.approved and tx.entity in changed_entities and tx.user:
                         translators[tx.user].add(locale.code)
                 count += 1
-            except Exception as error:
-                log.error(f"{lc_scope} Update failed: {error}")
-                continue
+    update_content_hashes(content_hashes)
     return count, updated_locales, translators
 
 
+class TargetTranslation(NamedTuple):
+    """The parts of a `Translation` needed to write it to a target file."""
+
+    key: tuple[str, ...]
+    string: str
+    fuzzy: bool
+
+
+class TargetWrite(NamedTuple):
+    target_path: str
+    locale: Locale
+    translations: list[TargetTranslation]
+
+
+@contextmanager
+def target_write_pool() -> Iterator[ThreadPoolExecutor | None]:
+    """
+    A pool of `SYNC_WRITE_WORKERS` threads for `run_target_writes()`,
+    or `None` to write the target files in the calling thread.
+
+    Threads are used rather than processes, as sync runs in Celery workers,
+    which cannot start child processes. The serialization is CPU-bound and
+    runs under the GIL, so the threads only overlap the file I/O of the writes.
+    """
+    if settings.SYNC_WRITE_WORKERS <= 1:
+        yield None
+        return
+    with ThreadPoolExecutor(settings.SYNC_WRITE_WORKERS) as pool:
+        yield pool
+
+
+def run_target_writes(
+    ref_res: Resource,
+    writes: list[tuple[Locale, TargetWrite]],
+    pool: ThreadPoolExecutor | None = None,
+) -> Iterator[tuple[Locale, Exception | None]]:
+    """
+    Write the translations of each locale into a copy of the reference resource.
+
+    With a `pool` from `target_write_pool()`, multiple writes are run
+    in its threads. The writes never access the database.
+    Each write copies the reference resource when it starts,
+    so at most one copy per thread is kept in memory.
+    """
+    if pool is None or len(writes) <= 1:
+        for locale, write in writes:
+            try:
+                write_target(ref_res, write)
+                yield locale, None
+            except Exception as error:
+                yield locale, error
+        return
+
+    futures = {
+        pool.submit(write_target, ref_res, write): locale for locale, write in writes
+    }
+    for future in as_completed(futures):
+        yield futures[future], future.exception()
+
+
+def write_target(ref_res: Resource, write: TargetWrite) -> None:
+    """Writes the translations into a copy of `ref_res`, which is not modified."""
+    res = deepcopy(ref_res)
+    locale = write.locale
+    set_translations(locale, write.translations, res)
+    makedirs(dirname(write.target_path), exist_ok=True)
+    with open(write.target_path, "w", encoding="utf-8") as file:
+        for line in serialize_resource(res, gettext_plurals=locale.cldr_plurals_list()):
+            file.write(line)
+
+
 def set_translations(
-    locale: Locale, translations: list[Translation], res: Resource
+    locale: Locale, translations: list[TargetTranslation], res: Resource
 ) -> None:
     if res.format == Format.fluent:
         trans_res = parse_resource(
@@ -264,12 +379,12 @@ def set_translations(
             if isinstance(entry, Entry)
         }
         for section in res.sections:
-            rm: list[Entry] = []
+            rm_ids: set[int] = set()
             for entry in section.entries:
                 if isinstance(entry, Entry):
                     te = trans_entries.get(entry.id, None)
                     if te is None:
-                        rm.append(entry)
+                        rm_ids.add(id(entry))
                     else:
                         entry.value = te.value
                         entry.properties = (
@@ -281,9 +396,14 @@ def set_translations(
                                 if name in entry.properties
                             }
                         )
-            if rm:
-                section.entries = [e for e in section.entries if e not in rm]
+            if rm_ids:
+                section.entries = [e for e in section.entries if id(e) not in rm_ids]
     else:
+        # If multiple translations have the same key, the first one is used.
+        trans_index: dict[Id, TargetTranslation] = {}
+        for tx in translations:
+            trans_index.setdefault(tx.key, tx)
+
         # The iOS locale remapping is a hacky workaround for Xcode projects only,
         # so don't apply it to other XLIFF projects.
         is_xcode = res.format == Format.xliff and xliff_is_xcode(res)
@@ -305,13 +425,13 @@ def set_translations(
                 else:
                     prev_tgt.value = lc
 
-            rm: list[Entry] = []
+            rm_ids: set[int] = set()
             for entry in section.entries:
                 if isinstance(entry, Entry):
-                    if not set_translation(translations, res.format, section, entry):
-                        rm.append(entry)
-            if rm and res.format not in (Format.gettext, Format.xliff):
-                section.entries = [e for e in section.entries if e not in rm]
+                    if not set_translation(trans_index, res.format, section, entry):
+                        rm_ids.add(id(entry))
+            if rm_ids and res.format not in (Format.gettext, Format.xliff):
+                section.entries = [e for e in section.entries if id(e) not in rm_ids]
 
     match res.format:
         case Format.gettext:
@@ -337,13 +457,12 @@ def set_translations(
 
 
 def set_translation(
-    translations: list[Translation],
+    translations: dict[Id, TargetTranslation],
     format: Format | None,
     section: Section,
     entry: Entry,
 ) -> bool:
-    key = list(section.id + entry.id)
-    tx = next((tx for tx in translations if tx.entity.key == key), None)
+    tx = translations.get(section.id + entry.id, None)
     if tx is None:
         if format == Format.gettext:
             if isinstance(entry.value, SelectMessage):
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
 
-from pontoon.base.models import Project
+from pontoon.base.models import ChangedEntityLocale, Project
 from pontoon.sync.tasks import sync_project_task
 
 
@@ -72,7 +73,7 @@ class Command(BaseCommand):
                 )
             )
 
-        for project in projects:
+        for project in self.sync_order(projects):
             self.stdout.write(f"Scheduling sync for project {project.name}.")
             sync_project_task.delay(
                 project.pk,
@@ -80,3 +81,22 @@ class Command(BaseCommand):
                 commit=not options["no_commit"],
                 force=options["force"],
             )
+
+    def sync_order(self, projects):
+        """
+        Schedule higher priority projects first,
+        and within the same priority the ones with most pending changes.
+        """
+        pending_changes = dict(
+            ChangedEntityLocale.objects.filter(entity__resource__project__in=projects)
+            .values_list("entity__resource__project")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        return sorted(
+            projects,
+            key=lambda project: (
+                -project.priority,
+                -pending_changes.get(project.pk, 0),
+            ),
+        )
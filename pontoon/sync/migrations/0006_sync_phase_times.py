@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sync", "0005_remove_old_sync_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="checkout_time",
+            field=models.DurationField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="parse_time",
+            field=models.DurationField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="db_write_time",
+            field=models.DurationField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="serialize_time",
+            field=models.DurationField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="commit_time",
+            field=models.DurationField(blank=True, default=None, null=True),
+        ),
+    ]
@@ -1,3 +1,7 @@
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from datetime import timedelta
+
 from django.db import models
 from django.utils import timezone
 
@@ -14,19 +18,50 @@ class Sync(models.Model):
         FAIL = -1
         INCOMPLETE = -2
 
+    PHASES = ("checkout", "parse", "db_write", "serialize", "commit")
+    """Sync phases with a corresponding `{phase}_time` duration field."""
+
     project = models.ForeignKey(Project, models.CASCADE)
     status = models.IntegerField(choices=Status.choices, default=Status.IN_PROGRESS)
     start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(default=None, blank=True, null=True)
     error = models.TextField(default="")
 
+    checkout_time = models.DurationField(default=None, blank=True, null=True)
+    parse_time = models.DurationField(default=None, blank=True, null=True)
+    db_write_time = models.DurationField(default=None, blank=True, null=True)
+    serialize_time = models.DurationField(default=None, blank=True, null=True)
+    commit_time = models.DurationField(default=None, blank=True, null=True)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Add the time spent in the context to the duration of the `name` phase.
+        Durations are stored when the sync is done or fails.
+        """
+        field = f"{name}_time"
+        start = timezone.now()
+        try:
+            yield
+        finally:
+            prev: timedelta | None = getattr(self, field)
+            setattr(self, field, (prev or timedelta()) + (timezone.now() - start))
+
     def done(self, status: Status = Status.DONE) -> None:
         self.status = status
         self.end_time = timezone.now()
-        self.save(update_fields=["status", "end_time"])
+        self.save(update_fields=["status", "end_time", *self.phase_fields()])
 
     def fail(self, error: str) -> None:
         self.status = Sync.Status.FAIL
         self.error = error
         self.end_time = timezone.now()
-        self.save(update_fields=["status", "error", "end_time"])
+        self.save(update_fields=["status", "error", "end_time", *self.phase_fields()])
+
+    def phase_fields(self) -> list[str]:
+        return [f"{name}_time" for name in Sync.PHASES]
+
+
+def sync_phase(sync: Sync | None, name: str) -> AbstractContextManager[None]:
+    """Time a sync phase, if the sync is being recorded."""
+    return sync.phase(name) if sync is not None else nullcontext()
@@ -47,7 +47,7 @@ def sync_project_task(
         )
     try:
         db_changed, repo_changed = sync_project(
-            project, pull=pull, commit=commit, force=force
+            project, pull=pull, commit=commit, force=force, sync=sync
         )
         if not db_changed and not repo_changed:
             status = Sync.Status.NO_CHANGES
@@ -4,8 +4,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from django.core.cache import cache
+
 from pontoon.base.models import Project, Repository
-from pontoon.sync.core.checkout import Checkout, checkout_repos
+from pontoon.sync.core.checkout import Checkout, checkout_repos, vcs_network_slot
 from pontoon.sync.tests.utils import FileTree, build_file_tree
 
 
@@ -155,3 +157,27 @@ def test_get_checkouts(_):
     result = checkout_repos(Mock(Project, repositories=one_target))
     assert result.source is not None
     assert result.source == result.target
+
+
+@patch("pontoon.sync.core.checkout.Checkout")
+def test_get_checkouts_concurrent(mock_checkout):
+    mock_checkout.side_effect = lambda slug, repo, **kwargs: repo
+    source = Mock(Repository, source_repo=True)
+    target = Mock(Repository, source_repo=False)
+    repos = Mock(**{"all.return_value": [target, source]})
+    result = checkout_repos(Mock(Project, slug="SLUG", repositories=repos))
+    assert result.source == source
+    assert result.target == target
+    assert mock_checkout.call_count == 2
+
+
+def test_vcs_network_slot(settings):
+    settings.SYNC_VCS_CONCURRENCY = 1
+    with vcs_network_slot("SLUG"):
+        assert not cache.add("sync_vcs_slot_0", "other")
+    assert cache.add("sync_vcs_slot_0", "other")
+    cache.delete("sync_vcs_slot_0")
+
+    settings.SYNC_VCS_CONCURRENCY = 0
+    with vcs_network_slot("SLUG"):
+        assert cache.get("sync_vcs_slot_0") is None
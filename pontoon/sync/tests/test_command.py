@@ -6,9 +6,14 @@ import pytest
 
 from django.core.management.base import CommandError
 
-from pontoon.base.models import Project
+from pontoon.base.models import ChangedEntityLocale, Project
 from pontoon.sync.management.commands import sync_projects
-from pontoon.test.factories import ProjectFactory
+from pontoon.test.factories import (
+    EntityFactory,
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+)
 
 
 @pytest.fixture
@@ -118,3 +123,28 @@ def test_options(command, mock_sync_project_task):
     mock_sync_project_task.delay.assert_called_with(
         project.pk, pull=False, commit=False, force=False
     )
+
+
+@pytest.mark.django_db
+def test_sync_order(command, mock_sync_project_task):
+    """
+    Higher priority projects are scheduled first,
+    then the ones with more pending changes.
+    """
+    locale = LocaleFactory.create()
+    low = ProjectFactory.create(priority=Project.Priority.LOW)
+    quiet, busy = ProjectFactory.create_batch(2, priority=Project.Priority.HIGH)
+    for project, count in ((low, 3), (busy, 2), (quiet, 1)):
+        resource = ResourceFactory.create(project=project)
+        ChangedEntityLocale.objects.bulk_create(
+            ChangedEntityLocale(entity=entity, locale=locale)
+            for entity in EntityFactory.create_batch(count, resource=resource)
+        )
+
+    execute_command(command, projects=f"{low.slug},{quiet.slug},{busy.slug}")
+
+    assert [call.args[0] for call in mock_sync_project_task.delay.call_args_list] == [
+        busy.pk,
+        quiet.pk,
+        low.pk,
+    ]
@@ -19,9 +19,11 @@ from pontoon.base.models import (
     Locale,
     ProjectLocale,
     Repository,
+    Resource,
     TranslatedResource,
     Translation,
 )
+from pontoon.sync.core.checkout import file_hash
 from pontoon.sync.models import Sync
 from pontoon.sync.tasks import sync_project_task
 from pontoon.sync.tests.test_checkouts import MockVersionControl
@@ -989,3 +991,88 @@ def test_locales_from_config():
             tr.locale.code: tr.total_strings
             for tr in TranslatedResource.objects.filter(resource__project=project)
         } == {"fr-Test": 1, "de-Test": 1}
+
+
+@pytest.mark.django_db
+def test_skip_unchanged_files():
+    with mock_setup() as (repo, locale):
+        project = ProjectFactory.create(
+            name="skip-unchanged", locales=[locale], repositories=[repo]
+        )
+
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {
+                "en-US": {"a.ftl": "key = Message\n"},
+                "de-Test": {"a.ftl": "key = Translation\n"},
+            },
+        )
+
+        # All files are considered changed in each sync
+        sync_project_task(project.pk)
+        assert Resource.objects.get(project=project).content_hash
+        assert TranslatedResource.objects.get(resource__project=project).content_hash
+
+        # Unchanged files are not parsed again
+        sync_project_task(project.pk)
+        sync = Sync.objects.filter(project=project).latest("start_time")
+        assert sync.status == Sync.Status.NO_CHANGES
+
+        # Changed files are parsed again
+        with open(join(repo.checkout_path, "de-Test", "a.ftl"), "w") as file:
+            file.write("key = New translation\n")
+        sync_project_task(project.pk)
+        translation = Translation.objects.get(
+            entity__resource__project=project, locale=locale, approved=True
+        )
+        assert translation.string == "key = New translation\n"
+
+        # Files written by sync store the hash of their new contents
+        TranslationFactory.create(
+            entity=translation.entity,
+            locale=locale,
+            string="key = Database translation\n",
+            approved=True,
+        )
+        sync_project_task(project.pk)
+        target_path = join(repo.checkout_path, "de-Test", "a.ftl")
+        with open(target_path) as file:
+            assert file.read() == "key = Database translation\n"
+        tr = TranslatedResource.objects.select_related("resource").get(
+            resource__project=project
+        )
+        assert tr.content_hash == file_hash(target_path, tr.resource.content_hash)
+
+
+@pytest.mark.django_db
+def test_parse_unchanged_target_with_changed_source():
+    with mock_setup() as (repo, locale):
+        project = ProjectFactory.create(
+            name="changed-source", locales=[locale], repositories=[repo]
+        )
+
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {
+                "en-US": {"a.ftl": "key = Message\n"},
+                "de-Test": {"a.ftl": "key = Translation\nnew-key = New translation\n"},
+            },
+        )
+
+        # The translation of a string missing from the source is not imported
+        sync_project_task(project.pk)
+        assert not Translation.objects.filter(
+            entity__resource__project=project, string__startswith="new-key"
+        ).exists()
+
+        # The unchanged target file is parsed again once the string is added
+        with open(join(repo.checkout_path, "en-US", "a.ftl"), "w") as file:
+            file.write("key = Message\nnew-key = New message\n")
+        sync_project_task(project.pk, force=True)
+        translation = Translation.objects.get(
+            entity__resource__project=project, entity__key=["new-key"], locale=locale
+        )
+        assert translation.string == "new-key = New translation\n"
+        assert translation.approved
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import factory
 import pytest
 
@@ -29,6 +31,21 @@ def test_sync_done():
     assert sync.error == ""
 
 
+@pytest.mark.django_db
+def test_sync_phases():
+    sync: Sync = SyncFactory.create()
+    with sync.phase("checkout"):
+        pass
+    with sync.phase("checkout"):
+        pass
+    sync.done()
+
+    sync.refresh_from_db()
+    assert sync.checkout_time >= timedelta()
+    assert sync.parse_time is None
+    assert sync.commit_time is None
+
+
 @pytest.mark.django_db
 def test_sync_smoke():
     test_start_time = timezone.now()
@@ -0,0 +1,95 @@
+import pytest
+
+from pontoon.base.models import Resource, TranslatedResource
+from pontoon.sync.core.stats import update_stats
+from pontoon.test.factories import (
+    EntityFactory,
+    LocaleFactory,
+    ProjectFactory,
+    ResourceFactory,
+    TranslatedResourceFactory,
+    TranslationFactory,
+)
+
+
+@pytest.fixture
+def stats_project():
+    locales = [LocaleFactory.create(code=code) for code in ("de-Test", "fr-Test")]
+    project = ProjectFactory.create(name="test-stats", locales=locales)
+    resources = [
+        ResourceFactory.create(project=project, path=path, format="gettext")
+        for path in ("a.po", "b.po")
+    ]
+    for resource in resources:
+        entity = EntityFactory.create(resource=resource, string="Hello")
+        for locale in locales:
+            TranslatedResourceFactory.create(resource=resource, locale=locale)
+            TranslationFactory.create(entity=entity, locale=locale, approved=True)
+
+    # Reset all stats, to find out which ones get recalculated
+    Resource.objects.filter(project=project).update(total_strings=0)
+    TranslatedResource.objects.filter(resource__project=project).update(
+        total_strings=0, approved_strings=0
+    )
+    return project, locales, resources
+
+
+def get_stats(project):
+    return {
+        (tr.locale.code, tr.resource.path): (tr.total_strings, tr.approved_strings)
+        for tr in TranslatedResource.objects.filter(resource__project=project)
+    }
+
+
+@pytest.mark.django_db
+def test_update_stats_all(stats_project):
+    project, _, _ = stats_project
+
+    update_stats(project)
+
+    assert get_stats(project) == {
+        ("de-Test", "a.po"): (1, 1),
+        ("de-Test", "b.po"): (1, 1),
+        ("fr-Test", "a.po"): (1, 1),
+        ("fr-Test", "b.po"): (1, 1),
+    }
+
+
+@pytest.mark.django_db
+def test_update_stats_translated_resources(stats_project):
+    project, locales, resources = stats_project
+    Resource.objects.filter(project=project).update(total_strings=1)
+
+    update_stats(project, translated_resources=[(locales[0].id, resources[0].id)])
+
+    assert get_stats(project) == {
+        ("de-Test", "a.po"): (1, 1),
+        ("de-Test", "b.po"): (0, 0),
+        ("fr-Test", "a.po"): (0, 0),
+        ("fr-Test", "b.po"): (0, 0),
+    }
+
+
+@pytest.mark.django_db
+def test_update_stats_resources(stats_project):
+    project, _, resources = stats_project
+
+    update_stats(project, resource_ids=[resources[1].id])
+
+    assert get_stats(project) == {
+        ("de-Test", "a.po"): (0, 0),
+        ("de-Test", "b.po"): (1, 1),
+        ("fr-Test", "a.po"): (0, 0),
+        ("fr-Test", "b.po"): (1, 1),
+    }
+    assert dict(
+        Resource.objects.filter(project=project).values_list("path", "total_strings")
+    ) == {"a.po": 0, "b.po": 1}
+
+
+@pytest.mark.django_db
+def test_update_stats_nothing_changed(stats_project, django_assert_num_queries):
+    project, _, _ = stats_project
+
+    with django_assert_num_queries(0):
+        update_stats(project, resource_ids=[], translated_resources=[])
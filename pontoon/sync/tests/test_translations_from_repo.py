@@ -3,17 +3,21 @@ from os.path import join
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 from typing import Any, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from moz.l10n.model import PatternMessage
+
 from django.conf import settings
 from django.utils import timezone
 
 from pontoon.actionlog.models import ActionLog
 from pontoon.base.models import (
     ChangedEntityLocale,
+    ContributionCount,
     Entity,
+    EntityLocaleStatus,
     TranslatedResource,
     Translation,
     TranslationMemoryEntry,
@@ -21,7 +25,12 @@ from pontoon.base.models import (
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import find_paths
 from pontoon.sync.core.stats import update_stats
-from pontoon.sync.core.translations_from_repo import sync_translations_from_repo
+from pontoon.sync.core.translations_from_repo import (
+    iter_keyset,
+    sync_translations_from_repo,
+    write_db_updates,
+)
+from pontoon.sync.formats import RepoTranslation
 from pontoon.sync.tests.utils import build_file_tree
 from pontoon.test.factories import (
     EntityFactory,
@@ -409,6 +418,9 @@ def test_remove_po_target_resource():
         assert (removed_resources, updated_translations) == (1, 0)
         assert not TranslatedResource.objects.filter(locale=locale, resource=res["b"])
         assert not Translation.objects.filter(entity__resource=res["b"], locale=locale)
+        assert not EntityLocaleStatus.objects.filter(
+            entity__resource=res["b"], locale=locale
+        )
         tm = TranslationMemoryEntry.objects.filter(
             entity__resource=res["b"], translation__isnull=True
         )
@@ -418,3 +430,116 @@ def test_remove_po_target_resource():
         update_stats(project)
         project.refresh_from_db()
         assert (project.total_strings, project.approved_strings) == (6, 6)
+
+
+@pytest.mark.django_db
+def test_write_db_updates_in_batches():
+    """
+    Updates are written after each batch of changed resources.
+    """
+    with TemporaryDirectory() as root:
+        # Database setup
+        settings.MEDIA_ROOT = root
+        locale = LocaleFactory.create(code="fr-Test")
+        locale_map = {locale.code: locale}
+        repo = RepositoryFactory(url="http://example.com/repo")
+        project = ProjectFactory.create(
+            name="test-batches", locales=[locale], repositories=[repo]
+        )
+        for id in ["a", "b", "c"]:
+            res = ResourceFactory.create(
+                project=project, path=f"{id}.ftl", format="fluent", total_strings=1
+            )
+            TranslatedResourceFactory.create(locale=locale, resource=res)
+            EntityFactory.create(
+                resource=res, string=f"key-{id} = Message {id}\n", key=[f"key-{id}"]
+            )
+
+        # Filesystem setup
+        makedirs(repo.checkout_path)
+        build_file_tree(
+            repo.checkout_path,
+            {
+                "en-US": {"a.ftl": "", "b.ftl": "", "c.ftl": ""},
+                "fr-Test": {
+                    f"{id}.ftl": f"key-{id} = Translation {id}\n"
+                    for id in ["a", "b", "c"]
+                },
+            },
+        )
+
+        # Paths setup
+        mock_checkout = Mock(
+            Checkout,
+            path=repo.checkout_path,
+            changed=[join("fr-Test", f"{id}.ftl") for id in ["a", "b", "c"]],
+            removed=[],
+        )
+        checkouts = Checkouts(mock_checkout, mock_checkout)
+        paths = find_paths(project, checkouts)
+
+        # Test sync
+        module = "pontoon.sync.core.translations_from_repo"
+        with (
+            patch(f"{module}.UPDATES_BATCH_SIZE", 2),
+            patch(f"{module}.write_db_updates", wraps=write_db_updates) as write,
+        ):
+            removed_resources, updated_translations = sync_translations_from_repo(
+                project, locale_map, checkouts, paths, cast(Any, []), now
+            )
+        assert (removed_resources, updated_translations) == (0, 3)
+        assert write.call_count == 2
+        assert set(
+            Translation.objects.filter(
+                entity__resource__project=project, approved=True
+            ).values_list("string", flat=True)
+        ) == {f"key-{id} = Translation {id}\n" for id in ["a", "b", "c"]}
+
+
+@pytest.mark.django_db
+def test_write_db_updates_approve_suggestion(project_a, locale_a, entity_a, user_a):
+    """
+    Suggestions approved by sync update the status of their entity
+    and the contribution counts of their user.
+    """
+    suggestion = TranslationFactory.create(
+        entity=entity_a, locale=locale_a, user=user_a, string="Translation"
+    )
+    assert EntityLocaleStatus.objects.get(entity=entity_a, locale=locale_a).missing
+
+    updates = {
+        (entity_a.pk, locale_a.pk): RepoTranslation(
+            tuple(entity_a.key), "Translation", PatternMessage(["Translation"])
+        )
+    }
+    write_db_updates(project_a, updates, None, now)
+
+    suggestion.refresh_from_db()
+    assert suggestion.approved
+    status = EntityLocaleStatus.objects.get(entity=entity_a, locale=locale_a)
+    assert status.approved
+    assert not status.has_unreviewed
+    assert ContributionCount.objects.filter(user=user_a).values_list(
+        "total", "approved", "unreviewed"
+    ).get() == (1, 1, 0)
+
+
+@pytest.mark.django_db
+def test_iter_keyset():
+    locale = LocaleFactory.create(code="de-Test")
+    project = ProjectFactory.create(name="test-keyset", locales=[locale])
+    res = ResourceFactory.create(project=project, path="a.po", format="gettext")
+    translations = [
+        TranslationFactory.create(
+            entity=EntityFactory.create(resource=res, string=f"Source {i}"),
+            locale=locale,
+            string=f"Translation {i}",
+        )
+        for i in range(7)
+    ]
+
+    query = Translation.objects.filter(entity__resource=res).values("id", "string")
+    for chunk_size in (1, 3, 7, 10):
+        assert [row["id"] for row in iter_keyset(query, chunk_size)] == [
+            tx.id for tx in translations
+        ]
@@ -7,13 +7,24 @@ from unittest.mock import Mock
 
 import pytest
 
+from moz.l10n.formats import Format
+from moz.l10n.model import Entry
+from moz.l10n.resource import parse_resource, serialize_resource
+
 from django.conf import settings
 from django.utils import timezone
 
 from pontoon.base.models import ChangedEntityLocale
 from pontoon.sync.core.checkout import Checkout, Checkouts
 from pontoon.sync.core.paths import find_paths
-from pontoon.sync.core.translations_to_repo import sync_translations_to_repo
+from pontoon.sync.core.translations_to_repo import (
+    TargetTranslation,
+    TargetWrite,
+    run_target_writes,
+    set_translations,
+    sync_translations_to_repo,
+    target_write_pool,
+)
 from pontoon.sync.tests.utils import build_file_tree
 from pontoon.test.factories import (
     EntityFactory,
@@ -369,3 +380,103 @@ def test_directory_creation_on_translation_update():
         assert exists(target_path), (
             "Expected translated file to be created in nested directories."
         )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_target_writes(workers, settings):
+    settings.SYNC_WRITE_WORKERS = workers
+    ref_res = parse_resource(Format.fluent, "key-a = Source A\nkey-b = Source B\n")
+    locales = [LocaleFactory.build(code=code) for code in ("de-Test", "fr-Test")]
+
+    with TemporaryDirectory() as root:
+        writes = [
+            (
+                locale,
+                TargetWrite(
+                    join(root, locale.code, "a.ftl"),
+                    locale,
+                    [TargetTranslation(("key-a",), f"key-a = {locale.code}\n", False)],
+                ),
+            )
+            for locale in locales
+        ]
+        with target_write_pool() as pool:
+            results = {
+                locale.code: error
+                for locale, error in run_target_writes(ref_res, writes, pool)
+            }
+
+        assert results == {"de-Test": None, "fr-Test": None}
+        for locale in locales:
+            with open(join(root, locale.code, "a.ftl")) as file:
+                assert file.read() == f"key-a = {locale.code}\n"
+
+    # The reference resource is not modified
+    assert any(
+        entry.id == ("key-b",)
+        for section in ref_res.sections
+        for entry in section.entries
+    )
+
+
+LARGE_RESOURCE_SIZE = 5000
+
+large_resources = {
+    Format.android: lambda n: (
+        '<?xml version="1.0" encoding="utf-8"?>\n<resources>\n'
+        + "".join(f'  <string name="key_{i}">Source {i}</string>\n' for i in range(n))
+        + "</resources>\n"
+    ),
+    Format.fluent: lambda n: "".join(f"key-{i} = Source {i}\n" for i in range(n)),
+    Format.gettext: lambda n: "".join(
+        f'msgid "Source {i}"\nmsgstr ""\n\n' for i in range(n)
+    ),
+    Format.properties: lambda n: "".join(f"key-{i} = Source {i}\n" for i in range(n)),
+}
+
+
+class IterCountingList(list):
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+@pytest.mark.parametrize("format", large_resources)
+def test_set_translations_large_resource(format):
+    res = parse_resource(format, large_resources[format](LARGE_RESOURCE_SIZE))
+    keys = [
+        section.id + entry.id
+        for section in res.sections
+        for entry in section.entries
+        if isinstance(entry, Entry)
+    ]
+    assert len(keys) == LARGE_RESOURCE_SIZE
+
+    # Leave every other entry untranslated
+    translations = IterCountingList(
+        TargetTranslation(
+            key,
+            f"{key[-1]} = Translated {i}\n"
+            if format == Format.fluent
+            else f"Translated {i}",
+            False,
+        )
+        for i, key in enumerate(keys)
+        if i % 2 == 0
+    )
+    set_translations(LocaleFactory.build(code="de-Test"), translations, res)
+
+    # Entries are matched by key, not by scanning the translations for each entry
+    assert translations.iterations == 1
+
+    output = "".join(serialize_resource(res))
+    last = LARGE_RESOURCE_SIZE - 2
+    assert f"Translated {last}" in output
+    if format != Format.gettext:
+        assert sum(
+            isinstance(entry, Entry)
+            for section in res.sections
+            for entry in section.entries
+        ) == len(translations)
@@ -14,7 +14,6 @@ from pontoon.base.models.repository import Repository
 from pontoon.messaging.notifications import send_badge_notification
 from pontoon.sync.core.checkout import checkout_repos
 from pontoon.sync.core.paths import UploadPaths, find_paths
-from pontoon.sync.core.stats import update_stats
 from pontoon.sync.core.translations_from_repo import find_db_updates, write_db_updates
 from pontoon.sync.core.translations_to_repo import update_changed_resources
 
@@ -99,7 +98,6 @@ def import_uploaded_file(
         translation_before_level = badges_translation_level(user)
         review_before_level = badges_review_level(user)
         write_db_updates(project, updates, user, now)
-        update_stats(project)
         ChangedEntityLocale.objects.bulk_create(
             (
                 ChangedEntityLocale(entity_id=entity_id, locale_id=locale_id, when=now)
@@ -1,5 +1,9 @@
 import re
 
+from threading import Lock
+from uuid import uuid4
+
+from django.core.cache import cache
 from django.db import models
 
 from pontoon.base.models import Entity, Resource, TranslatedResource
@@ -21,18 +25,136 @@ def update_terminology_project_stats():
     TranslatedResource.objects.filter(resource=resource).calculate_stats()
 
 
-class TermQuerySet(models.QuerySet["Term"]):
-    def for_string(self, string):
-        terms = []
-        available_terms = self.exclude(definition="").exclude(forbidden=True)
+TERM_MATCHER_VERSION_KEY = "terminology_matcher_version"
+
+# Marks the end of a term in a TermMatcher trie
+TERM_END = ""
 
-        for term in available_terms:
-            term_text = r"\b" + re.escape(term.text)
-            flags = 0 if term.case_sensitive else re.IGNORECASE
 
-            if re.search(term_text, string, flags):
-                terms.append(term)
+def invalidate_term_matcher():
+    """
+    Make all processes rebuild their TermMatcher on next use.
+    """
+    cache.set(TERM_MATCHER_VERSION_KEY, uuid4().hex, None)
 
+
+class TermMatcher:
+    """
+    Process-wide index of available terms and their translations.
+
+    Terms are stored in two tries, one for case-sensitive and one for
+    case-insensitive terms, so finding all terms in a string only walks the
+    tries from each word boundary, instead of running a regular expression
+    search per term.
+
+    The index is rebuilt when the version stored in the cache changes, which
+    happens whenever a Term or a TermTranslation is saved or deleted.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.clear()
+
+    def clear(self):
+        self.version: str | None = None
+        self.terms: dict[int, Term] = {}
+        self.case_sensitive: dict = {}
+        self.case_insensitive: dict = {}
+        self.translations: dict[int, dict[int, str]] = {}
+
+    def refresh(self):
+        version = cache.get(TERM_MATCHER_VERSION_KEY)
+        if version is None:
+            cache.add(TERM_MATCHER_VERSION_KEY, uuid4().hex, None)
+            version = cache.get(TERM_MATCHER_VERSION_KEY)
+        if version == self.version:
+            return
+
+        with self.lock:
+            if version == self.version:
+                return
+            terms: dict[int, Term] = {}
+            case_sensitive: dict = {}
+            case_insensitive: dict = {}
+            for term in Term.objects.exclude(definition="").exclude(forbidden=True):
+                terms[term.pk] = term
+                if term.case_sensitive:
+                    node = case_sensitive
+                    text = term.text
+                else:
+                    node = case_insensitive
+                    text = "".join(char.lower() for char in term.text)
+                for char in text:
+                    node = node.setdefault(char, {})
+                node.setdefault(TERM_END, []).append(term.pk)
+
+            self.terms = terms
+            self.case_sensitive = case_sensitive
+            self.case_insensitive = case_insensitive
+            self.translations = {}
+            self.version = version
+
+    def match(self, string: str) -> list["Term"]:
+        """
+        Find terms that start at a word boundary in the string.
+        """
+        self.refresh()
+        found: set[int] = set()
+        for boundary in re.finditer(r"\b", string):
+            start = boundary.start()
+            for trie, fold in (
+                (self.case_sensitive, False),
+                (self.case_insensitive, True),
+            ):
+                node = trie
+                for i in range(start, len(string)):
+                    char = string[i]
+                    # Lowercasing may turn one character into more than one
+                    for key in char.lower() if fold else char:
+                        node = node.get(key)
+                        if node is None:
+                            break
+                    if node is None:
+                        break
+                    found.update(node.get(TERM_END, ()))
+        return [self.terms[pk] for pk in sorted(found)]
+
+    def translation(self, term: "Term", locale) -> str | None:
+        """
+        Get locale translation of the term, loading all term translations
+        of the locale in a single query on first use.
+        """
+        self.refresh()
+        translations = self.translations.get(locale.pk)
+        if translations is None:
+            translations = dict(
+                TermTranslation.objects.filter(locale=locale).values_list(
+                    "term_id", "text"
+                )
+            )
+            self.translations[locale.pk] = translations
+        return translations.get(term.pk)
+
+
+term_matcher = TermMatcher()
+
+
+class TermQuerySet(models.QuerySet["Term"]):
+    def for_string(self, string):
+        """
+        Find available terms in the given string, using the process-wide
+        TermMatcher.
+
+        If the queryset is filtered, only the matching terms in it are returned.
+        """
+        terms = term_matcher.match(string)
+        if terms and self.query.has_filters():
+            pks = set(
+                self.filter(pk__in=[term.pk for term in terms]).values_list(
+                    "pk", flat=True
+                )
+            )
+            terms = [term for term in terms if term.pk in pks]
         return terms
 
     def delete(self, *args, **kwargs):
@@ -92,10 +214,7 @@ class Term(models.Model):
         if self.do_not_translate:
             return self.text
         else:
-            try:
-                return self.translations.get(locale=locale).text
-            except (AttributeError, TermTranslation.DoesNotExist):
-                return None
+            return term_matcher.translation(self, locale)
 
     @property
     def localizable(self):
@@ -146,6 +265,7 @@ class Term(models.Model):
 
         # Using update() to avoid circular Term.save() call
         Term.objects.filter(pk=self.pk).update(entity_id=entity.id)
+        invalidate_term_matcher()
         entity.term = self
 
         if not created:
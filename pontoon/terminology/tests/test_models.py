@@ -72,6 +72,61 @@ def test_terms_for_string(string, found_terms, available_terms):
         assert term.text == found_terms[i]
 
 
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_overlapping(_):
+    """
+    Terms sharing a prefix or overlapping in the string are all found.
+    """
+    TermFactory.create(text="student")
+    TermFactory.create(text="student ambassador")
+    TermFactory.create(text="ambassador")
+
+    terms = Term.objects.for_string("Join us as a Student ambassador")
+    assert [term.text for term in terms] == [
+        "student",
+        "student ambassador",
+        "ambassador",
+    ]
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_filtered(_):
+    """
+    Only terms in a filtered queryset are found.
+    """
+    TermFactory.create(text="student", part_of_speech="noun")
+    TermFactory.create(text="ambassador", part_of_speech="verb")
+
+    terms = Term.objects.filter(part_of_speech="noun").for_string(
+        "Join us as a Student ambassador"
+    )
+    assert [term.text for term in terms] == ["student"]
+
+
+@pytest.mark.django_db
+@patch("pontoon.terminology.models.update_terminology_project_stats")
+def test_terms_for_string_cached(_, locale_a, django_assert_num_queries):
+    """
+    Terms and their translations are loaded once, and reloaded on changes.
+    """
+    term = TermFactory.create(text="track")
+    TermTranslationFactory.create(term=term, locale=locale_a, text="translation")
+
+    with django_assert_num_queries(2):
+        terms = Term.objects.for_string("Tracks")
+        assert terms[0].translation(locale_a) == "translation"
+
+    with django_assert_num_queries(0):
+        terms = Term.objects.for_string("Tracks")
+        assert terms[0].translation(locale_a) == "translation"
+
+    term.forbidden = True
+    term.save()
+    assert Term.objects.for_string("Tracks") == []
+
+
 @pytest.mark.django_db
 @patch("pontoon.terminology.models.update_terminology_project_stats")
 def test_term_translation(_, locale_a):
@@ -2,9 +2,25 @@ import pytest
 
 from pontoon.base.models import UserProfile
 from pontoon.base.user_utils import get_system_user
+from pontoon.terminology.models import term_matcher
 from pontoon.test import factories
 
 
+@pytest.fixture(autouse=True)
+def clear_term_matcher():
+    """The database is rolled back after each test, so start with a fresh index."""
+    term_matcher.clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_stats_cache(settings):
+    """
+    The database is rolled back after each test without running commit callbacks,
+    so the stats cache would not be invalidated.
+    """
+    settings.STATS_CACHE_TIMEOUT = 0
+
+
 @pytest.fixture
 def admin():
     """Admin - a superuser"""
@@ -1,8 +1,10 @@
 from json import dumps
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from pontoon.actionlog.models import ActionLog
@@ -181,7 +183,11 @@ def test_create_translation_force_suggestions(
 
 @pytest.mark.django_db
 def test_create_translation_logs_implicit_approval(
-    project_locale_a, translation_a, locale_a, member
+    project_locale_a,
+    translation_a,
+    locale_a,
+    member,
+    django_capture_on_commit_callbacks,
 ):
     """
     A translation submitted directly as approved (self-approval) stores both a
@@ -189,12 +195,14 @@ def test_create_translation_logs_implicit_approval(
     """
     translation_a.locale.translators_group.user_set.add(member.user)
 
-    response = request_create_translation(
-        member.client,
-        entity=translation_a.entity.pk,
-        locale=locale_a.code,
-        value=["approved 0"],
-    )
+    # Actions are saved once the transaction of the request is committed
+    with django_capture_on_commit_callbacks(execute=True):
+        response = request_create_translation(
+            member.client,
+            entity=translation_a.entity.pk,
+            locale=locale_a.code,
+            value=["approved 0"],
+        )
     assert response.status_code == 200
 
     translation = Translation.objects.last()
@@ -219,7 +227,11 @@ def test_create_translation_logs_implicit_approval(
 
 @pytest.mark.django_db
 def test_create_suggestion_does_not_log_approval(
-    project_locale_a, translation_a, locale_a, member
+    project_locale_a,
+    translation_a,
+    locale_a,
+    member,
+    django_capture_on_commit_callbacks,
 ):
     """
     A translation submitted as a suggestion only stores a `translation:created`
@@ -227,13 +239,14 @@ def test_create_suggestion_does_not_log_approval(
     """
     translation_a.locale.translators_group.user_set.add(member.user)
 
-    response = request_create_translation(
-        member.client,
-        entity=translation_a.entity.pk,
-        locale=locale_a.code,
-        value=["suggestion 0"],
-        force_suggestions="true",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        response = request_create_translation(
+            member.client,
+            entity=translation_a.entity.pk,
+            locale=locale_a.code,
+            value=["suggestion 0"],
+            force_suggestions="true",
+        )
     assert response.status_code == 200
 
     translation = Translation.objects.last()
@@ -250,6 +263,42 @@ def test_create_suggestion_does_not_log_approval(
     )
 
 
+@pytest.mark.django_db
+def test_create_translation_action_log_queries(
+    project_locale_a,
+    translation_a,
+    locale_a,
+    member,
+    django_capture_on_commit_callbacks,
+):
+    """
+    All actions of a translation submission are saved with a single query.
+    """
+    translation_a.locale.translators_group.user_set.add(member.user)
+
+    with (
+        CaptureQueriesContext(connection) as queries,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        response = request_create_translation(
+            member.client,
+            entity=translation_a.entity.pk,
+            locale=locale_a.code,
+            value=["approved 0"],
+        )
+    assert response.status_code == 200
+
+    assert [
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith('INSERT INTO "actionlog_actionlog"')
+    ] == [ANY]
+    assert ActionLog.objects.filter(translation=translation_a).get().action_type == (
+        ActionLog.ActionType.TRANSLATION_REJECTED
+    )
+    assert ActionLog.objects.exclude(translation=translation_a).count() == 2
+
+
 @pytest.fixture
 def properties_resource(resource_a):
     """
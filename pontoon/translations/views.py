@@ -16,7 +16,7 @@ from django.utils.datastructures import MultiValueDictKeyError
 from django.views.decorators.http import require_POST
 
 from pontoon.actionlog.models import ActionLog
-from pontoon.actionlog.utils import log_action
+from pontoon.actionlog.utils import atomic_with_actions, log_action
 from pontoon.base import utils
 from pontoon.base.badge_utils import badges_review_count, badges_translation_count
 from pontoon.base.models import (
@@ -26,6 +26,11 @@ from pontoon.base.models import (
     TranslatedResource,
     Translation,
 )
+from pontoon.base.models.contribution_count import (
+    adjust_contribution_counts,
+    count_contributions,
+)
+from pontoon.base.models.entity_status import update_entity_statuses
 from pontoon.base.services import readonly_exists
 from pontoon.base.user_utils import can_translate
 from pontoon.checks.libraries import run_checks
@@ -68,7 +73,7 @@ def _contains_null_char(x) -> bool:
 @require_POST
 @utils.require_AJAX
 @login_required(redirect_field_name="", login_url="/403")
-@transaction.atomic
+@atomic_with_actions
 def create_translation(request):
     """
     Create a new translation.
@@ -268,7 +273,11 @@ def delete_translation(request):
             status=403,
         )
 
+    pairs = [(entity.pk, locale.pk)]
+    contributions_before = count_contributions(pairs)
     translation.delete()
+    update_entity_statuses(pairs)
+    adjust_contribution_counts(contributions_before, count_contributions(pairs))
 
     log_action(
         ActionLog.ActionType.TRANSLATION_DELETED,
@@ -282,7 +291,7 @@ def delete_translation(request):
 
 @utils.require_AJAX
 @login_required(redirect_field_name="", login_url="/403")
-@transaction.atomic
+@atomic_with_actions
 def approve_translation(request):
     """Approve given translation."""
     try:
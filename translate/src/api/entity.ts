@@ -92,6 +92,7 @@ type EntitiesResponse =
   | {
       entities: Entity[];
       has_next?: boolean;
+      next_cursor?: string | null;
       stats: APIStats;
       requested_entity?: RequestedEntityLocation;
     }
@@ -107,15 +108,16 @@ export async function fetchEntities(
 ): Promise<{ entities: Entity[]; stats: APIStats }>;
 export async function fetchEntities(
   location: Location,
-  page: number,
+  cursor: string,
 ): Promise<EntitiesResponse>;
 export async function fetchEntities(
   location: Location,
-  page?: number,
+  cursor?: string,
 ): Promise<EntitiesResponse> {
   const payload = buildFetchPayload(location);
-  if (page) {
-    payload.append('page', String(page));
+  if (cursor !== undefined) {
+    // An empty cursor requests the first page.
+    payload.append('cursor', cursor);
   }
   return await POST('/get-entities/', payload);
 }
@@ -26,6 +26,7 @@ type ReceiveAction = {
   type: typeof RECEIVE_ENTITIES;
   entities: Entity[];
   hasMore: boolean;
+  nextCursor?: string | null;
   requestedEntityLocation: RequestedEntityLocation | null;
 };
 
@@ -63,16 +64,17 @@ export const updateEntityTranslation = (
 
 /** Fetch entities and their translation.  */
 export const getEntities =
-  (location: Location, page: number) => async (dispatch: AppDispatch) => {
+  (location: Location, cursor: string) => async (dispatch: AppDispatch) => {
     dispatch({ type: REQUEST_ENTITIES });
 
-    const content = await fetchEntities(location, page);
+    const content = await fetchEntities(location, cursor);
 
     if (content.entities) {
       dispatch({
         type: RECEIVE_ENTITIES,
         entities: content.entities,
         hasMore: content.has_next,
+        nextCursor: content.next_cursor,
         requestedEntityLocation: content.requested_entity ?? null,
       });
       dispatch(updateStats(content.stats));
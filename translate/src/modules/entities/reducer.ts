@@ -23,7 +23,8 @@ type EntitiesState = {
   readonly fetching: boolean;
   readonly fetchCount: number;
   readonly hasMore: boolean;
-  readonly page: number;
+  /** Cursor of the next page of entities, or empty for the first page. */
+  readonly cursor: string;
   readonly requestedEntityLocation: RequestedEntityLocation | null;
 };
 
@@ -80,7 +81,7 @@ const initial: EntitiesState = {
   fetching: false,
   fetchCount: 0,
   hasMore: true,
-  page: 1,
+  cursor: '',
   requestedEntityLocation: null,
 };
 
@@ -96,7 +97,7 @@ export function reducer(
         fetching: false,
         fetchCount: state.fetchCount + 1,
         hasMore: action.hasMore,
-        page: state.page + 1,
+        cursor: action.nextCursor ?? '',
         requestedEntityLocation:
           action.requestedEntityLocation ?? state.requestedEntityLocation,
       };
@@ -112,7 +113,7 @@ export function reducer(
         entities: [],
         fetching: false,
         hasMore: true,
-        page: 1,
+        cursor: '',
         requestedEntityLocation: null,
       };
     case UPDATE_ENTITIES:
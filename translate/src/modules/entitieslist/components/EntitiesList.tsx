@@ -97,7 +97,7 @@ export function EntitiesList(): React.ReactElement<'div'> {
     fetchCount,
     fetching,
     hasMore,
-    page,
+    cursor,
     requestedEntityLocation,
   } = useEntities();
   const location = useContext(Location);
@@ -312,9 +312,9 @@ export function EntitiesList(): React.ReactElement<'div'> {
   const getMoreEntities = useCallback(() => {
     if (!fetching) {
       // Currently shown entities should be excluded from the next results.
-      dispatch(getEntities(location, page));
+      dispatch(getEntities(location, cursor));
     }
-  }, [dispatch, entities, fetching, location, page]);
+  }, [dispatch, entities, fetching, location, cursor]);
 
   // Must be after other useEffect() calls, as they are run in order during mount
   useEffect(() => {